@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends
 from app.middleware.admin_auth import get_admin_user
 from app.services import admin_dashboard_service
 from app.api.admin.schemas import AdminDashboardStats
+from app.api.responses import NegotiatedResponse, NegotiatedRoute
 
-router = APIRouter(tags=["admin"])
+router = APIRouter(tags=["admin"], route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 
 @router.get("/dashboard/stats", response_model=AdminDashboardStats)
 async def get_admin_dashboard_stats(
@@ -9,8 +9,9 @@ from app.api.admin.schemas import (
 )
 
 from app.services.report_service import parse_location
+from app.api.responses import NegotiatedResponse, NegotiatedRoute
 
-router = APIRouter(tags=["admin"])
+router = APIRouter(tags=["admin"], route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 
 @router.get("/reports", response_model=List[ReportManagementResponse])
 async def get_reports_for_management(
@@ -30,11 +31,6 @@ async def get_reports_for_management(
         profile_data = report.get("profiles", [])
         user_nickname = profile_data[0].get("nickname", "알 수 없음") if profile_data else "알 수 없음"
         
-        votes_data = report.get("vote_count", [])
-        comments_data = report.get("comment_count", [])
-        vote_count = len(votes_data) if isinstance(votes_data, list) else 0
-        comment_count = len(comments_data) if isinstance(comments_data, list) else 0
-
         reports.append(ReportManagementResponse(
             id=report.get("id"),
             title=report.get("title", ""),
@@ -46,8 +42,8 @@ async def get_reports_for_management(
             user_email=user_data.get("email", ""),
             address=report.get("address"),
             image_url=report.get("image_url"),
-            vote_count=vote_count,
-            comment_count=comment_count,
+            vote_count=report.get("vote_count") or 0,
+            comment_count=report.get("comment_count") or 0,
             created_at=report.get("created_at"),
             updated_at=report.get("updated_at"),
             admin_comment=report.get("admin_comment"),
@@ -5,8 +5,9 @@ from app.core.security import get_current_user
 from app.middleware.admin_auth import get_admin_user
 from app.services import admin_log_service, admin_user_service
 from app.api.admin.schemas import AdminActivityResponse
+from app.api.responses import NegotiatedResponse, NegotiatedRoute
 
-router = APIRouter(tags=["admin"])
+router = APIRouter(tags=["admin"], route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 
 @router.get("/activity-logs", response_model=List[AdminActivityResponse])
 async def get_admin_activity_logs(
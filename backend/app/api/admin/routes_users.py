@@ -4,8 +4,9 @@ import uuid
 from app.middleware.admin_auth import get_admin_user, get_super_admin_user
 from app.services import admin_user_service
 from app.api.admin.schemas import UserManagementResponse, UserRoleUpdate, BulkUserAction
+from app.api.responses import NegotiatedResponse, NegotiatedRoute
 
-router = APIRouter(tags=["admin"])
+router = APIRouter(tags=["admin"], route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 
 @router.get("/users", response_model=List[UserManagementResponse])
 async def get_users_for_management(
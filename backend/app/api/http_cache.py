@@ -0,0 +1,72 @@
+"""익명 지도 조회의 HTTP 캐시 검증자와 URL 정규화.
+
+ETag는 응답 본문 바이트의 해시다. 본문이 같으면 ETag도 같으므로 `max-age`가 지난 뒤의
+재검증(`If-None-Match`)도, 다른 워커·재시작한 프로세스가 받은 재검증도 내용이 그대로면 본문 없이
+304로 끝난다. 표현(JSON/MessagePack)이 다르면 바이트가 다르니 ETag도 다르다. 투표·댓글 수처럼
+캐시를 무효화하지 않는 변화는 서버 캐시 TTL이 지나 본문이 바뀔 때 새 ETag로 드러난다.
+
+304를 정하려면 본문이 있어야 하므로 조회(대개 서버 캐시 히트)는 그대로 하고, 아끼는 것은
+전송 바이트와 클라이언트의 디코딩이다.
+
+정규화는 영역 조회 경계를 고정 줌의 타일 격자(`app.services.bounds_tiles`)로 바깥쪽으로 맞춘
+URL로 보내, 한두 픽셀 다른 뷰포트가 같은 URL(같은 CDN 항목)을 쓰게 한다.
+"""
+import hashlib
+from typing import Dict, Optional, Union
+
+from fastapi import Request, Response
+
+from app.services.bounds_tiles import align_to_tiles
+
+# 이보다 작은 차이는 정규 경계와 같은 값으로 본다 (쿼리 문자열 왕복 오차).
+_CANONICAL_TOLERANCE_DEGREES = 1e-9
+
+
+def body_etag(body: Union[bytes, memoryview]) -> str:
+    return f'W/"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+def cache_headers(etag: str, max_age: int) -> Dict[str, str]:
+    return {"etag": etag, "cache-control": f"public, max-age={max_age}", "vary": "Accept"}
+
+
+def matches_if_none_match(request: Request, etag: str) -> bool:
+    """If-None-Match가 etag(약한 비교) 또는 `*`를 담으면 참."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def with_validator(request: Request, response: Response, max_age: int) -> Response:
+    """응답에 본문 ETag·Cache-Control을 달고, If-None-Match가 맞으면 304로 바꾼다."""
+    headers = cache_headers(body_etag(response.body), max_age)
+    if matches_if_none_match(request, headers["etag"]):
+        return not_modified(headers)
+    response.headers.update(headers)
+    return response
+
+
+def canonical_bounds_url(
+    request: Request,
+    north: float,
+    south: float,
+    east: float,
+    west: float,
+    zoom: int,
+) -> Optional[str]:
+    """경계를 타일 격자에 맞춘 URL. 이미 정규 경계이면 None."""
+    snapped = dict(zip(("north", "south", "east", "west"), align_to_tiles(north, south, east, west, zoom)))
+    requested = {"north": north, "south": south, "east": east, "west": west}
+    if all(abs(requested[name] - value) < _CANONICAL_TOLERANCE_DEGREES for name, value in snapped.items()):
+        return None
+    return str(request.url.include_query_params(**{name: repr(value) for name, value in snapped.items()}))
@@ -0,0 +1,147 @@
+"""응답 인코딩 계층 — report·comment·admin 라우터 공용.
+
+FastAPI 기본 JSONResponse(json.dumps) 대신 orjson으로 본문을 만들고, 클라이언트가
+`Accept: application/msgpack`을 보내면 같은 내용을 MessagePack으로 인코딩한다.
+response_model 검증·직렬화는 그대로 FastAPI가 하고, 여기서는 마지막 바이트 인코딩만 바꾼다.
+제보 목록 라우트는 `Accept: application/x-ndjson`이면 항목을 한 줄씩 스트리밍한다(ndjson_response).
+
+Response.render()는 요청을 모르므로 NegotiatedRoute가 핸들러 실행 동안 협상 결과를
+ContextVar에 둔다. 두 클래스는 함께 써야 한다:
+
+    router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
+"""
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, Mapping, Optional, Type, cast
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.utils.page_body import item_fields, page_content
+
+logger = get_logger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """Accept 헤더가 MessagePack을 JSON보다 낮지 않은 q로 허용하면 참."""
+    msgpack_q = json_q = 0.0
+    for part in accept.split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        media_type = media_type.lower()
+        if media_type in _MSGPACK_ALIASES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class NegotiatedResponse(Response):
+    """orjson JSON 본문, 협상된 요청이면 MessagePack 본문. 두 표현이 같은 URL을 공유하므로 Vary: Accept."""
+
+    media_type = JSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        content: Any = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        super().__init__(content, status_code, {**(headers or {}), "vary": "Accept"}, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if _wants_msgpack.get():
+            self.media_type = MSGPACK_MEDIA_TYPE
+            # packb는 항상 bytes다. 타입의 None은 autoreset=False인 Packer.pack 몫이다.
+            return cast(bytes, msgpack.packb(content, use_bin_type=True))
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def wants_msgpack(request: Request) -> bool:
+    return prefers_msgpack(request.headers.get("accept", ""))
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Accept 헤더가 NDJSON 스트리밍을 명시적으로 요청하면 참 (q=0 제외)."""
+    for part in request.headers.get("accept", "").split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        if media_type.lower() == NDJSON_MEDIA_TYPE:
+            return not any(p.replace(" ", "") in ("q=0", "q=0.0") for p in params)
+    return False
+
+
+def encoded_json_response(body: bytes, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """이미 인코딩된 JSON 본문을 그대로 응답한다 (response_model 검증·직렬화를 거치지 않음)."""
+    return Response(body, media_type=JSON_MEDIA_TYPE, headers={**(headers or {}), "vary": "Accept"})
+
+
+def trusted_page_response(page: Dict[str, Any], item_model: Type[BaseModel]) -> Response:
+    """우리 RPC에서 온 제보 페이지를 response_model 재검증 없이 응답한다.
+
+    본문은 app/utils/page_body.page_content로 만든다 — 캐시에 저장하는 응답 본문과 같은 함수라 캐시
+    히트와 miss의 바이트가 같다. 항목은 item_model의 필드만 골라 담고(없는 필드는 기본값) 시각·UUID·enum은
+    RPC가 준 문자열 그대로 인코딩한다 — 항목 수 × 필드 수만큼의 파싱이 없다. STRICT_RESPONSE_VALIDATION이면
+    FastAPI와 같은 전체 검증·직렬화를 거친다.
+    """
+    return NegotiatedResponse(page_content(page, item_model))
+
+
+def ndjson_response(items: AsyncIterator[Dict[str, Any]], item_model: Type[BaseModel]) -> StreamingResponse:
+    """항목마다 한 줄의 JSON을 곧바로 내보내는 스트리밍 응답.
+
+    항목은 trusted_page_response와 같이 item_model 필드로 투영한다 (STRICT_RESPONSE_VALIDATION이면 검증).
+    헤더를 보낸 뒤의 조회 실패는 상태 코드로 알릴 수 없으므로 기록하고 스트림을 끝낸다 — 클라이언트는
+    마지막 줄의 created_at·id로 cursor를 만들어 이어 받을 수 있다.
+    """
+    fields = item_fields(item_model)
+
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for item in items:
+                if settings.STRICT_RESPONSE_VALIDATION:
+                    line = item_model.model_validate(item).model_dump(mode="json")
+                else:
+                    line = {name: item.get(name, default) for name, default in fields}
+                yield orjson.dumps(line, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        except Exception as e:
+            logger.error(f"NDJSON stream aborted: {e}")
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE, headers={"vary": "Accept"})
+
+
+class NegotiatedRoute(APIRoute):
+    """핸들러 실행 동안 Accept 협상 결과를 NegotiatedResponse에 전달하는 라우트."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            token = _wants_msgpack.set(wants_msgpack(request))
+            try:
+                return await handler(request)
+            finally:
+                _wants_msgpack.reset(token)
+
+        return negotiated_handler
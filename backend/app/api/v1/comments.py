@@ -4,8 +4,9 @@ from uuid import UUID
 from app.schemas.comment import Comment, CommentCreate, CommentUpdate
 from app.api.deps import get_current_active_user
 from app.services.comment_service import comment_service
+from app.api.responses import NegotiatedResponse, NegotiatedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
 
 @router.post("/", response_model=Comment)
 async def create_comment(
@@ -1,15 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import RedirectResponse, Response
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 from app.schemas.report import (
-    Report, ReportCreate, ReportUpdate, ReportCategory, ReportStatus, PaginatedReportResponse
+    Report, ReportCreate, ReportUpdate, ReportCategory, ReportStatus, PaginatedReportResponse,
+    GroupedReportResponse, ReportGridResponse, ReportFields, ReportMarker, ReportChangesResponse
 )
 from app.api.deps import get_current_active_user
+from app.core.config import settings
 from app.services.report_service import report_service
 from app.core.logging import get_logger
+from app.api.responses import (
+    NegotiatedResponse, NegotiatedRoute, encoded_json_response, ndjson_response, trusted_page_response,
+    wants_msgpack, wants_ndjson
+)
+from app.api.http_cache import (
+    canonical_bounds_url, with_validator
+)
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
+
+
+def _with_http_cache(request: Request, response: Response, current_user_id: Optional[str]) -> Response:
+    """익명 지도 조회 응답의 ETag·Cache-Control (app/api/http_cache.py). 꺼져 있거나 로그인 사용자면 그대로."""
+    max_age = settings.MAP_HTTP_CACHE_MAX_AGE
+    if current_user_id is not None or max_age <= 0:
+        return response
+    return with_validator(request, response, max_age)
 
 # --- Routes ---
 
@@ -32,33 +50,51 @@ async def create_report(
 
 @router.get("/", response_model=PaginatedReportResponse[Report])
 async def get_reports(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = 100,
     category: Optional[ReportCategory] = None,
     status: Optional[ReportStatus] = None,
     user_id: Optional[str] = None,
     search: Optional[str] = None,
-    current_user_id: Optional[str] = None
+    current_user_id: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> Any:
-    """List reports with filtering and search."""
+    """List reports with filtering and search. Pass `nextCursor` back as `cursor` to page by keyset.
+
+    With `Accept: application/x-ndjson`, up to `limit` reports after `cursor` are streamed one per line.
+    """
+    if wants_ndjson(request):
+        return ndjson_response(report_service.stream_reports(
+            limit,
+            category=category.value if category else None,
+            status=status.value if status else None,
+            user_id=user_id,
+            search=search,
+            current_user_id=current_user_id,
+            cursor=cursor
+        ), Report)
     try:
-        return await report_service.list_reports(
+        result = await report_service.list_reports(
             page=page,
             limit=limit,
             category=category.value if category else None,
             status=status.value if status else None,
             user_id=user_id,
             search=search,
-            current_user_id=current_user_id
+            current_user_id=current_user_id,
+            cursor=cursor
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Query error in get_reports: {e}")
         raise HTTPException(status_code=400, detail=f"Query error: {str(e)}")
+    return trusted_page_response(result, Report)
 
 @router.get("/nearby", response_model=PaginatedReportResponse[Report])
 async def get_nearby_reports(
+    request: Request,
     lat: float,
     lng: float,
     radius_km: float = 3.0,
@@ -66,42 +102,168 @@ async def get_nearby_reports(
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = 50,
-    current_user_id: Optional[str] = None
+    current_user_id: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> Any:
-    """Get reports near a specific location."""
+    """Get reports near a specific location. Pass `nextCursor` back as `cursor` to page by keyset.
+
+    With `Accept: application/x-ndjson`, up to `limit` reports after `cursor` are streamed one per line.
+    """
+    if wants_ndjson(request):
+        return ndjson_response(report_service.stream_nearby_reports(
+            lat, lng, radius_km, limit,
+            category.value if category else None,
+            search, current_user_id,
+            cursor=cursor
+        ), Report)
     try:
-        return await report_service.get_nearby_reports(
+        if cursor is None and not wants_msgpack(request):
+            body = await report_service.get_cached_nearby_body(
+                lat, lng, radius_km,
+                category.value if category else None,
+                search, page, limit, current_user_id
+            )
+            if body is not None:
+                return _with_http_cache(request, encoded_json_response(body), current_user_id)
+        result = await report_service.get_nearby_reports(
             lat, lng, radius_km,
             category.value if category else None,
-            search, page, limit, current_user_id
+            search, page, limit, current_user_id,
+            cursor=cursor
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching nearby reports: {e}")
         raise HTTPException(status_code=400, detail=f"Error fetching nearby reports: {str(e)}")
+    return _with_http_cache(request, trusted_page_response(result, Report), current_user_id)
 
-@router.get("/bounds", response_model=PaginatedReportResponse[Report])
+@router.get(
+    "/bounds",
+    response_model=Union[PaginatedReportResponse[Report], PaginatedReportResponse[ReportMarker]]
+)
 async def get_reports_in_bounds(
+    request: Request,
     north: float, south: float, east: float, west: float,
     category: Optional[ReportCategory] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = 100,
-    current_user_id: Optional[str] = None
+    current_user_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: ReportFields = ReportFields.FULL
 ) -> Any:
-    """Get reports within map bounds."""
+    """Get reports within map bounds. Pass `nextCursor` back as `cursor` to page by keyset.
+
+    `fields=marker` returns only id, lat/lng, category, status, created_at and counts per item.
+    Anonymous requests redirect to tile-aligned bounds when `MAP_CANONICAL_BOUNDS_ZOOM` is set.
+    With `Accept: application/x-ndjson`, up to `limit` items after `cursor` are streamed one per line.
+    """
+    if wants_ndjson(request):
+        return ndjson_response(report_service.stream_reports_in_bounds(
+            north, south, east, west, limit,
+            category.value if category else None,
+            search, current_user_id,
+            cursor=cursor,
+            fields=fields.value
+        ), ReportMarker if fields is ReportFields.MARKER else Report)
+    if settings.MAP_CANONICAL_BOUNDS_ZOOM > 0 and current_user_id is None:
+        canonical_url = canonical_bounds_url(request, north, south, east, west, settings.MAP_CANONICAL_BOUNDS_ZOOM)
+        if canonical_url is not None:
+            return RedirectResponse(canonical_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
     try:
-        return await report_service.get_reports_in_bounds(
+        if fields is ReportFields.FULL and cursor is None and not wants_msgpack(request):
+            body = await report_service.get_cached_bounds_body(
+                north, south, east, west,
+                category.value if category else None,
+                search, page, limit, current_user_id
+            )
+            if body is not None:
+                return _with_http_cache(request, encoded_json_response(body), current_user_id)
+        result = await report_service.get_reports_in_bounds(
             north, south, east, west,
             category.value if category else None,
-            search, page, limit, current_user_id
+            search, page, limit, current_user_id,
+            cursor=cursor,
+            fields=fields.value
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching bounds reports: {e}")
         raise HTTPException(status_code=400, detail=f"Error fetching bounds reports: {str(e)}")
+    response = trusted_page_response(result, ReportMarker if fields is ReportFields.MARKER else Report)
+    return _with_http_cache(request, response, current_user_id)
+
+@router.get("/bounds/groups", response_model=GroupedReportResponse[Report])
+async def get_grouped_reports_in_bounds(
+    north: float, south: float, east: float, west: float,
+    category: Optional[ReportCategory] = None,
+    search: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    limit: int = 100,
+    current_user_id: Optional[str] = None
+) -> Any:
+    """Get reports within map bounds together with their 30m proximity groups (ADR-0008)."""
+    try:
+        return await report_service.get_grouped_reports_in_bounds(
+            north, south, east, west,
+            category.value if category else None,
+            search, page, limit, current_user_id
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching grouped bounds reports: {e}")
+        raise HTTPException(status_code=400, detail=f"Error fetching grouped bounds reports: {str(e)}")
+
+@router.get("/bounds/grid", response_model=ReportGridResponse)
+async def get_report_grid_in_bounds(
+    north: float, south: float, east: float, west: float,
+    zoom: int = Query(..., ge=0, le=20),
+    category: Optional[ReportCategory] = None,
+    search: Optional[str] = None
+) -> Any:
+    """Get per-cell report counts within map bounds on a grid of 360 / 2**zoom degree cells."""
+    try:
+        return await report_service.get_report_grid_in_bounds(
+            north, south, east, west, zoom,
+            category.value if category else None,
+            search
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching bounds grid: {e}")
+        raise HTTPException(status_code=400, detail=f"Error fetching bounds grid: {str(e)}")
+
+@router.get("/bounds/changes", response_model=ReportChangesResponse)
+async def get_report_changes_in_bounds(
+    north: float, south: float, east: float, west: float,
+    since_version: int = Query(..., ge=0),
+    category: Optional[ReportCategory] = None,
+    search: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    current_user_id: Optional[str] = None
+) -> Any:
+    """Get reports changed within map bounds after `since_version`.
+
+    Apply `deletedIds` before upserting `items`, then send `version` as the next `since_version`.
+    Start from the highest `change_version` of a loaded bounds page. When `reset` is true,
+    `since_version` is older than the retained deletions: reload the viewport, then continue
+    from `version`.
+    """
+    try:
+        return await report_service.get_report_changes_in_bounds(
+            north, south, east, west, since_version,
+            category.value if category else None,
+            search, limit, current_user_id
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching bounds changes: {e}")
+        raise HTTPException(status_code=400, detail=f"Error fetching bounds changes: {str(e)}")
 
 @router.get("/{report_id}", response_model=Report)
 async def get_report(
@@ -39,6 +39,47 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    # 제보·댓글·투표 조회를 supabase AsyncClient로 (스레드 풀 대신 이벤트 루프에서, app/db/supabase_client.py)
+    SUPABASE_ASYNC_CLIENT: bool = os.getenv("SUPABASE_ASYNC_CLIENT", "false").lower() == "true"
+    # DB 호출 전용 스레드 풀(스레드 수 = httpx 연결 수) 대기열 한도와 대기 시간 한도(초, 0이면 끔).
+    # 넘치면 503 + Retry-After (app/utils/blocking_db.py)
+    DB_EXECUTOR_QUEUE_LIMIT: int = int(os.getenv("DB_EXECUTOR_QUEUE_LIMIT", "100"))
+    DB_EXECUTOR_MAX_WAIT_SECONDS: float = float(os.getenv("DB_EXECUTOR_MAX_WAIT_SECONDS", "0"))
+    DB_EXECUTOR_RETRY_AFTER_SECONDS: int = int(os.getenv("DB_EXECUTOR_RETRY_AFTER_SECONDS", "1"))
+    # 영역·반경 조회 RPC를 PostgREST 대신 DATABASE_URL로 직접 호출 (asyncpg, app/db/asyncpg_map_queries.py)
+    MAP_QUERY_DIRECT_DB: bool = os.getenv("MAP_QUERY_DIRECT_DB", "false").lower() == "true"
+    MAP_QUERY_DB_POOL_SIZE: int = int(os.getenv("MAP_QUERY_DB_POOL_SIZE", "10"))
+
+    # 지도 조회 설정
+    # 영역 조회 타일 모드 줌 레벨 (0이면 끔, app/services/bounds_tiles.py)
+    BOUNDS_TILE_ZOOM: int = int(os.getenv("BOUNDS_TILE_ZOOM", "0"))
+    # 지도 조회를 프로세스 내 공간 인덱스로 응답 (app/services/report_spatial_index.py)
+    REPORT_SPATIAL_INDEX: bool = os.getenv("REPORT_SPATIAL_INDEX", "false").lower() == "true"
+    # 지도 조회 캐시 stale 구간(초, 0이면 끔, app/services/spatial_report_cache.py)
+    MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = int(os.getenv("MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS", "0"))
+    MAP_CACHE_STALE_IF_ERROR_SECONDS: int = int(os.getenv("MAP_CACHE_STALE_IF_ERROR_SECONDS", "0"))
+    # 지도 조회 캐시 저장소: memory(워커별) 또는 sqlite(같은 호스트의 워커가 공유, app/services/map_cache_backends.py)
+    MAP_CACHE_BACKEND: str = os.getenv("MAP_CACHE_BACKEND", "memory")
+    MAP_CACHE_SQLITE_PATH: str = os.getenv("MAP_CACHE_SQLITE_PATH", "/tmp/dongne-sokdak-map-cache.sqlite3")
+    # 캐시된 익명 지도 조회 결과를 응답 본문 바이트로도 저장해 캐시 히트를 그대로 응답 (app/utils/page_body.py)
+    MAP_CACHE_RESPONSE_BODIES: bool = os.getenv("MAP_CACHE_RESPONSE_BODIES", "false").lower() == "true"
+    # RPC에서 온 제보 페이지도 응답 스키마로 전부 검증 (기본은 필드 투영만, app/api/responses.py). 테스트는 켠다
+    STRICT_RESPONSE_VALIDATION: bool = os.getenv("STRICT_RESPONSE_VALIDATION", "false").lower() == "true"
+    # 익명 지도 조회 응답의 ETag·Cache-Control max-age(초, 0이면 끔, app/api/http_cache.py)
+    MAP_HTTP_CACHE_MAX_AGE: int = int(os.getenv("MAP_HTTP_CACHE_MAX_AGE", "0"))
+    # 익명 영역 조회를 이 줌의 타일 경계로 정렬한 URL로 리다이렉트 (0이면 끔)
+    MAP_CANONICAL_BOUNDS_ZOOM: int = int(os.getenv("MAP_CANONICAL_BOUNDS_ZOOM", "0"))
+    # 영역 조회 뒤 다음 페이지·이웃 영역을 미리 캐시에 채우는 동시 선조회 수 (0이면 끔, app/services/map_prefetch.py)
+    MAP_PREFETCH_BUDGET: int = int(os.getenv("MAP_PREFETCH_BUDGET", "0"))
+    # 시동 시 지도 조회 캐시 예열 (app/services/cache_warmup.py). 출처가 하나도 없으면 끔
+    # 격자 중심 "lat,lng;lat,lng"
+    MAP_WARMUP_CENTERS: str = os.getenv("MAP_WARMUP_CENTERS", "")
+    # profiles.neighborhood 상위 동네 수 (0이면 끔)
+    MAP_WARMUP_NEIGHBORHOODS: int = int(os.getenv("MAP_WARMUP_NEIGHBORHOODS", "0"))
+    # 최근 영역 조회를 고를 접근 로그 파일 경로
+    MAP_WARMUP_REQUEST_LOG: str = os.getenv("MAP_WARMUP_REQUEST_LOG", "")
+    MAP_WARMUP_CONCURRENCY: int = int(os.getenv("MAP_WARMUP_CONCURRENCY", "4"))
+    MAP_WARMUP_TIMEOUT_SECONDS: int = int(os.getenv("MAP_WARMUP_TIMEOUT_SECONDS", "60"))
     
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -0,0 +1,122 @@
+"""핫 지도 조회 RPC를 asyncpg로 Postgres에 직접 호출한다.
+
+기본 경로는 FastAPI → DB 스레드 → httpx → PostgREST → Postgres이고, 결과는 PostgREST가 JSON으로
+인코딩하고 Python이 디코딩한 뒤 응답으로 다시 인코딩한다. `AsyncpgMapQueries`는 같은 RPC
+(`get_reports_in_bounds_page` 계열, `get_reports_within_radius`·`count_reports_within_radius`)를
+`DATABASE_URL`의 asyncpg 연결 풀로 부른다 — 네트워크 홉 하나와 PostgREST의 JSON 인코딩이 빠진다.
+
+- asyncpg는 문장을 연결마다 prepare해 캐시하므로 같은 RPC 호출은 파싱·계획 준비를 다시 하지 않는다.
+  Supabase 트랜잭션 풀러(6543)는 prepared statement를 지원하지 않으니 직접 연결이나 세션 풀러(5432)
+  주소를 써야 한다.
+- 반경 조회는 행 집합을 돌려주므로 `geography` 열을 바이너리 EWKB로 받아 좌표로 바로 읽는다
+  (16진수 문자열 왕복 없음). 영역 조회 RPC는 JSONB 하나를 돌려주므로 orjson으로 한 번에 디코딩한다.
+- 행은 PostgREST 응답과 같은 모양으로 맞춘다 (UUID·시각은 문자열) — cursor·캐시·MessagePack
+  인코딩이 경로를 구분하지 않는다.
+
+asyncpg는 이 경로를 켤 때만 필요하므로 풀을 처음 만들 때 import한다.
+"""
+import asyncio
+import re
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import orjson
+
+from app.core.config import settings
+from app.utils.wkb_parser import parse_ewkb_point
+
+_IDENTIFIER = re.compile(r"[a-z_][a-z0-9_]*")
+
+
+def _call_sql(function_name: str, params: Mapping[str, Any], *, rows: bool) -> str:
+    """public.function_name(p1 => $1, ...) 호출문. 이름 표기라 인자 순서가 시그니처와 무관하다."""
+    if not _IDENTIFIER.fullmatch(function_name) or not all(_IDENTIFIER.fullmatch(name) for name in params):
+        raise ValueError(f"invalid RPC name or parameter: {function_name}")
+    arguments = ", ".join(f"{name} => ${i}" for i, name in enumerate(params, start=1))
+    call = f"public.{function_name}({arguments})"
+    return f"SELECT * FROM {call}" if rows else f"SELECT {call}"
+
+
+def _decode_geography(data: bytes) -> Optional[Dict[str, float]]:
+    point = parse_ewkb_point(data)
+    return {"lat": point[1], "lng": point[0]} if point else None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _row(record: Mapping[str, Any]) -> Dict[str, Any]:
+    return {name: _plain(value) for name, value in record.items()}
+
+
+class AsyncpgMapQueries:
+    """지도 조회 RPC의 asyncpg 구현. 풀은 첫 조회 때 만든다."""
+
+    def __init__(self, dsn: str, *, max_size: int = 10, pool: Any = None) -> None:
+        self._dsn = dsn
+        self._max_size = max_size
+        self._pool = pool
+        self._pool_lock = asyncio.Lock()
+
+    async def _init_connection(self, connection: Any) -> None:
+        await connection.set_type_codec(
+            "jsonb", schema="pg_catalog",
+            encoder=lambda value: orjson.dumps(value).decode(), decoder=orjson.loads,
+        )
+        # PostGIS 스키마는 프로젝트마다 다르다 (Supabase는 extensions).
+        schema = await connection.fetchval(
+            "SELECT typnamespace::regnamespace::text FROM pg_type WHERE typname = 'geography'"
+        )
+        await connection.set_type_codec(
+            "geography", schema=schema, encoder=bytes, decoder=_decode_geography, format="binary",
+        )
+
+    async def _ready_pool(self) -> Any:
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    import asyncpg
+
+                    self._pool = await asyncpg.create_pool(
+                        self._dsn, min_size=1, max_size=self._max_size, init=self._init_connection,
+                    )
+        return self._pool
+
+    async def bounds_page(self, rpc_name: str, params: Mapping[str, Any]) -> Dict[str, Any]:
+        """영역 조회 페이지 RPC(get_reports_in_bounds_page 시그니처)의 {items, total_count}."""
+        pool = await self._ready_pool()
+        async with pool.acquire() as connection:
+            payload = await connection.fetchval(_call_sql(rpc_name, params, rows=False), *params.values())
+        return payload or {}
+
+    async def radius_page(
+        self,
+        count_params: Mapping[str, Any],
+        page_params: Mapping[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """반경 조회 한 페이지의 (행, 총 건수). 두 호출은 연결 하나에서 잇달아 돈다."""
+        pool = await self._ready_pool()
+        async with pool.acquire() as connection:
+            total_count = await connection.fetchval(
+                _call_sql("count_reports_within_radius", count_params, rows=False), *count_params.values()
+            )
+            records = await connection.fetch(
+                _call_sql("get_reports_within_radius", page_params, rows=True), *page_params.values()
+            )
+        return [_row(record) for record in records], total_count or 0
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+
+
+direct_map_queries: Optional[AsyncpgMapQueries] = (
+    AsyncpgMapQueries(settings.DATABASE_URL, max_size=settings.MAP_QUERY_DB_POOL_SIZE)
+    if settings.MAP_QUERY_DIRECT_DB else None
+)
@@ -1,4 +1,7 @@
+from typing import Optional, Union
+
 import httpx
+from supabase import AsyncClient, AsyncClientOptions
 from supabase.client import create_client, Client, ClientOptions
 from app.core.config import settings
 
@@ -31,4 +34,34 @@ def get_supabase_client() -> Client:
     )
 
 
+def _build_async_httpx_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=_POOL_LIMITS,
+        timeout=httpx.Timeout(30.0),
+        transport=httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=2),
+        follow_redirects=True,
+    )
+
+
+def get_async_supabase_client() -> AsyncClient:
+    # AsyncClient의 query builder는 `await query.execute()`로 바로 돌고(app/utils/blocking_db.py),
+    # 동시 조회 수는 스레드 수가 아니라 위 연결 풀이 정한다. 취소하면 진행 중인 HTTP 요청도 끊긴다.
+    return AsyncClient(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_KEY,
+        options=AsyncClientOptions(httpx_client=_build_async_httpx_client()),
+    )
+
+
+# table()/rpc()만 쓰는 서비스(제보·댓글·투표·관리자 대시보드·로그)의 기본 클라이언트.
+# Auth·Storage 호출은 동기 `supabase`를 그대로 쓴다.
+QueryClient = Union[Client, AsyncClient]
+
 supabase = get_supabase_client()
+async_supabase: Optional[AsyncClient] = get_async_supabase_client() if settings.SUPABASE_ASYNC_CLIENT else None
+query_client: QueryClient = async_supabase or supabase
+
+
+async def close_async_supabase() -> None:
+    if async_supabase is not None and async_supabase.options.httpx_client is not None:
+        await async_supabase.options.httpx_client.aclose()
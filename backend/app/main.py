@@ -4,15 +4,20 @@ import os
 # Python path 설정 (Render 배포용)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.api import router as api_router
 from app.core.config import settings
+from app.db.asyncpg_map_queries import direct_map_queries
+from app.db.supabase_client import close_async_supabase
+from app.middleware.cancel_on_disconnect import CancelOnDisconnectMiddleware
+from app.services.cache_warmup import map_cache_warmup
 from app.core.logging import setup_logging, log_api_request, log_api_response, get_logger
 from app.core.sentry import init_sentry
 from postgrest.types import CountMethod
-from app.utils.blocking_db import execute
+from app.utils.blocking_db import db_executor, execute
 import time
 import uuid
 
@@ -27,10 +32,22 @@ setup_logging(
 
 logger = get_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 지도 조회 캐시 예열은 백그라운드로 돈다 — 끝날 때까지 /health/ready만 503이다.
+    map_cache_warmup.start()
+    yield
+    map_cache_warmup.stop()
+    await close_async_supabase()
+    if direct_map_queries is not None:
+        await direct_map_queries.close()
+
+
 app = FastAPI(
     title="동네속닥 API",
     description="우리 동네 이슈 제보 커뮤니티 플랫폼 API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # 처리되지 않은 예외를 일반 응답으로 바꾼다.
@@ -92,6 +109,9 @@ async def logging_middleware(request: Request, call_next):
     
     return response
 
+# 끊긴 클라이언트의 GET 처리를 취소한다. 가장 바깥에 두어야 안쪽 미들웨어까지 함께 취소된다.
+app.add_middleware(CancelOnDisconnectMiddleware)
+
 # API 라우터 연결
 app.include_router(api_router)
 
@@ -108,9 +128,18 @@ async def health_live():
 
 @app.get("/health/ready")
 async def health_ready():
+    # Readiness probe: 지도 조회 캐시 예열(app/services/cache_warmup.py) 중에는 트래픽을 받지 않는다.
+    if not map_cache_warmup.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "api_version": "0.1.0"})
     return await health_check()
 
 
+@app.get("/health/db-pool")
+async def health_db_pool():
+    # DB 호출 전용 풀의 대기열 깊이·대기 시간·거절 수 (app/utils/blocking_db.py)
+    return db_executor.stats()
+
+
 @app.get("/health")
 async def health_check():
     try:
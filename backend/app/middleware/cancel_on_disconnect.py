@@ -0,0 +1,59 @@
+"""클라이언트가 끊긴 조회 요청의 처리를 취소한다.
+
+Uvicorn은 클라이언트가 연결을 끊어도 핸들러를 끝까지 돌린다 — 지도를 빠르게 옮기면 버려진
+영역 조회들이 Supabase 호출을 계속 붙잡는다. 이 ASGI 미들웨어는 요청 본문을 대신 읽으면서
+`http.disconnect`를 지켜보다가, 응답을 다 보내기 전에 끊기면 핸들러 태스크를 취소한다.
+AsyncClient 경로(`SUPABASE_ASYNC_CLIENT`)에서는 진행 중인 PostgREST 요청까지 끊긴다.
+
+취소는 GET·HEAD에만 건다. 쓰기 요청을 중간에 끊으면 DB 변경 뒤 캐시 무효화가 빠질 수 있다.
+응답을 다 보낸 뒤(백그라운드 작업 실행 중)의 끊김은 무시한다. 여러 요청이 함께 기다리는
+single-flight 조회는 `asyncio.shield`로 감싸져 있어 한 요청의 취소가 다른 요청에 번지지 않는다.
+"""
+import asyncio
+import contextlib
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_CANCELLABLE_METHODS = ("GET", "HEAD")
+
+
+class CancelOnDisconnectMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _CANCELLABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        messages: "asyncio.Queue[Message]" = asyncio.Queue()
+        response_complete = False
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+
+        async def watch() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        handler = asyncio.ensure_future(self.app(scope, messages.get, tracked_send))
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await asyncio.wait((handler, watcher), return_when=asyncio.FIRST_COMPLETED)
+            if not handler.done() and not response_complete:
+                handler.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await handler
+                return
+            await handler
+        finally:
+            for task in (handler, watcher):
+                task.cancel()
+            if watcher.done() and not watcher.cancelled():
+                watcher.exception()
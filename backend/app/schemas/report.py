@@ -16,6 +16,11 @@ class ReportStatus(str, Enum):
     IN_PROGRESS = "IN_PROGRESS"
     RESOLVED = "RESOLVED"
 
+class ReportFields(str, Enum):
+    # 지도 조회 응답 항목의 모양: 전체 행(Report) 또는 마커 투영(ReportMarker)
+    FULL = "full"
+    MARKER = "marker"
+
 class Location(BaseModel):
     lat: float
     lng: float
@@ -47,17 +52,75 @@ class Report(ReportBase):
     vote_count: Optional[int] = 0
     comment_count: Optional[int] = 0
     user_voted: Optional[bool] = False
+    # 변경 버전 — 제보 삽입·수정마다 증가. 영역 조회 RPC만 채운다 (델타 동기화의 since_version)
+    change_version: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 class ReportInDB(Report):
     pass
 
+class ReportMarker(BaseModel):
+    """지도 마커 렌더링에 필요한 필드만 담은 제보 투영 (fields=marker)."""
+    id: UUID
+    # 소수점 6자리(약 0.1m)로 반올림
+    lat: float
+    lng: float
+    category: ReportCategory
+    status: ReportStatus
+    # nextCursor를 만들기 위해 남긴다
+    created_at: datetime
+    vote_count: int = 0
+    comment_count: int = 0
+
 T = TypeVar('T')
 
 class PaginatedReportResponse(BaseModel, Generic[T]):
     items: List[T]
     totalCount: int
     totalPages: int
-    page: int
+    # cursor로 요청한 페이지는 몇 번째 페이지인지 알 수 없어 None
+    page: Optional[int]
     limit: int
+    # 다음 페이지를 keyset으로 이어 받는 불투명 cursor. 마지막 페이지면 None
+    nextCursor: Optional[str] = None
+
+class ProximityGroup(BaseModel):
+    # "proximity-<시드 제보 id>" — 프론트엔드 그룹 id와 같은 형식 (ADR-0008)
+    id: str
+    # 멤버 좌표 평균
+    center: Location
+    # 시드가 첫 번째, 나머지는 items 순서
+    memberIds: List[UUID]
+
+class GroupedReportResponse(PaginatedReportResponse[T], Generic[T]):
+    # items 전체를 반경 30m 시드 기반 그리디로 묶은 근접 그룹. 모든 item은 정확히 한 그룹에 속한다
+    groups: List[ProximityGroup]
+
+class ReportGridCell(BaseModel):
+    # bounds_tiles 격자 좌표: x = floor((lng + 180) / cellDegrees), y = floor((lat + 90) / cellDegrees)
+    x: int
+    y: int
+    count: int
+    # 셀 안 제보 좌표 평균
+    center: Location
+    # 카테고리 → 제보 수
+    categories: Dict[str, int]
+
+class ReportGridResponse(BaseModel):
+    zoom: int
+    cellDegrees: float
+    cells: List[ReportGridCell]
+    totalCount: int
+
+class ReportChangesResponse(BaseModel):
+    # since_version 이후 영역 안에서 바뀐, 필터에 맞는 제보 (upsert). change_version 오름차순
+    items: List[Report]
+    # 영역 안에서 삭제·이동됐거나 더 이상 필터에 맞지 않는 제보 id (items보다 먼저 적용)
+    deletedIds: List[UUID]
+    # 다음 요청의 since_version
+    version: int
+    # items가 limit에서 잘림 — version부터 이어 받는다
+    hasMore: bool
+    # since_version이 보존 기간이 지나 지워진 tombstone보다 오래됨 — 영역을 다시 읽고 version부터 이어 받는다
+    reset: bool = False
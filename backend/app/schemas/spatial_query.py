@@ -17,6 +17,10 @@ class RadiusQueryParams(BaseModel):
     def for_get(self, offset: int, limit: int) -> dict:
         return {**self.model_dump(), "result_offset": offset, "result_limit": limit}
 
+    def for_get_after(self, after_created_at: str, after_id: str, limit: int) -> dict:
+        """Params for the keyset variant get_reports_within_radius_after."""
+        return {**self.model_dump(), "after_created_at": after_created_at, "after_id": after_id, "result_limit": limit}
+
 
 class BoundsQueryParams(BaseModel):
     """Shared param source for get/count_reports_in_bounds (see ADR-0004)."""
@@ -33,3 +37,15 @@ class BoundsQueryParams(BaseModel):
 
     def for_get(self, offset: int, limit: int) -> dict:
         return {**self.model_dump(), "result_offset": offset, "result_limit": limit}
+
+    def for_get_after(self, after_created_at: str, after_id: str, limit: int) -> dict:
+        """Params for the keyset variant get_reports_in_bounds_after."""
+        return {**self.model_dump(), "after_created_at": after_created_at, "after_id": after_id, "result_limit": limit}
+
+    def for_grid(self, cell_degrees: float) -> dict:
+        """Params for the aggregate variant get_report_grid_in_bounds."""
+        return {**self.model_dump(), "cell_degrees": cell_degrees}
+
+    def for_changes(self, since_version: int, limit: int) -> dict:
+        """Params for the delta variant get_report_changes_in_bounds."""
+        return {**self.model_dump(), "since_version": since_version, "result_limit": limit}
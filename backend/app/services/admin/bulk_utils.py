@@ -30,7 +30,7 @@ async def record_bulk_success(
     """bulk mutation 성공 id들에 대한 결과 기록 + audit log 순회.
 
     실제 DB mutation(update/delete)과 그 부수효과(예: 지도 조회 캐시 무효화,
-    ADR-0001)는 호출부 책임으로 남긴다. user/report bulk 액션은 이 순회
+    ADR-0011)는 호출부 책임으로 남긴다. user/report bulk 액션은 이 순회
     루프 모양만 같을 뿐 권한검사·자기 제외·payload 구성 규칙이 엔티티마다
     달라, 그 부분까지 하나의 코어로 묶으면 콜백 주입이 많아져 오히려
     읽기 어려워진다고 판단해 여기까지만 공유한다.
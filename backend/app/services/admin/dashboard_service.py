@@ -1,8 +1,7 @@
 from typing import Dict, Any
-from supabase import Client
 from fastapi import HTTPException, status
 from app.core.logging import get_logger
-from app.db.supabase_client import supabase as default_supabase
+from app.db.supabase_client import QueryClient, query_client as default_supabase
 from app.utils.blocking_db import execute
 
 logger = get_logger(__name__)
@@ -11,7 +10,7 @@ logger = get_logger(__name__)
 class AdminDashboardService:
     """admin 대시보드 통계 조회. 주입 관용구는 ADR-0002."""
 
-    def __init__(self, supabase: Client) -> None:
+    def __init__(self, supabase: QueryClient) -> None:
         self._supabase = supabase
 
     async def get_dashboard_stats(self) -> Dict[str, Any]:
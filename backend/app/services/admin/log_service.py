@@ -1,7 +1,6 @@
 from typing import List, Optional, Dict, Any
-from supabase import Client
 from app.core.logging import get_logger
-from app.db.supabase_client import supabase as default_supabase
+from app.db.supabase_client import QueryClient, query_client as default_supabase
 from app.utils.blocking_db import execute
 
 logger = get_logger(__name__)
@@ -10,7 +9,7 @@ logger = get_logger(__name__)
 class AdminLogService:
     """admin 활동 로그 조회. 주입 관용구는 ADR-0002."""
 
-    def __init__(self, supabase: Client) -> None:
+    def __init__(self, supabase: QueryClient) -> None:
         self._supabase = supabase
 
     async def get_admin_activity_logs(
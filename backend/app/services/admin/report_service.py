@@ -5,7 +5,8 @@ from fastapi import HTTPException, status
 from app.middleware.admin_auth import log_admin_activity as default_log_admin_activity
 from app.core.logging import get_logger
 from app.db.supabase_client import supabase as default_supabase
-from app.services.report_service import report_service
+from app.services.report_service import enrich_report_data, invalidate_map_caches, report_service
+from app.services.report_spatial_index import ReportSpatialIndex
 from app.services.spatial_report_cache import SpatialReportCache
 from app.services.admin.bulk_utils import record_bulk_success, AdminActionContext
 from app.services.user_directory import attach_author, fetch_emails, fetch_profiles
@@ -15,17 +16,37 @@ logger = get_logger(__name__)
 
 
 class AdminReportService:
-    """admin 제보 관리. 제보 변이 시 지도 조회 캐시를 전체 무효화한다(ADR-0001), 주입 관용구는 ADR-0002."""
+    """admin 제보 관리. 제보 변이 시 변이된 제보 좌표의 지도 조회 캐시를 무효화한다(ADR-0011), 주입 관용구는 ADR-0002.
+
+    admin 변이는 좌표를 바꾸지 않으므로 변경 전 행(select *)의 좌표로 충분하다.
+    """
 
     def __init__(
         self,
         supabase: Client,
         cache: SpatialReportCache,
         log_admin_activity: Callable[..., Awaitable[None]] = default_log_admin_activity,
+        spatial_index: Optional[ReportSpatialIndex] = None,
     ) -> None:
         self._supabase = supabase
         self._cache = cache
         self._log_admin_activity = log_admin_activity
+        self._spatial_index = spatial_index
+
+    def _reindex(self, rows: List[Dict[str, Any]]) -> None:
+        """변경된 제보 행을 공간 인덱스에 반영한다. 투표·댓글 카운터는 인덱스 값을 유지한다."""
+        if self._spatial_index is None:
+            return
+        for row in rows:
+            # 좌표가 없는 부분 응답을 반영하면 제보가 기본 좌표로 옮겨진다.
+            if row.get("location"):
+                self._spatial_index.upsert(enrich_report_data(dict(row)), keep_counters=True)
+
+    def _unindex(self, report_ids: List[str]) -> None:
+        if self._spatial_index is None:
+            return
+        for report_id in report_ids:
+            self._spatial_index.remove(report_id)
 
     async def get_reports(
         self,
@@ -39,12 +60,8 @@ class AdminReportService:
         try:
             # 작성자(profiles)와 이메일(auth.users)은 임베딩할 수 없다 — reports와
             # profiles 사이에 외래키가 없고 auth 스키마는 PostgREST에 노출되지 않는다.
-            # votes/comments는 reports를 직접 참조하므로 집계 임베딩이 가능하다.
-            query = self._supabase.table("reports").select("""
-                *,
-                vote_count:votes(count),
-                comment_count:comments(count)
-            """)
+            # 투표·댓글 수는 reports의 카운터 컬럼이다.
+            query = self._supabase.table("reports").select("*")
             if status_filter: query = query.eq("status", status_filter)
             if category: query = query.eq("category", category)
             if assigned_admin_id: query = query.eq("assigned_admin_id", assigned_admin_id)
@@ -112,7 +129,8 @@ class AdminReportService:
             update_response = await execute(self._supabase.table("reports").update(update_data).eq("id", report_id))
             if not update_response.data:
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="제보 상태 변경에 실패했습니다")
-            self._cache.invalidate_all()
+            invalidate_map_caches(self._cache, [report])
+            self._reindex(update_response.data)
 
             await self._log_admin_activity(
                 admin_id=admin_id, action="REPORT_STATUS_CHANGE", target_type="report", target_id=report_id,
@@ -150,6 +168,7 @@ class AdminReportService:
                 if admin_role != "admin":
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="제보 삭제는 최고관리자만 가능합니다")
                 await execute(self._supabase.table("reports").delete().eq("id", report_id))
+                self._unindex([report_id])
                 message = "제보가 삭제되었습니다"
                 action_detail = "REPORT_DELETE"
             elif action == "assign":
@@ -162,7 +181,7 @@ class AdminReportService:
             else:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"지원하지 않는 액션입니다: {action}")
 
-            self._cache.invalidate_all()
+            invalidate_map_caches(self._cache, [report])
 
             await self._log_admin_activity(
                 admin_id=admin_id, action=action_detail, target_type="report", target_id=report_id,
@@ -236,7 +255,8 @@ class AdminReportService:
                     return {"success_count": 0, "error_count": error_count + len(targets), "results": results + [{"report_id": rid, "status": "error", "message": "제보 삭제는 최고관리자만 가능합니다"} for rid in targets]}
 
                 await execute(self._supabase.table("reports").delete().in_("id", list(targets.keys())))
-                self._cache.invalidate_all()
+                invalidate_map_caches(self._cache, targets.values())
+                self._unindex(list(targets.keys()))
                 delete_count, delete_results = await record_bulk_success(
                     list(targets.keys()), id_field="report_id", message="제보가 삭제되었습니다",
                     action="BULK_REPORT_DELETE", target_type="report", context=context,
@@ -251,8 +271,9 @@ class AdminReportService:
                 return {"success_count": 0, "error_count": error_count + len(targets), "results": results + [{"report_id": rid, "status": "error", "message": f"지원하지 않는 액션입니다: {action}"} for rid in targets]}
 
             if ids_to_update:
-                await execute(self._supabase.table("reports").update(update_payload).in_("id", ids_to_update))
-                self._cache.invalidate_all()
+                update_res = await execute(self._supabase.table("reports").update(update_payload).in_("id", ids_to_update))
+                invalidate_map_caches(self._cache, targets.values())
+                self._reindex(update_res.data or [])
 
                 update_count, update_results = await record_bulk_success(
                     ids_to_update, id_field="report_id", message=success_msg,
@@ -270,5 +291,9 @@ class AdminReportService:
         return {"success_count": success_count, "error_count": error_count, "results": results}
 
 
-# 기본 인스턴스는 report_service의 캐시를 공유한다 — admin 상태 변경이 지도 조회 무효화에 합류(ADR-0001)
-admin_report_service = AdminReportService(default_supabase, report_service.cache)
+# 기본 인스턴스는 report_service의 캐시를 공유한다 — admin 상태 변경이 지도 조회 무효화에 합류(ADR-0011)
+admin_report_service = AdminReportService(
+    default_supabase,
+    report_service.cache,
+    spatial_index=report_service.spatial_index,
+)
@@ -0,0 +1,101 @@
+"""영역 조회(Bounds Query) 타일 분해.
+
+뷰포트를 고정 줌 레벨의 위경도 격자 타일로 덮는다. 타일 한 변은 `360 / 2**zoom`도이며
+(zoom 14 ≈ 0.022° ≈ 2.4km), 한 픽셀 차이 나는 두 뷰포트도 같은 타일 집합으로 떨어지므로
+타일 단위로 캐시하면 서로 다른 사용자의 영역 조회가 캐시를 공유한다.
+
+타일 결과를 합친 뒤 정확한 요청 영역으로 잘라내는 것은 호출자(`ReportService`)의 몫이다.
+"""
+import math
+from typing import List, NamedTuple, Tuple
+
+DEFAULT_TILE_ZOOM = 14
+
+
+class Tile(NamedTuple):
+    zoom: int
+    x: int
+    y: int
+
+    @property
+    def span(self) -> float:
+        return tile_span(self.zoom)
+
+    @property
+    def west(self) -> float:
+        return self.x * self.span - 180.0
+
+    @property
+    def east(self) -> float:
+        return (self.x + 1) * self.span - 180.0
+
+    @property
+    def south(self) -> float:
+        return self.y * self.span - 90.0
+
+    @property
+    def north(self) -> float:
+        return (self.y + 1) * self.span - 90.0
+
+
+def tile_span(zoom: int) -> float:
+    """해당 줌 레벨 타일 한 변의 길이(도)."""
+    return 360.0 / (2 ** zoom)
+
+
+def tiles_covering(
+    north: float,
+    south: float,
+    east: float,
+    west: float,
+    zoom: int = DEFAULT_TILE_ZOOM,
+) -> List[Tile]:
+    """요청 영역과 겹치는 타일 전부를 남→북, 서→동 순서로 반환한다."""
+    span = tile_span(zoom)
+    x_min = math.floor((west + 180.0) / span)
+    x_max = math.floor((east + 180.0) / span)
+    y_min = math.floor((south + 90.0) / span)
+    y_max = math.floor((north + 90.0) / span)
+    return [
+        Tile(zoom, x, y)
+        for y in range(y_min, y_max + 1)
+        for x in range(x_min, x_max + 1)
+    ]
+
+
+def snap_to_tiles(
+    north: float,
+    south: float,
+    east: float,
+    west: float,
+    zoom: int,
+) -> Tuple[float, float, float, float]:
+    """요청 영역을 덮는 타일들(tiles_covering)의 바깥 경계 (north, south, east, west)."""
+    span = tile_span(zoom)
+    return (
+        (math.floor((north + 90.0) / span) + 1) * span - 90.0,
+        math.floor((south + 90.0) / span) * span - 90.0,
+        (math.floor((east + 180.0) / span) + 1) * span - 180.0,
+        math.floor((west + 180.0) / span) * span - 180.0,
+    )
+
+
+
+def align_to_tiles(
+    north: float,
+    south: float,
+    east: float,
+    west: float,
+    zoom: int,
+) -> Tuple[float, float, float, float]:
+    """요청 영역을 타일 경계로 바깥쪽 정렬한 (north, south, east, west).
+
+    snap_to_tiles와 달리 이미 타일 경계에 놓인 변은 옮기지 않는다 — 정렬 결과를 다시 정렬해도 같다.
+    """
+    span = tile_span(zoom)
+    return (
+        math.ceil((north + 90.0) / span) * span - 90.0,
+        math.floor((south + 90.0) / span) * span - 90.0,
+        math.ceil((east + 180.0) / span) * span - 180.0,
+        math.floor((west + 180.0) / span) * span - 180.0,
+    )
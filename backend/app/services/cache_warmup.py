@@ -0,0 +1,265 @@
+"""지도 조회 캐시 시동 예열.
+
+배포·재시작 직후의 캐시는 비어 있어, 인기 지역의 첫 사용자들이 한꺼번에 RPC 지연을 치른다.
+`MapCacheWarmup`은 시동 시 세 출처에서 고른 뷰포트의 영역 조회를 제한된 동시성으로 미리 돌려
+`SpatialReportCache`를 채운다:
+
+- 설정한 중심 좌표(`MAP_WARMUP_CENTERS`) 주위의 격자 — `scripts/bounds_benchmark_cases.py`와 같은 방식
+- `profiles.neighborhood`에 가장 많이 등록된 동네 좌표
+- 최근 요청 로그(`MAP_WARMUP_REQUEST_LOG`)에서 가장 많이 요청된 영역 조회
+
+예열이 끝나기 전에는 `ready`가 거짓이며 `/health/ready`가 503을 돌려준다 — 로드 밸런서가 차가운
+워커로 트래픽을 보내지 않는다. 예열이 실패하거나 시간 제한을 넘겨도 준비 상태로 넘어간다
+(예열은 최적화일 뿐, 워커를 영영 빼 둘 이유는 아니다).
+
+뷰포트가 실제 요청과 같은 캐시 키가 되려면 URL 정규화(`MAP_CANONICAL_BOUNDS_ZOOM`)나 타일 모드를
+켜야 한다. 정규화가 켜져 있으면 예열 뷰포트도 같은 타일 경계로 맞춘다.
+
+캐시 항목은 15초만 신선하고, 예열은 시간 제한(기본 60초)까지 걸릴 수 있다. 앞서 채운 항목이 준비
+전에 만료되지 않으려면 stale-while-revalidate 구간(`MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS`)이
+시간 제한 이상이어야 한다 — 그러면 만료된 예열 항목도 즉시 응답하고 백그라운드에서 다시 조회한다.
+예열을 켜고 이 구간이 짧으면 시작할 때 경고한다.
+"""
+import asyncio
+import re
+from collections import Counter
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.supabase_client import QueryClient, query_client as default_supabase
+from app.services.bounds_tiles import align_to_tiles
+from app.services.report_service import ReportService, report_service
+from app.utils.blocking_db import execute
+
+logger = get_logger(__name__)
+
+# 영역 조회 라우트 기본 limit
+_WARMUP_LIMIT = 100
+# 격자 예열: 중심 주위 3×3 뷰포트, 뷰포트 반폭은 부하 시나리오 강남 격자와 같다.
+_GRID_SIZE = 3
+_GRID_HALF_SPAN = 0.012
+# 동네 좌표는 소수점 2자리(약 1km)로 묶어 센다.
+_NEIGHBORHOOD_PRECISION = 2
+_NEIGHBORHOOD_SCAN_LIMIT = 5000
+# 요청 로그는 끝에서 이만큼만 읽고, 가장 많이 요청된 영역 조회 이만큼을 예열한다.
+_LOG_TAIL_BYTES = 5 * 1024 * 1024
+_LOG_TOP = 200
+_BOUNDS_REQUEST = re.compile(r"/reports/bounds\?([^\s\"]+)")
+
+
+class WarmupViewport(NamedTuple):
+    north: float
+    south: float
+    east: float
+    west: float
+    category: Optional[str] = None
+    limit: int = _WARMUP_LIMIT
+
+
+def parse_centers(value: str) -> List[Tuple[float, float]]:
+    """"lat,lng;lat,lng" 형식. 읽을 수 없는 항목은 건너뛴다."""
+    centers = []
+    for part in value.split(";"):
+        try:
+            lat, lng = (float(v) for v in part.split(","))
+        except ValueError:
+            continue
+        centers.append((lat, lng))
+    return centers
+
+
+def grid_viewports(center: Tuple[float, float], *, size: int = _GRID_SIZE,
+                   half_span: float = _GRID_HALF_SPAN) -> List[WarmupViewport]:
+    """중심 주위 size×size개의 맞닿은 뷰포트."""
+    center_lat, center_lng = center
+    spacing = 2 * half_span
+    viewports = []
+    for row in range(size):
+        for column in range(size):
+            lat = center_lat + (row - (size - 1) / 2) * spacing
+            lng = center_lng + (column - (size - 1) / 2) * spacing
+            viewports.append(WarmupViewport(lat + half_span, lat - half_span, lng + half_span, lng - half_span))
+    return viewports
+
+
+def viewports_from_request_log(lines: Iterable[str], top: int = _LOG_TOP) -> List[WarmupViewport]:
+    """접근 로그 줄에서 첫 페이지 영역 조회를 모아 많이 요청된 순서로 top개.
+
+    cursor·검색·마커 투영·로그인 사용자 요청은 캐시 키가 다르거나 캐시를 쓰지 않으므로 뺀다.
+    """
+    counts: Counter = Counter()
+    for line in lines:
+        match = _BOUNDS_REQUEST.search(line)
+        if match is None:
+            continue
+        query = {name: values[-1] for name, values in parse_qs(match.group(1)).items()}
+        if query.keys() & {"cursor", "search", "current_user_id"} or query.get("fields", "full") != "full":
+            continue
+        if query.get("page", "1") != "1":
+            continue
+        try:
+            viewport = WarmupViewport(
+                float(query["north"]), float(query["south"]), float(query["east"]), float(query["west"]),
+                query.get("category"), int(query.get("limit", _WARMUP_LIMIT)),
+            )
+        except (KeyError, ValueError):
+            continue
+        counts[viewport] += 1
+    return [viewport for viewport, _ in counts.most_common(top)]
+
+
+def read_log_tail(path: str, max_bytes: int = _LOG_TAIL_BYTES) -> List[str]:
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            f.seek(max(f.tell() - max_bytes, 0))
+            return f.read().decode("utf-8", errors="replace").splitlines()
+    except OSError as e:
+        logger.warning(f"예열 요청 로그를 읽지 못함 ({path}): {e}")
+        return []
+
+
+async def popular_neighborhood_centers(supabase: QueryClient, top: int) -> List[Tuple[float, float]]:
+    """profiles.neighborhood에 가장 많이 등록된 동네 좌표(약 1km 단위) top개."""
+    response = await execute(
+        supabase.table("profiles")
+        .select("neighborhood")
+        .not_.is_("neighborhood", "null")
+        .limit(_NEIGHBORHOOD_SCAN_LIMIT)
+    )
+    counts: Counter = Counter()
+    for row in response.data or []:
+        neighborhood = row.get("neighborhood") or {}
+        try:
+            lat, lng = float(neighborhood["lat"]), float(neighborhood["lng"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        counts[(round(lat, _NEIGHBORHOOD_PRECISION), round(lng, _NEIGHBORHOOD_PRECISION))] += 1
+    return [center for center, _ in counts.most_common(top)]
+
+
+class MapCacheWarmup:
+    """시동 예열 실행과 준비 상태. 예열할 출처가 하나도 없으면 처음부터 준비 상태다."""
+
+    def __init__(
+        self,
+        report_service: ReportService,
+        supabase: QueryClient,
+        *,
+        centers: Sequence[Tuple[float, float]] = (),
+        neighborhoods: int = 0,
+        request_log: str = "",
+        concurrency: int = 4,
+        timeout_seconds: float = 60,
+        canonical_zoom: int = 0,
+        stale_while_revalidate_seconds: float = 0,
+    ) -> None:
+        self._report_service = report_service
+        self._supabase = supabase
+        self._centers = list(centers)
+        self._neighborhoods = neighborhoods
+        self._request_log = request_log
+        self._concurrency = max(concurrency, 1)
+        self._timeout_seconds = timeout_seconds
+        self._canonical_zoom = canonical_zoom
+        self._stale_while_revalidate_seconds = stale_while_revalidate_seconds
+        self._ready = not self.enabled
+        self._task: Optional["asyncio.Future"] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._centers or self._neighborhoods > 0 or self._request_log)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def outlives_warmup(self) -> bool:
+        """예열이 시간 제한까지 걸려도 처음 채운 항목이 준비 시점에 아직 응답 가능한가."""
+        return self._stale_while_revalidate_seconds >= self._timeout_seconds
+
+    def start(self) -> None:
+        """백그라운드로 예열을 시작한다. 끝나면(실패·시간 초과 포함) 준비 상태가 된다."""
+        if not self.enabled or self._task is not None:
+            return
+        if not self.outlives_warmup:
+            logger.warning(
+                f"지도 조회 캐시 stale-while-revalidate 구간({self._stale_while_revalidate_seconds}초)이 예열 시간 제한"
+                f"({self._timeout_seconds}초)보다 짧아 먼저 채운 예열 항목이 준비 전에 만료될 수 있음 — "
+                "MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS를 MAP_WARMUP_TIMEOUT_SECONDS 이상으로 설정하세요"
+            )
+        self._task = asyncio.ensure_future(self._run_until_ready())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run_until_ready(self) -> None:
+        try:
+            warmed = await asyncio.wait_for(self.run(), self._timeout_seconds)
+            logger.info(f"지도 조회 캐시 예열 완료: 뷰포트 {warmed}개")
+        except asyncio.TimeoutError:
+            logger.warning(f"지도 조회 캐시 예열이 {self._timeout_seconds}초 안에 끝나지 않아 준비 상태로 넘어감")
+        except Exception as e:
+            logger.warning(f"지도 조회 캐시 예열 실패, 준비 상태로 넘어감: {e}")
+        finally:
+            self._ready = True
+
+    async def viewports(self) -> List[WarmupViewport]:
+        """세 출처의 뷰포트를 중복 없이 (요청 로그 → 설정 격자 → 동네 순서로)."""
+        viewports: List[WarmupViewport] = []
+        if self._request_log:
+            viewports += viewports_from_request_log(read_log_tail(self._request_log))
+        centers = list(self._centers)
+        if self._neighborhoods > 0:
+            try:
+                centers += await popular_neighborhood_centers(self._supabase, self._neighborhoods)
+            except Exception as e:
+                logger.warning(f"예열용 동네 좌표 조회 실패: {e}")
+        for center in centers:
+            viewports += grid_viewports(center)
+        if self._canonical_zoom > 0:
+            viewports = [
+                viewport._replace(**dict(zip(
+                    ("north", "south", "east", "west"),
+                    align_to_tiles(viewport.north, viewport.south, viewport.east, viewport.west,
+                                   self._canonical_zoom),
+                )))
+                for viewport in viewports
+            ]
+        return list(dict.fromkeys(viewports))
+
+    async def run(self) -> int:
+        """뷰포트마다 영역 조회를 concurrency개씩 돌려 캐시를 채운다. 채운 뷰포트 수를 반환한다."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def warm(viewport: WarmupViewport) -> bool:
+            async with semaphore:
+                try:
+                    await self._report_service.get_reports_in_bounds(
+                        viewport.north, viewport.south, viewport.east, viewport.west,
+                        viewport.category, None, 1, viewport.limit,
+                    )
+                    return True
+                except Exception as e:
+                    logger.warning(f"예열 영역 조회 실패 ({viewport}): {e}")
+                    return False
+
+        results = await asyncio.gather(*(warm(viewport) for viewport in await self.viewports()))
+        return sum(results)
+
+
+map_cache_warmup = MapCacheWarmup(
+    report_service,
+    default_supabase,
+    centers=parse_centers(settings.MAP_WARMUP_CENTERS),
+    neighborhoods=settings.MAP_WARMUP_NEIGHBORHOODS,
+    request_log=settings.MAP_WARMUP_REQUEST_LOG,
+    concurrency=settings.MAP_WARMUP_CONCURRENCY,
+    timeout_seconds=settings.MAP_WARMUP_TIMEOUT_SECONDS,
+    canonical_zoom=settings.MAP_CANONICAL_BOUNDS_ZOOM,
+    stale_while_revalidate_seconds=settings.MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+)
@@ -1,9 +1,8 @@
 from fastapi import HTTPException, status
 from typing import Any, List, Dict
 from datetime import datetime, timezone
-from supabase.client import Client
 from app.schemas.comment import CommentCreate, CommentUpdate
-from app.db.supabase_client import supabase as default_supabase
+from app.db.supabase_client import QueryClient, query_client as default_supabase
 from app.services.user_directory import UNKNOWN_NICKNAME, fetch_profiles
 from app.utils.blocking_db import execute
 
@@ -14,7 +13,7 @@ class CommentService:
     댓글 변이는 지도 조회 캐시를 무효화하지 않는다(ADR-0001) — 캐시를 주입받지 않는다.
     """
 
-    def __init__(self, supabase: Client) -> None:
+    def __init__(self, supabase: QueryClient) -> None:
         self._supabase = supabase
 
     async def create_comment(
@@ -0,0 +1,529 @@
+"""지도 조회 캐시(`SpatialReportCache`)의 저장소 백엔드.
+
+`SpatialReportCache`는 키 조립·soft TTL·stale 구간·조회 영역 계산을 맡고, 항목을 실제로
+담고 버리는 일은 백엔드에 맡긴다. 백엔드는 `MapCacheBackend` 인터페이스를 따른다:
+
+- `MemoryMapCacheBackend`: 프로세스 내 TLRU 캐시 + 조회 영역 격자 색인. 기본값.
+- `SqliteMapCacheBackend`: 같은 호스트의 워커들이 공유하는 SQLite(WAL) 파일. 한 워커의
+  put·무효화가 (쓰기 스레드가 반영하는 즉시) 다른 워커에도 보이므로, gunicorn 워커 N개가
+  각자 캐시를 데우거나 서로의 무효화를 놓치지 않는다.
+
+항목은 (저장 시각, 값)이며, 만료 판단은 `SpatialReportCache`가 한다. 백엔드는
+`expires_at`이 지난 항목을 공간 회수 목적으로만 버린다. 조회 영역은 (north, south, east,
+west) 사각형이며 경계 여유는 호출자가 이미 더해서 넘긴다.
+"""
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Protocol, Set, Tuple
+
+from cachetools import LRUCache, TLRUCache
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 모든 종류(주변·영역과 그 응답 본문, 마커·묶음·격자·타일 8가지)를 합친 항목 수.
+# 종류별 몫은 따로 없고 LRU가 많이 쓰이는 종류에 자리를 준다.
+_MAXSIZE = 3000
+
+# (north, south, east, west)
+Footprint = Tuple[float, float, float, float]
+
+# 조회 영역 격자 셀 한 변(도). 이보다 많은 셀에 걸치는 넓은 조회 영역은 셀에 등록하지 않고
+# 모든 무효화에서 직접 확인한다.
+_CELL_DEGREES = 0.05
+_MAX_CELLS_PER_FOOTPRINT = 64
+
+
+class MapCacheBackend(Protocol):
+    @property
+    def generation(self) -> int: ...
+
+    def get(self, kind: str, key: Hashable) -> Optional[Tuple[float, Dict[str, Any]]]: ...
+
+    def put(
+        self,
+        kind: str,
+        key: Hashable,
+        value: Dict[str, Any],
+        *,
+        stored_at: float,
+        expires_at: float,
+        footprint: Footprint,
+    ) -> None: ...
+
+    def invalidate_locations(self, locations: Iterable[Dict[str, float]]) -> None: ...
+
+    def invalidate_all(self) -> None: ...
+
+
+class _FootprintIndex:
+    """캐시 항목 → 조회 영역. 좌표가 속한 격자 셀로 후보 항목을 좁힌다."""
+
+    def __init__(self) -> None:
+        self._footprints: Dict[Hashable, Footprint] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._wide: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._footprints)
+
+    def add(self, entry: Hashable, footprint: Footprint) -> None:
+        self.discard(entry)
+        self._footprints[entry] = footprint
+        cells = self._cells_of(footprint)
+        if cells is None:
+            self._wide.add(entry)
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(entry)
+
+    def discard(self, entry: Hashable) -> None:
+        footprint = self._footprints.pop(entry, None)
+        if footprint is None:
+            return
+        cells = self._cells_of(footprint)
+        if cells is None:
+            self._wide.discard(entry)
+            return
+        for cell in cells:
+            entries = self._cells.get(cell)
+            if entries is not None:
+                entries.discard(entry)
+                if not entries:
+                    del self._cells[cell]
+
+    def containing(self, lat: float, lng: float) -> List[Hashable]:
+        candidates = self._cells.get(self._cell_of(lat, lng), set()) | self._wide
+        return [
+            entry for entry in candidates
+            if self._contains(self._footprints[entry], lat, lng)
+        ]
+
+    def entries(self) -> List[Hashable]:
+        return list(self._footprints)
+
+    def clear(self) -> None:
+        self._footprints.clear()
+        self._cells.clear()
+        self._wide.clear()
+
+    @staticmethod
+    def _contains(footprint: Footprint, lat: float, lng: float) -> bool:
+        north, south, east, west = footprint
+        return south <= lat <= north and west <= lng <= east
+
+    @staticmethod
+    def _cell_of(lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / _CELL_DEGREES), math.floor(lng / _CELL_DEGREES))
+
+    def _cells_of(self, footprint: Footprint) -> Optional[List[Tuple[int, int]]]:
+        north, south, east, west = footprint
+        row_min, col_min = self._cell_of(south, west)
+        row_max, col_max = self._cell_of(north, east)
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > _MAX_CELLS_PER_FOOTPRINT:
+            return None
+        return [
+            (row, col)
+            for row in range(row_min, row_max + 1)
+            for col in range(col_min, col_max + 1)
+        ]
+
+
+class MemoryMapCacheBackend:
+    """프로세스 내 저장소. 항목마다 expires_at에 만료되는 TLRU 캐시."""
+
+    def __init__(self, *, timer: Callable[[], float], maxsize: int = _MAXSIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: TLRUCache = TLRUCache(
+            maxsize=maxsize,
+            ttu=_entry_expires_at,
+            timer=timer,
+        )
+        self._footprints = _FootprintIndex()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, kind: str, key: Hashable) -> Optional[Tuple[float, Dict[str, Any]]]:
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            return None
+        stored_at, _expires_at, value = entry
+        return stored_at, value
+
+    def put(
+        self,
+        kind: str,
+        key: Hashable,
+        value: Dict[str, Any],
+        *,
+        stored_at: float,
+        expires_at: float,
+        footprint: Footprint,
+    ) -> None:
+        self._entries[(kind, key)] = (stored_at, expires_at, value)
+        self._footprints.add((kind, key), footprint)
+        # 만료·maxsize 축출은 조회 영역 색인에 알리지 않으므로, 살아 있는 항목보다
+        # 눈에 띄게 커지면 사라진 항목을 걷어낸다.
+        if len(self._footprints) > 2 * len(self._entries) + self._maxsize:
+            for entry in self._footprints.entries():
+                if entry not in self._entries:
+                    self._footprints.discard(entry)
+
+    def invalidate_locations(self, locations: Iterable[Dict[str, float]]) -> None:
+        for location in locations:
+            for entry in self._footprints.containing(location["lat"], location["lng"]):
+                self._entries.pop(entry, None)
+                self._footprints.discard(entry)
+        self._generation += 1
+
+    def invalidate_all(self) -> None:
+        self._entries.clear()
+        self._footprints.clear()
+        self._generation += 1
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS map_query_cache (
+    kind TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    north REAL NOT NULL,
+    south REAL NOT NULL,
+    east REAL NOT NULL,
+    west REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, cache_key)
+);
+CREATE INDEX IF NOT EXISTS map_query_cache_expires_at ON map_query_cache (expires_at);
+CREATE TABLE IF NOT EXISTS map_query_cache_meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO map_query_cache_meta (name, value) VALUES ('generation', 0);
+"""
+
+# put 이 횟수마다 만료 항목 회수와 maxsize 정리를 한 번 한다.
+_SQLITE_SWEEP_EVERY = 100
+# 이벤트 루프에서 하는 읽기의 busy timeout(초). WAL 읽기는 쓰기를 기다리지 않으므로 드문 잠금만
+# 해당하며, 넘기면 miss로 본다.
+_SQLITE_READ_TIMEOUT = 0.05
+# 쓰기 스레드의 busy timeout(초). 다른 워커와의 쓰기 경합은 이 스레드만 기다린다.
+_SQLITE_WRITE_TIMEOUT = 5.0
+# generation과 hit한 항목을 SQLite에서 다시 읽는 간격(초). 그 사이에는 메모리에 둔 값을 쓴다 —
+# 다른 워커의 무효화·put은 최대 이만큼 늦게 보이고, 이 프로세스의 쓰기는 바로 보인다.
+_SQLITE_REFRESH_SECONDS = 0.1
+
+
+class SqliteMapCacheBackend:
+    """같은 호스트의 프로세스들이 공유하는 SQLite 파일 저장소.
+
+    읽기(get·generation)는 호출한 스레드에서 짧은 busy timeout으로 하고, 쓰기(put·무효화·정리)는
+    프로세스마다 쓰기 스레드 하나에 순서대로 넘긴다 — 워커 간 쓰기 경합이 이벤트 루프를 멈추지 않는다.
+    generation은 `_SQLITE_REFRESH_SECONDS`에 한 번만 읽고, hit한 항목도 그동안 메모리에 두고 쓴다 —
+    single-flight 키마다 generation을 묻는 miss와 인기 키의 hit가 매번 SQLite를 읽지 않는다.
+    아직 반영되지 않은 이 프로세스의 쓰기는 메모리에 남겨 읽기에 겹쳐 보인다: 대기 중인 put은
+    hit로, 대기 중인 무효화가 덮는 항목은 miss로, 대기 중인 무효화 수만큼 generation을 더한다.
+    쓰기 실패(잠금이 쓰기 timeout을 넘김 등)는 기록만 하고, 그 항목은 TTL로 사라진다.
+
+    연결과 쓰기 스레드는 프로세스마다 지연 생성한다 — gunicorn이 fork한 뒤 첫 사용에서 열린다.
+    값은 JSON으로 저장하므로 get은 매번 새 객체를 돌려준다. 캐시이므로 내구성은
+    필요 없어 `synchronous=OFF`로 둔다. 항목 시각은 호출자의 timer 기준이므로, 공유하는
+    프로세스들은 같은 시계(기본 time.monotonic은 호스트 전체에서 같다)를 써야 한다.
+    """
+
+    def __init__(
+        self, path: str, *, maxsize: int = _MAXSIZE, timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._path = path
+        self._maxsize = maxsize
+        self._timer = timer
+        self._pid: Optional[int] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writes: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._puts = 0
+        # 마지막으로 읽은 db generation에 그 뒤 COMMIT한 이 프로세스의 무효화를 더한 값.
+        self._db_generation = 0
+        self._generation_read_at = -math.inf
+        # 최근 hit: (kind, cache_key) → (읽은 시각, stored_at, 직렬화된 값)
+        self._recent: LRUCache = LRUCache(maxsize=maxsize)
+        # 이 프로세스의 put·무효화나 다른 워커의 무효화마다 증가한다. 그 전에 시작한 읽기는 _recent에 넣지 않는다.
+        self._epoch = 0
+        # (kind, cache_key) → (token, stored_at, 직렬화된 값, footprint)
+        self._pending_puts: Dict[Tuple[str, str], Tuple[object, float, str, Footprint]] = {}
+        # 대기 중인 무효화. None은 전체 무효화, 아니면 (lat, lng) 목록.
+        self._pending_invalidations: List[Tuple[object, Optional[List[Tuple[float, float]]]]] = []
+
+    @property
+    def generation(self) -> int:
+        self._ensure_process()
+        now = self._timer()
+        if now - self._generation_read_at >= _SQLITE_REFRESH_SECONDS:
+            self._generation_read_at = now
+            self._read_generation()
+        # 무효화의 COMMIT, 대기 목록 제거, _db_generation 증가는 같은 잠금 안에서 한다(_invalidate) —
+        # 반영된 무효화를 두 번 세거나 빠뜨리지 않는다.
+        with self._lock:
+            return self._db_generation + len(self._pending_invalidations)
+
+    def get(self, kind: str, key: Hashable) -> Optional[Tuple[float, Dict[str, Any]]]:
+        self._ensure_process()
+        entry = (kind, repr(key))
+        now = self._timer()
+        with self._lock:
+            pending = self._pending_puts.get(entry)
+            recent = self._recent.get(entry)
+            invalidations = [locations for _, locations in self._pending_invalidations]
+            epoch = self._epoch
+        if pending is not None:
+            _token, stored_at, value, _footprint = pending
+            return stored_at, json.loads(value)
+        if recent is not None and now - recent[0] < _SQLITE_REFRESH_SECONDS:
+            _read_at, stored_at, value = recent
+            return stored_at, json.loads(value)
+        try:
+            row = self._reader_connection().execute(
+                "SELECT stored_at, north, south, east, west, value FROM map_query_cache"
+                " WHERE kind = ? AND cache_key = ?",
+                entry,
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        if row is None or _covered_by(row[1:5], invalidations):
+            return None
+        with self._lock:
+            if self._epoch == epoch:
+                self._recent[entry] = (now, row[0], row[5])
+        return row[0], json.loads(row[5])
+
+    def put(
+        self,
+        kind: str,
+        key: Hashable,
+        value: Dict[str, Any],
+        *,
+        stored_at: float,
+        expires_at: float,
+        footprint: Footprint,
+    ) -> None:
+        self._ensure_process()
+        entry = (kind, repr(key))
+        encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        token = object()
+        with self._lock:
+            self._pending_puts[entry] = (token, stored_at, encoded, footprint)
+            self._recent.pop(entry, None)
+            self._epoch += 1
+
+        def write(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT OR REPLACE INTO map_query_cache"
+                " (kind, cache_key, stored_at, expires_at, north, south, east, west, value)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*entry, stored_at, expires_at, *footprint, encoded),
+            )
+
+        def done() -> None:
+            if self._pending_puts.get(entry, (None,))[0] is token:
+                del self._pending_puts[entry]
+
+        self._submit(write, done)
+        self._puts += 1
+        if self._puts % _SQLITE_SWEEP_EVERY == 0:
+            self._submit(lambda conn: self._sweep(conn, stored_at), lambda: None)
+
+    def invalidate_locations(self, locations: Iterable[Dict[str, float]]) -> None:
+        points = [(location["lat"], location["lng"]) for location in locations]
+
+        def write(conn: sqlite3.Connection) -> None:
+            for lat, lng in points:
+                conn.execute(
+                    "DELETE FROM map_query_cache"
+                    " WHERE south <= :lat AND :lat <= north AND west <= :lng AND :lng <= east",
+                    {"lat": lat, "lng": lng},
+                )
+
+        self._invalidate(write, points)
+
+    def invalidate_all(self) -> None:
+        def write(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM map_query_cache")
+
+        self._invalidate(write, None)
+
+    def flush(self) -> None:
+        """지금까지 넘긴 쓰기가 모두 반영될 때까지 기다린다 (종료·테스트용, 이벤트 루프에서 부르지 말 것)."""
+        self._ensure_process()
+        self._write_thread().submit(lambda: None).result()
+
+    def _invalidate(
+        self,
+        write: Callable[[sqlite3.Connection], None],
+        points: Optional[List[Tuple[float, float]]],
+    ) -> None:
+        self._ensure_process()
+        token = object()
+        with self._lock:
+            self._pending_invalidations.append((token, points))
+            self._recent.clear()
+            self._epoch += 1
+            # 이미 넘긴 put은 쓰기 스레드에서 이 무효화보다 먼저 반영되고 곧 지워진다.
+            for entry, (_token, _stored_at, _value, footprint) in list(self._pending_puts.items()):
+                if _covered_by(footprint, [points]):
+                    del self._pending_puts[entry]
+
+        def done() -> None:
+            self._pending_invalidations[:] = [
+                pending for pending in self._pending_invalidations if pending[0] is not token
+            ]
+
+        def committed() -> None:
+            done()
+            self._db_generation += 1
+
+        def invalidate(conn: sqlite3.Connection) -> None:
+            with _transaction(conn, lock=self._lock, on_commit=committed):
+                write(conn)
+                self._bump_generation(conn)
+
+        # 실패해도 _submit이 대기 목록에서 지운다 — 이미 지웠다면 아무것도 하지 않는다.
+        self._submit(invalidate, done)
+
+    def _submit(self, write: Callable[[sqlite3.Connection], None], done: Callable[[], None]) -> None:
+        def run() -> None:
+            try:
+                write(self._writer_connection())
+            except sqlite3.Error as e:
+                logger.warning(f"지도 조회 캐시 SQLite 쓰기 실패: {e}")
+            finally:
+                with self._lock:
+                    done()
+
+        self._write_thread().submit(run)
+
+    def _ensure_process(self) -> None:
+        """fork한 프로세스의 첫 사용이면 읽기 연결과 쓰기 스레드를 새로 만든다."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            self._pending_puts.clear()
+            self._pending_invalidations.clear()
+            self._recent.clear()
+            self._epoch += 1
+        self._generation_read_at = -math.inf
+        self._writer = None
+        self._writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-cache-sqlite")
+        # 스키마는 쓰기 스레드가 만든다. 그 전의 읽기는 테이블이 없어 miss다.
+        self._writes.submit(self._writer_connection)
+        self._reader = sqlite3.connect(
+            self._path, timeout=_SQLITE_READ_TIMEOUT, isolation_level=None, check_same_thread=False,
+        )
+        self._pid = pid
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        if self._writer is None:
+            conn = sqlite3.connect(
+                self._path, timeout=_SQLITE_WRITE_TIMEOUT, isolation_level=None, check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            with _transaction(conn):
+                for statement in _SQLITE_SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+            self._writer = conn
+        return self._writer
+
+    def _reader_connection(self) -> sqlite3.Connection:
+        assert self._reader is not None, "_ensure_process opens the reader"
+        return self._reader
+
+    def _write_thread(self) -> ThreadPoolExecutor:
+        assert self._writes is not None, "_ensure_process starts the write thread"
+        return self._writes
+
+    def _read_generation(self) -> None:
+        try:
+            row = self._reader_connection().execute(
+                "SELECT value FROM map_query_cache_meta WHERE name = 'generation'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return
+        if row is None:
+            return
+        with self._lock:
+            # 읽는 동안 이 프로세스의 무효화가 COMMIT해 _db_generation이 이미 앞섰을 수 있다 — 큰 쪽만 쓴다.
+            # 커졌다면 다른 워커가 무효화했으므로 최근 hit도 버린다.
+            if row[0] > self._db_generation:
+                self._db_generation = row[0]
+                self._recent.clear()
+                self._epoch += 1
+
+    @staticmethod
+    def _bump_generation(conn: sqlite3.Connection) -> None:
+        conn.execute("UPDATE map_query_cache_meta SET value = value + 1 WHERE name = 'generation'")
+
+    def _sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        with _transaction(conn):
+            conn.execute("DELETE FROM map_query_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM map_query_cache WHERE rowid IN ("
+                " SELECT rowid FROM map_query_cache ORDER BY stored_at"
+                " LIMIT max(0, (SELECT COUNT(*) FROM map_query_cache) - ?))",
+                (self._maxsize,),
+            )
+
+
+def _entry_expires_at(_key: Hashable, entry: Tuple[float, float, Dict[str, Any]], _now: float) -> float:
+    return entry[1]
+
+
+def _covered_by(
+    footprint: Footprint,
+    invalidations: Iterable[Optional[List[Tuple[float, float]]]],
+) -> bool:
+    """조회 영역이 대기 중인 무효화(None은 전체) 중 하나에 걸리면 참."""
+    north, south, east, west = footprint
+    for points in invalidations:
+        if points is None:
+            return True
+        if any(south <= lat <= north and west <= lng <= east for lat, lng in points):
+            return True
+    return False
+
+
+@contextmanager
+def _transaction(
+    conn: sqlite3.Connection,
+    *,
+    lock: Optional[threading.Lock] = None,
+    on_commit: Optional[Callable[[], None]] = None,
+) -> Iterator[None]:
+    """autocommit 연결 위의 명시적 쓰기 트랜잭션. 다른 프로세스와의 쓰기 경합은 busy timeout이 기다린다.
+
+    lock을 주면 COMMIT과 on_commit을 그 잠금 안에서 한다. 쓰기 잠금은 BEGIN IMMEDIATE에서 이미
+    잡았으므로 COMMIT은 다른 프로세스를 기다리지 않는다.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    with lock if lock is not None else nullcontext():
+        conn.execute("COMMIT")
+        if on_commit is not None:
+            on_commit()
@@ -0,0 +1,51 @@
+"""영역 조회(Bounds Query) 예측 선조회 후보.
+
+영역 조회 직후 사용자는 대개 다음 페이지를 요청하거나 옆 지역으로 지도를 옮긴다.
+`ReportService`는 응답을 돌려준 뒤 여기서 고른 후보를 백그라운드로 캐시에 미리 채운다.
+
+후보 순서가 곧 우선순위다: 다음 페이지 → 상하좌우로 한 뷰포트만큼 옮긴 영역 → 대각선 영역.
+옮긴 영역은 원래 뷰포트와 같은 크기이므로, 정규화된 URL(`MAP_CANONICAL_BOUNDS_ZOOM`)이나
+타일 모드(`BOUNDS_TILE_ZOOM`)에서 실제 이동과 같은 캐시 항목으로 떨어진다.
+"""
+from typing import List, NamedTuple
+
+
+class PrefetchTarget(NamedTuple):
+    north: float
+    south: float
+    east: float
+    west: float
+    page: int
+
+
+# (위도 방향, 경도 방향) 뷰포트 단위 이동. 변을 맞댄 이웃이 먼저다.
+_RING = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def bounds_prefetch_targets(
+    north: float,
+    south: float,
+    east: float,
+    west: float,
+    page: int,
+    limit: int,
+    total_count: int,
+) -> List[PrefetchTarget]:
+    """방금 응답한 영역 조회 다음에 올 법한 조회들. 위경도 범위를 벗어나는 이웃은 뺀다."""
+    targets = []
+    if page * limit < total_count:
+        targets.append(PrefetchTarget(north, south, east, west, page + 1))
+
+    lat_span = north - south
+    lng_span = east - west
+    for dy, dx in _RING:
+        target = PrefetchTarget(
+            north + dy * lat_span,
+            south + dy * lat_span,
+            east + dx * lng_span,
+            west + dx * lng_span,
+            1,
+        )
+        if target.north <= 90.0 and target.south >= -90.0 and target.east <= 180.0 and target.west >= -180.0:
+            targets.append(target)
+    return targets
@@ -0,0 +1,83 @@
+"""근접 그룹(Proximity Group) 계산 (ADR-0008).
+
+프론트엔드 `computeProximityGroups`(frontend/src/features/map/domain/proximityGrouping.ts)와
+같은 시드 기반 그리디 규칙이다: 목록 순서대로 아직 그룹에 속하지 않은 제보를 시드로 삼아,
+시드로부터 30m 이내인 제보만 같은 그룹에 편입한다. 체인(전이적 연결)은 하지 않는다.
+
+프론트엔드는 모든 쌍을 비교한다(O(n²)). 여기서는 반경보다 큰 위경도 격자 셀로 공간 해시를
+만들어, 시드 주변 3×3 셀 안의 후보만 거리를 잰다. 그룹 구성과 멤버 순서는 같다.
+"""
+import math
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.utils.geo import EARTH_RADIUS_METERS, haversine_distances
+
+PROXIMITY_GROUP_RADIUS_METERS = 30
+
+# 격자 셀을 반경보다 조금 크게 잡아, 셀 경계·경도 축척 근사 때문에 이웃 셀 밖의 후보를 놓치지 않게 한다.
+_CELL_MARGIN = 1.01
+
+
+def compute_proximity_groups(
+    items: Sequence[Dict[str, Any]],
+    radius_meters: float = PROXIMITY_GROUP_RADIUS_METERS,
+) -> List[Dict[str, Any]]:
+    """`location`({"lat", "lng"})이 채워진 제보 목록의 근접 그룹.
+
+    그룹은 {"id": "proximity-<시드 id>", "center": 멤버 좌표 평균, "memberIds": [시드, ...]}이며
+    멤버는 목록 순서를 따른다.
+    """
+    if not items:
+        return []
+
+    lats = [float(r["location"]["lat"]) for r in items]
+    lngs = [float(r["location"]["lng"]) for r in items]
+
+    # 경도 셀은 목록에서 가장 고위도(경도 1도가 가장 짧은 곳) 기준으로 잡는다.
+    lat_cell = math.degrees(radius_meters / EARTH_RADIUS_METERS) * _CELL_MARGIN
+    min_cos = max(min(math.cos(math.radians(lat)) for lat in lats), 1e-6)
+    lng_cell = lat_cell / min_cos
+
+    cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    cell_of = []
+    for i, (lat, lng) in enumerate(zip(lats, lngs)):
+        cell = (math.floor(lat / lat_cell), math.floor(lng / lng_cell))
+        cells[cell].append(i)
+        cell_of.append(cell)
+
+    assigned = [False] * len(items)
+    groups: List[Dict[str, Any]] = []
+    for i, seed in enumerate(items):
+        if assigned[i]:
+            continue
+        assigned[i] = True
+
+        cy, cx = cell_of[i]
+        candidates = sorted(
+            j
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            for j in cells.get((cy + dy, cx + dx), ())
+            if j > i and not assigned[j]
+        )
+        distances = haversine_distances(
+            lats[i], lngs[i], [lats[j] for j in candidates], [lngs[j] for j in candidates]
+        )
+
+        members = [i]
+        for j, distance in zip(candidates, distances):
+            if distance <= radius_meters:
+                assigned[j] = True
+                members.append(j)
+
+        groups.append({
+            "id": f"proximity-{seed['id']}",
+            "center": {
+                "lat": sum(lats[m] for m in members) / len(members),
+                "lng": sum(lngs[m] for m in members) / len(members),
+            },
+            "memberIds": [items[m]["id"] for m in members],
+        })
+
+    return groups
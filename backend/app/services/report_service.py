@@ -1,36 +1,83 @@
 from fastapi import HTTPException, status
-from typing import Any, List, Optional, Dict
-from supabase.client import Client
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, List, Optional, Dict, Set, Tuple, TypedDict
 from app.schemas.report import ReportCreate, ReportStatus
 from app.schemas.spatial_query import RadiusQueryParams, BoundsQueryParams
-from app.services.spatial_report_cache import SpatialReportCache
-from app.utils.wkb_parser import convert_wkb_to_location
+from app.services.map_cache_backends import SqliteMapCacheBackend
+from app.services.map_prefetch import PrefetchTarget, bounds_prefetch_targets
+from app.services.proximity_groups import compute_proximity_groups
+from app.services.spatial_report_cache import SpatialReportCache, StaleEntry
+from app.services.bounds_tiles import Tile, snap_to_tiles, tile_span, tiles_covering
+from app.services.report_spatial_index import ReportSpatialIndex
+from app.utils.geo import haversine_distances
+from app.utils.wkb_parser import convert_wkb_to_location, parse_wkb_point, parse_wkb_points
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.db.supabase_client import supabase as default_supabase
+from app.db.asyncpg_map_queries import AsyncpgMapQueries, direct_map_queries
+from app.db.supabase_client import QueryClient, query_client as default_supabase
+import asyncio
+import heapq
 import math
-from app.utils.blocking_db import execute
+import re
+from app.utils.blocking_db import db_executor, execute
+from app.utils.cursor import decode_report_cursor, encode_report_cursor
+from app.utils.page_body import encode_page_body, patch_user_voted
+from app.utils.single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
-
-def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """
-    Calculate distance between two points using Haversine formula.
-    Returns distance in meters.
-    """
-    R = 6371000  # Earth radius in meters
-
-    lat1_rad, lng1_rad = math.radians(lat1), math.radians(lng1)
-    lat2_rad, lng2_rad = math.radians(lat2), math.radians(lng2)
-
-    dlat = lat2_rad - lat1_rad
-    dlng = lng2_rad - lng1_rad
-
-    a = (math.sin(dlat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return R * c
+# 타일 모드 영역 조회: 한 타일은 이 건수까지만 한 번에 가져온다. 더 많으면 타일 조립이
+# 정확한 페이지를 만들 수 없으므로 뷰포트 단위 RPC로 되돌아간다.
+_TILE_FETCH_LIMIT = 500
+# 이보다 많은 타일이 필요한 넓은 뷰포트는 타일 RPC 팬아웃보다 뷰포트 RPC 1회가 싸다.
+_MAX_TILES_PER_VIEWPORT = 16
+_HEX_PATTERN = re.compile(r"[0-9A-Fa-f]+")
+
+# 공간 인덱스 적재·동기화 시 한 번에 읽는 행 수 (PostgREST 기본 max-rows와 같다).
+_INDEX_LOAD_BATCH = 1000
+# 전체 적재는 id(UUID) 첫 16진수 자리로 나눈 구간을 동시에 keyset으로 읽는다 — 왕복이 구간 수만큼 겹친다.
+_INDEX_LOAD_PARTITIONS = [
+    (f"{prefix}0000000-0000-0000-0000-000000000000", f"{upper}0000000-0000-0000-0000-000000000000" if upper else None)
+    for prefix, upper in zip("0123456789abcdef", [*"123456789abcdef", None])
+]
+
+# 선조회는 DB 실행기 스레드가 이 비율 이상 놀고 있을 때만 한다 — 대기열이 생기기 전에 물러나
+# 포그라운드 요청의 입장 자리(503 한도)를 차지하지 않는다.
+_PREFETCH_MIN_IDLE_SHARE = 0.25
+
+# 스트리밍 조회가 keyset RPC 한 번에 읽는 행 수. 응답 크기와 무관하게 메모리에는 이만큼만 있다.
+_STREAM_CHUNK = 500
+
+
+# 지도 조회 캐시 키 인자. 캐시 get/put과 _load_*에 그대로 풀어 넘기고, values()는 single-flight 키가 된다.
+class _NearbyParams(TypedDict):
+    lat: float
+    lng: float
+    radius_km: float
+    category: Optional[str]
+    search: Optional[str]
+    page: int
+    limit: int
+
+
+class _BoundsParams(TypedDict):
+    north: float
+    south: float
+    east: float
+    west: float
+    category: Optional[str]
+    search: Optional[str]
+    page: int
+    limit: int
+
+
+class _GridParams(TypedDict):
+    north: float
+    south: float
+    east: float
+    west: float
+    zoom: int
+    category: Optional[str]
+    search: Optional[str]
 
 
 def parse_location(location_data: Any) -> Dict[str, float]:
@@ -50,7 +97,7 @@ def parse_location(location_data: Any) -> Dict[str, float]:
         loc_str = str(location_data)
 
         # Case 1: WKB Hex String
-        if len(loc_str) > 20 and all(c in '0123456789ABCDEFabcdef' for c in loc_str):
+        if len(loc_str) > 20 and _HEX_PATTERN.fullmatch(loc_str):
             return convert_wkb_to_location(loc_str)
 
         # Case 2: PostGIS "POINT(lng lat)" String
@@ -88,43 +135,317 @@ def enrich_report_data(report: Dict[str, Any]) -> Dict[str, Any]:
     return report
 
 
+def enrich_reports(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    enrich_report_data for a whole page. WKB locations are decoded together in one
+    parse_wkb_points pass; rows it cannot decode go through parse_location as before.
+    """
+    wkb_rows = [
+        r for r in reports
+        if isinstance(r.get("location"), str) and len(r["location"]) > 20 and "(" not in r["location"]
+    ]
+    coords = parse_wkb_points([r["location"] for r in wkb_rows])
+    for r, point in zip(wkb_rows, coords):
+        if point is not None:
+            lng, lat = point
+            r["location"] = {"lat": lat, "lng": lng}
+
+    for r in reports:
+        enrich_report_data(r)
+    return reports
+
+
+def build_page(items: List[Dict[str, Any]], total_count: int, page: int, limit: int) -> Dict[str, Any]:
+    """OFFSET 페이지 응답. 뒤에 행이 더 있으면 마지막 항목으로 nextCursor를 만든다."""
+    has_more = (page - 1) * limit + len(items) < total_count
+    return {
+        "items": items,
+        "totalCount": total_count,
+        "totalPages": math.ceil(total_count / limit) if limit > 0 else 1,
+        "page": page,
+        "limit": limit,
+        "nextCursor": _next_cursor(items) if has_more else None,
+    }
+
+
+def build_cursor_page(rows: List[Dict[str, Any]], total_count: int, limit: int) -> Dict[str, Any]:
+    """keyset 페이지 응답. rows는 limit + 1건까지 받아 다음 페이지가 있는지 판단한다."""
+    items = rows[:limit]
+    return {
+        "items": items,
+        "totalCount": total_count,
+        "totalPages": math.ceil(total_count / limit) if limit > 0 else 1,
+        "page": None,
+        "limit": limit,
+        "nextCursor": _next_cursor(items) if len(rows) > limit else None,
+    }
+
+
+def _next_cursor(items: List[Dict[str, Any]]) -> Optional[str]:
+    if not items or not items[-1].get("created_at"):
+        return None
+    return encode_report_cursor(items[-1])
+
+
+def to_marker(report: Dict[str, Any]) -> Dict[str, Any]:
+    """enrich된 제보 행의 마커 투영 (get_report_markers_in_bounds_page 행과 같은 모양)."""
+    location = report["location"]
+    return {
+        "id": report["id"],
+        "lat": round(location["lat"], 6),
+        "lng": round(location["lng"], 6),
+        "category": report.get("category"),
+        "status": report.get("status"),
+        "created_at": report.get("created_at"),
+        "vote_count": report.get("vote_count", 0),
+        "comment_count": report.get("comment_count", 0),
+    }
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        return decode_report_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _known_location(location_data: Any) -> Optional[Dict[str, float]]:
+    """parse_location과 같은 형식을 읽되, 읽을 수 없으면 기본 좌표 대신 None."""
+    if isinstance(location_data, dict) and "lat" in location_data:
+        return {"lat": float(location_data["lat"]), "lng": float(location_data["lng"])}
+    if not isinstance(location_data, str):
+        return None
+    if len(location_data) > 20 and _HEX_PATTERN.fullmatch(location_data):
+        coords = parse_wkb_point(location_data)
+        return {"lat": coords[1], "lng": coords[0]} if coords else None
+    if "POINT(" in location_data:
+        try:
+            lng, lat = location_data.replace("POINT(", "").replace(")", "").split()
+            return {"lat": float(lat), "lng": float(lng)}
+        except ValueError:
+            return None
+    return None
+
+
+def invalidate_map_caches(cache: SpatialReportCache, reports: Iterable[Dict[str, Any]]) -> None:
+    """변이된 제보 행(변경 전·후)의 좌표를 포함하는 지도 조회 캐시 항목만 무효화한다 (ADR-0011).
+
+    좌표를 알 수 없는 행이 하나라도 있으면 전체 무효화로 되돌아간다.
+    """
+    locations = []
+    for report in reports:
+        location = _known_location(report.get("location"))
+        if location is None:
+            cache.invalidate_all()
+            return
+        locations.append(location)
+    cache.invalidate_locations(locations)
+
+
+def build_grid(zoom: int, cells: List[Dict[str, Any]], total_count: int) -> Dict[str, Any]:
+    """격자 집계 응답. cells는 get_report_grid_in_bounds RPC/ReportSpatialIndex.aggregate_bounds 모양."""
+    return {
+        "zoom": zoom,
+        "cellDegrees": tile_span(zoom),
+        "cells": [
+            {
+                "x": c["x"],
+                "y": c["y"],
+                "count": c["count"],
+                "center": {"lat": c["lat"], "lng": c["lng"]},
+                "categories": c["categories"],
+            }
+            for c in cells
+        ],
+        "totalCount": total_count,
+    }
+
+
+def _db_has_prefetch_headroom() -> bool:
+    return db_executor.idle_workers >= db_executor.workers * _PREFETCH_MIN_IDLE_SHARE
+
+
+def _log_failed_index_sync(done: "asyncio.Future") -> None:
+    if not done.cancelled() and done.exception() is not None:
+        logger.warning(f"공간 인덱스 동기화 실패: {done.exception()}")
+
+
+def _log_failed_revalidation(key: Tuple[Hashable, ...], done: "asyncio.Future") -> None:
+    if not done.cancelled() and done.exception() is not None:
+        logger.warning(f"지도 조회 백그라운드 갱신 실패 ({key[0]}): {done.exception()}")
+
+
 class ReportService:
-    """제보 CRUD + 지도 조회(Map Query). 캐시 무효화 정책은 ADR-0001, 주입 관용구는 ADR-0002."""
+    """제보 CRUD + 지도 조회(Map Query). 캐시 무효화 정책은 ADR-0011, 주입 관용구는 ADR-0002."""
 
     def __init__(
         self,
-        supabase: Client,
+        supabase: QueryClient,
         cache: SpatialReportCache,
         *,
         bounds_rpc_name: str = "get_reports_in_bounds_page",
+        bounds_tile_zoom: Optional[int] = None,
+        spatial_index: Optional[ReportSpatialIndex] = None,
+        cache_response_bodies: bool = False,
+        prefetch_budget: int = 0,
+        direct_queries: Optional[AsyncpgMapQueries] = None,
     ) -> None:
         self._supabase = supabase
         self._cache = cache
         self._bounds_rpc_name = bounds_rpc_name
+        # None이면 영역·반경 페이지 RPC도 PostgREST로 부른다 (app/db/asyncpg_map_queries.py)
+        self._direct_queries = direct_queries
+        # None이면 타일 모드를 쓰지 않는다 (app.services.bounds_tiles)
+        self._bounds_tile_zoom = bounds_tile_zoom
+        # None이면 지도 조회는 항상 RPC(+캐시)로 간다 (app.services.report_spatial_index)
+        self._spatial_index = spatial_index
+        self._spatial_index_lock = asyncio.Lock()
+        self._spatial_index_sync: Optional["asyncio.Future"] = None
+        # True면 캐시에 넣는 주변·영역 조회 결과의 응답 본문도 함께 저장한다 (app/utils/page_body.py)
+        self._cache_response_bodies = cache_response_bodies
+        # 동시에 도는 영역 조회 선조회 수 상한. 0이면 선조회하지 않는다 (app/services/map_prefetch.py)
+        self._prefetch_budget = prefetch_budget
+        self._prefetches: Set["asyncio.Future"] = set()
+        # 같은 캐시 키의 동시 miss는 RPC 하나를 공유한다 (app/utils/single_flight.py).
+        # 키에 캐시 세대를 넣어, 무효화 이후의 miss가 무효화 이전에 시작된 조회에 합류하지 않게 한다.
+        self._single_flight = SingleFlight()
 
     @property
     def cache(self) -> SpatialReportCache:
         """지도 조회 캐시. admin 기본 인스턴스가 무효화 경로를 공유하기 위한 composition seam."""
         return self._cache
 
-    async def _apply_user_voted(self, items: List[Dict[str, Any]], current_user_id: str) -> List[Dict[str, Any]]:
-        """Helper to batch-apply user_voted status to a list of reports."""
-        if not items:
-            return items
-
-        report_ids = [r["id"] for r in items]
+    @property
+    def spatial_index(self) -> Optional[ReportSpatialIndex]:
+        """공간 인덱스. admin 기본 인스턴스가 변이 경로를 공유하기 위한 composition seam."""
+        return self._spatial_index
+
+    async def _ready_spatial_index(self) -> ReportSpatialIndex:
+        """적재된 공간 인덱스. 첫 적재만 기다리고, 그 뒤 동기화는 백그라운드에서 돈다.
+
+        동기화가 도는 동안과 실패한 뒤에도 요청은 현재 인덱스로 응답한다.
+        """
+        index = self._spatial_index
+        assert index is not None
+        if not index.loaded:
+            async with self._spatial_index_lock:
+                if not index.loaded:
+                    await self._load_spatial_index(index)
+            return index
+
+        if index.is_stale() and (self._spatial_index_sync is None or self._spatial_index_sync.done()):
+            self._spatial_index_sync = asyncio.ensure_future(self._sync_spatial_index(index))
+            self._spatial_index_sync.add_done_callback(_log_failed_index_sync)
+        return index
+
+    async def _load_spatial_index(self, index: ReportSpatialIndex) -> None:
+        """전체 적재. 행 변환·격자 구성은 스레드에서 새 인덱스로 만들어 바꿔 끼운다.
+
+        버전을 먼저 읽으므로 적재 중에 바뀐 행은 곧이은 델타 동기화가 다시 반영한다. tombstone floor
+        아래의 삭제는 전체 행에 이미 반영돼 있으므로 버전은 floor 밑으로 내려가지 않는다.
+        """
+        version = max(await self._latest_change_version(), await self._tombstone_floor())
+        rows = await self._fetch_all_reports()
+        fresh = await asyncio.to_thread(lambda: index.prepare(enrich_reports(rows)))
+        index.install(fresh, version)
+        await self._sync_spatial_index(index)
+
+    async def _sync_spatial_index(self, index: ReportSpatialIndex) -> None:
+        """index.version 이후 바뀐 행과 tombstone을 읽어 반영한다 — 다른 워커의 변이와 카운터 변화.
+
+        행을 tombstone보다 먼저 읽는다 (ReportSpatialIndex.apply_changes 참고). index.version 이후의
+        tombstone이 보존 기간이 지나 지워졌으면(prune_report_tombstones) 델타로는 삭제를 알 수 없어
+        전체를 다시 적재한다.
+        """
+        since = index.version
+        if since < await self._tombstone_floor():
+            await self._load_spatial_index(index)
+            return
+        changed = await self._fetch_after_version("reports", "*", since)
+        removed = await self._fetch_after_version("report_tombstones", "change_version, report_id", since)
+        index.apply_changes(enrich_reports(changed), removed)
+
+    async def _latest_change_version(self) -> int:
+        res = await execute(
+            self._supabase.table("reports")
+            .select("change_version")
+            .order("change_version", desc=True)
+            .limit(1)
+        )
+        rows = res.data or []
+        return int(rows[0]["change_version"]) if rows else 0
+
+    async def _tombstone_floor(self) -> int:
+        res = await execute(self._supabase.table("report_tombstone_floor").select("version").limit(1))
+        rows = res.data or []
+        return int(rows[0]["version"]) if rows else 0
+
+    async def _fetch_after_version(self, table: str, columns: str, since: int) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        while True:
+            res = await execute(
+                self._supabase.table(table)
+                .select(columns)
+                .gt("change_version", since)
+                .order("change_version")
+                .limit(_INDEX_LOAD_BATCH)
+            )
+            batch = res.data or []
+            rows.extend(batch)
+            if len(batch) < _INDEX_LOAD_BATCH:
+                return rows
+            since = batch[-1]["change_version"]
+
+    async def _fetch_all_reports(self) -> List[Dict[str, Any]]:
+        partitions = await asyncio.gather(
+            *(self._fetch_report_partition(lower, upper) for lower, upper in _INDEX_LOAD_PARTITIONS)
+        )
+        return [row for rows in partitions for row in rows]
+
+    async def _fetch_report_partition(self, lower: str, upper: Optional[str]) -> List[Dict[str, Any]]:
+        """lower <= id < upper 구간의 제보를 id 순 keyset으로 (OFFSET 없이) 읽는다."""
+        rows: List[Dict[str, Any]] = []
+        after: Optional[str] = None
+        while True:
+            query = self._supabase.table("reports").select("*")
+            query = query.gte("id", lower) if after is None else query.gt("id", after)
+            if upper is not None:
+                query = query.lt("id", upper)
+            res = await execute(query.order("id").limit(_INDEX_LOAD_BATCH))
+            batch = res.data or []
+            rows.extend(batch)
+            if len(batch) < _INDEX_LOAD_BATCH:
+                return rows
+            after = batch[-1]["id"]
+
+    async def _voted_ids(self, report_ids: List[str], current_user_id: str) -> Set[str]:
         votes_res = await execute(self._supabase.table("votes") \
             .select("report_id") \
             .eq("user_id", current_user_id) \
             .in_("report_id", report_ids))
+        return {v["report_id"] for v in votes_res.data}
+
+    async def _apply_user_voted(self, items: List[Dict[str, Any]], current_user_id: str) -> List[Dict[str, Any]]:
+        """Helper to batch-apply user_voted status to a list of reports."""
+        if not items:
+            return items
 
-        voted_ids = {v["report_id"] for v in votes_res.data}
+        voted_ids = await self._voted_ids([r["id"] for r in items], current_user_id)
 
         for r in items:
             r["user_voted"] = r["id"] in voted_ids
 
         return items
 
+    async def _patched_body(self, entry: Optional[Dict[str, Any]], current_user_id: Optional[str]) -> Optional[bytes]:
+        """캐시된 응답 본문(app/utils/page_body.py)에 user_voted를 덧씌운 바이트. 본문이 없으면 None."""
+        if entry is None:
+            return None
+        body = entry["body"].encode()
+        if current_user_id and entry["ids"]:
+            body = patch_user_voted(body, await self._voted_ids(entry["ids"], current_user_id))
+        return body
+
     async def _overlay_user_voted(self, result: Dict[str, Any], current_user_id: Optional[str]) -> Dict[str, Any]:
         """Return a copy of a cached anonymous result with user_voted applied on top."""
         if not (current_user_id and result["items"]):
@@ -143,9 +464,10 @@ class ReportService:
         status: Optional[str] = None,
         user_id: Optional[str] = None,
         search: Optional[str] = None,
-        current_user_id: Optional[str] = None
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """List reports using RPC for efficiency (N+1 fix)."""
+        """List reports using RPC for efficiency (N+1 fix). With `cursor`, page by keyset instead of page."""
         # 1. Count Total
         count_params = {
             "category_filter": category,
@@ -157,15 +479,22 @@ class ReportService:
         total_count = count_res.data or 0
 
         # 2. Fetch Page
-        rpc_params = {
-            "category_filter": category,
-            "status_filter": status,
-            "user_id_filter": user_id,
-            "search_query": search,
-            "result_page": page,
-            "result_limit": limit
-        }
-        response = await execute(self._supabase.rpc("get_reports_paginated", rpc_params))
+        if cursor is not None:
+            after_created_at, after_id = _decode_cursor(cursor)
+            rpc_params = {
+                **count_params,
+                "after_created_at": after_created_at,
+                "after_id": after_id,
+                "result_limit": limit + 1
+            }
+            response = await execute(self._supabase.rpc("get_reports_paginated_after", rpc_params))
+        else:
+            rpc_params = {
+                **count_params,
+                "result_page": page,
+                "result_limit": limit
+            }
+            response = await execute(self._supabase.rpc("get_reports_paginated", rpc_params))
         reports = response.data or []
 
         # 3. Batch lookup user_voted if authenticated
@@ -179,21 +508,76 @@ class ReportService:
             user_voted_ids = {v["report_id"] for v in votes_res.data}
 
         # 4. Enrich and Merge
-        items = []
         for r in reports:
             r["user_voted"] = r["id"] in user_voted_ids
-            items.append(enrich_report_data(r))
+        items = enrich_reports(reports)
 
-        total_pages = math.ceil(total_count / limit) if limit > 0 else 1
+        if cursor is not None:
+            return build_cursor_page(items, total_count, limit)
+        return build_page(items, total_count, page, limit)
 
-        return {
-            "items": items,
-            "totalCount": total_count,
-            "totalPages": total_pages,
-            "page": page,
-            "limit": limit
+    def _stream_after(
+        self,
+        fetch: Callable[[Optional[str], Optional[str], int], Awaitable[List[Dict[str, Any]]]],
+        limit: int,
+        cursor: Optional[str],
+        current_user_id: Optional[str],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """keyset RPC(fetch)를 _STREAM_CHUNK건씩 넘기며 enrich된 항목을 limit건까지 하나씩 내보낸다.
+
+        cursor는 스트림을 시작하기 전에 해석한다 — 잘못된 cursor는 응답 헤더 전에 400이 된다.
+        """
+        start = _decode_cursor(cursor) if cursor is not None else (None, None)
+
+        async def items() -> AsyncIterator[Dict[str, Any]]:
+            after_created_at, after_id = start
+            remaining = limit
+            while remaining > 0:
+                size = min(_STREAM_CHUNK, remaining)
+                rows = await fetch(after_created_at, after_id, size)
+                if not rows:
+                    return
+                chunk = enrich_reports(rows)
+                if current_user_id:
+                    await self._apply_user_voted(chunk, current_user_id)
+                for item in chunk:
+                    yield item
+                if len(rows) < size:
+                    return
+                remaining -= len(rows)
+                after_created_at, after_id = rows[-1]["created_at"], rows[-1]["id"]
+
+        return items()
+
+    def stream_reports(
+        self,
+        limit: int,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        user_id: Optional[str] = None,
+        search: Optional[str] = None,
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """list_reports의 스트리밍 모드: cursor 이후(없으면 처음부터) limit건까지, 총 건수 없이."""
+        filter_params = {
+            "category_filter": category,
+            "status_filter": status,
+            "user_id_filter": user_id,
+            "search_query": search,
         }
 
+        async def fetch(after_created_at, after_id, size):
+            response = await execute(self._supabase.rpc("get_reports_paginated_after", {
+                **filter_params,
+                "after_created_at": after_created_at,
+                "after_id": after_id,
+                "result_limit": size,
+            }))
+            return response.data or []
+
+        return self._stream_after(fetch, limit, cursor, current_user_id)
+
     async def create_report(
         self,
         report_in: ReportCreate,
@@ -225,7 +609,9 @@ class ReportService:
             "lng": report_in.location.lng
         }
 
-        self._cache.invalidate_all()
+        invalidate_map_caches(self._cache, [created_report])
+        if self._spatial_index is not None:
+            self._spatial_index.upsert(enrich_report_data(dict(created_report)))
 
         return created_report
 
@@ -238,16 +624,104 @@ class ReportService:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
-        current_user_id: Optional[str] = None
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get reports near a specific location with caching."""
-        cache_params = dict(lat=lat, lng=lng, radius_km=radius_km, category=category,
-                            search=search, page=page, limit=limit)
+        """Get reports near a specific location with caching.
+
+        With `cursor`, the page after that cursor is fetched by keyset, bypassing the cache and spatial index.
+        """
+        if cursor is not None:
+            result = await self._nearby_after(
+                lat=lat, lng=lng, radius_km=radius_km, category=category,
+                search=search, cursor=cursor, limit=limit,
+            )
+            return await self._overlay_user_voted(result, current_user_id)
+
+        if self._spatial_index is not None and search is None:
+            index = await self._ready_spatial_index()
+            indexed, total_count = index.query_radius(
+                lat=lat, lng=lng, radius_meters=radius_km * 1000, category=category,
+                offset=(page - 1) * limit, limit=limit,
+            )
+            for r in indexed:
+                r["distance_km"] = round(r["distance_meters"] / 1000, 2)
+            result = build_page(indexed, total_count, page, limit)
+            return await self._overlay_user_voted(result, current_user_id)
+
+        cache_params = _NearbyParams(lat=lat, lng=lng, radius_km=radius_km, category=category,
+                                     search=search, page=page, limit=limit)
 
         cached = self._cache.get_nearby(**cache_params)
         if cached is not None:
             return await self._overlay_user_voted(cached, current_user_id)
 
+        result = await self._load_or_serve_stale(
+            ("nearby", self._cache.generation, *cache_params.values()),
+            lambda: self._load_nearby(**cache_params),
+            self._cache.get_stale_nearby(**cache_params),
+        )
+        return await self._overlay_user_voted(result, current_user_id)
+
+    async def get_cached_nearby_body(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float = 3.0,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 50,
+        current_user_id: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """get_nearby_reports의 캐시 히트를 인코딩된 JSON 본문으로. 신선한 본문이 없으면 None."""
+        if not self._cache_response_bodies or (self._spatial_index is not None and search is None):
+            return None
+        entry = self._cache.get_nearby_body(lat=lat, lng=lng, radius_km=radius_km, category=category,
+                                            search=search, page=page, limit=limit)
+        return await self._patched_body(entry, current_user_id)
+
+    async def _load_or_serve_stale(
+        self,
+        key: Tuple[Hashable, ...],
+        load: Callable[[], Awaitable[Dict[str, Any]]],
+        stale: Optional[StaleEntry],
+    ) -> Dict[str, Any]:
+        """캐시 miss 처리 (app/services/spatial_report_cache.py의 stale 구간 참고).
+
+        stale-while-revalidate 구간이면 stale 값을 즉시 반환하고 같은 single-flight 키로
+        백그라운드 재조회를 건다. 그 밖에는 조회를 기다리되, 실패하면 남아 있는 stale 값으로 응답한다.
+        """
+        if stale is not None and stale.revalidate:
+            if not self._single_flight.in_flight(key):
+                self._single_flight.start(key, load).add_done_callback(
+                    lambda done: _log_failed_revalidation(key, done)
+                )
+            return stale.value
+
+        try:
+            return await self._single_flight.do(key, load)
+        except Exception as e:
+            if stale is None:
+                raise
+            logger.warning(f"지도 조회 실패, stale 캐시로 응답 ({key[0]}): {e}")
+            return stale.value
+
+    async def _load_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Cache miss path of get_nearby_reports: count + page RPCs, then cache the anonymous result."""
+        cache_params = _NearbyParams(lat=lat, lng=lng, radius_km=radius_km, category=category,
+                                     search=search, page=page, limit=limit)
+
         radius_meters = radius_km * 1000
         query_params = RadiusQueryParams(
             target_lat=lat,
@@ -257,35 +731,98 @@ class ReportService:
             search_query=search,
         )
 
-        # 1. Count Total
+        nearby_reports, total_count = await self._radius_page(query_params, (page - 1) * limit, limit)
+
+        for r in nearby_reports:
+            r["distance_km"] = round(r.get("distance_meters", 0) / 1000, 2)
+        items = enrich_reports(nearby_reports)
+        result = build_page(items, total_count, page, limit)
+
+        self._cache.put_nearby(**cache_params, value=result)
+        if self._cache_response_bodies:
+            self._cache.put_nearby_body(**cache_params, value=encode_page_body(result))
+        return result
+
+    async def _radius_page(
+        self,
+        query_params: RadiusQueryParams,
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """반경 조회 한 페이지의 (행, 총 건수): count + page RPC."""
+        if self._direct_queries is not None:
+            direct = self._direct_queries
+            return await db_executor.run_async(
+                lambda: direct.radius_page(query_params.for_count(), query_params.for_get(offset, limit))
+            )
+
         count_res = await execute(self._supabase.rpc("count_reports_within_radius", query_params.for_count()))
         total_count = count_res.data if count_res.data is not None else 0
-
-        # 2. Fetch Page
-        offset = (page - 1) * limit
         response = await execute(self._supabase.rpc(
             "get_reports_within_radius", query_params.for_get(offset, limit)
         ))
-        nearby_reports = response.data or []
+        return response.data or [], total_count
 
-        # 3. Enrich and Merge
-        items = []
-        for r in nearby_reports:
+    async def _nearby_after(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        cursor: str,
+        limit: int,
+    ) -> Dict[str, Any]:
+        after_created_at, after_id = _decode_cursor(cursor)
+        query_params = RadiusQueryParams(
+            target_lat=lat,
+            target_lng=lng,
+            radius_meters=radius_km * 1000,
+            category_filter=category,
+            search_query=search,
+        )
+        count_res = await execute(self._supabase.rpc("count_reports_within_radius", query_params.for_count()))
+        total_count = count_res.data if count_res.data is not None else 0
+
+        response = await execute(self._supabase.rpc(
+            "get_reports_within_radius_after", query_params.for_get_after(after_created_at, after_id, limit + 1)
+        ))
+        rows = response.data or []
+        for r in rows:
             r["distance_km"] = round(r.get("distance_meters", 0) / 1000, 2)
-            items.append(enrich_report_data(r))
+        return build_cursor_page(enrich_reports(rows), total_count, limit)
 
-        total_pages = math.ceil(total_count / limit) if limit > 0 else 1
-        result = {
-            "items": items,
-            "totalCount": total_count,
-            "totalPages": total_pages,
-            "page": page,
-            "limit": limit
-        }
+    def stream_nearby_reports(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        limit: int,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """get_nearby_reports의 스트리밍 모드. 캐시를 쓰지 않는다."""
+        query_params = RadiusQueryParams(
+            target_lat=lat,
+            target_lng=lng,
+            radius_meters=radius_km * 1000,
+            category_filter=category,
+            search_query=search,
+        )
 
-        self._cache.put_nearby(**cache_params, value=result)
+        async def fetch(after_created_at, after_id, size):
+            response = await execute(self._supabase.rpc(
+                "get_reports_within_radius_after", query_params.for_get_after(after_created_at, after_id, size)
+            ))
+            rows = response.data or []
+            for r in rows:
+                r["distance_km"] = round(r.get("distance_meters", 0) / 1000, 2)
+            return rows
 
-        return await self._overlay_user_voted(result, current_user_id)
+        return self._stream_after(fetch, limit, cursor, current_user_id)
 
     async def get_reports_in_bounds(
         self,
@@ -297,68 +834,537 @@ class ReportService:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 100,
-        current_user_id: Optional[str] = None
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: str = "full",
     ) -> Dict[str, Any]:
-        """Get reports within map bounds with caching."""
-        cache_params = dict(north=north, south=south, east=east, west=west,
-                            category=category, search=search, page=page, limit=limit)
+        """Get reports within map bounds with caching.
+
+        With `cursor`, the page after that cursor is fetched by keyset, bypassing the cache, tiles and spatial index.
+        With `fields="marker"`, items are marker projections (see to_marker) instead of full rows.
+        """
+        if fields == "marker":
+            return await self._get_markers_in_bounds(
+                north=north, south=south, east=east, west=west, category=category,
+                search=search, page=page, limit=limit, cursor=cursor,
+            )
+
+        if cursor is not None:
+            after_created_at, after_id = _decode_cursor(cursor)
+            query_params = BoundsQueryParams(
+                north=north, south=south, east=east, west=west,
+                category_filter=category,
+                search_query=search,
+            )
+            response = await execute(self._supabase.rpc(
+                "get_reports_in_bounds_after", query_params.for_get_after(after_created_at, after_id, limit + 1)
+            ))
+            payload = response.data or {}
+            result = build_cursor_page(
+                enrich_reports(payload.get("items") or []), payload.get("total_count") or 0, limit
+            )
+            return await self._overlay_user_voted(result, current_user_id)
+
+        if self._spatial_index is not None and search is None:
+            index = await self._ready_spatial_index()
+            indexed, total_count = index.query_bounds(
+                north=north, south=south, east=east, west=west, category=category,
+                offset=(page - 1) * limit, limit=limit,
+            )
+            result = build_page(indexed, total_count, page, limit)
+            return await self._overlay_user_voted(result, current_user_id)
+
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
 
         cached = self._cache.get_bounds(**cache_params)
         if cached is not None:
             return await self._overlay_user_voted(cached, current_user_id)
 
+        result = await self._load_or_serve_stale(
+            ("bounds", self._cache.generation, *cache_params.values()),
+            lambda: self._load_bounds(**cache_params),
+            self._cache.get_stale_bounds(**cache_params),
+        )
+        self._schedule_bounds_prefetch(result["totalCount"], **cache_params)
+        return await self._overlay_user_voted(result, current_user_id)
+
+    def _schedule_bounds_prefetch(
+        self,
+        total_count: int,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> None:
+        """캐시 miss로 응답한 영역 조회의 다음 페이지·이웃 영역을 백그라운드로 캐시에 채운다.
+
+        동시에 도는 선조회는 prefetch_budget개까지이고, 예산이 차 있거나 DB 실행기에 여유가 없으면
+        이번 선조회는 건너뛴다 — 선조회가 포그라운드 요청의 스레드 풀·RPC 자리를 잠식하지 않는다.
+        캐시 히트 응답은 선조회하지 않는다 (이미 선조회로 채워진 영역일 가능성이 크다).
+        """
+        if len(self._prefetches) >= self._prefetch_budget or not _db_has_prefetch_headroom():
+            return
+        targets = bounds_prefetch_targets(north, south, east, west, page, limit, total_count)
+        prefetch = asyncio.ensure_future(
+            self._prefetch_bounds(targets, category=category, search=search, limit=limit)
+        )
+        self._prefetches.add(prefetch)
+        prefetch.add_done_callback(self._prefetches.discard)
+
+    async def _prefetch_bounds(
+        self,
+        targets: List[PrefetchTarget],
+        *,
+        category: Optional[str],
+        search: Optional[str],
+        limit: int,
+    ) -> None:
+        """후보를 우선순위 순서로 하나씩 채운다. 이미 캐시에 있거나 조회 중인 후보는 건너뛴다.
+
+        포그라운드 miss와 같은 single-flight 키를 쓰므로, 선조회 중인 영역을 사용자가 요청하면
+        그 조회에 합류한다. 실패하거나 DB 실행기의 여유가 줄면 남은 후보는 버린다.
+        """
+        for target in targets:
+            if not _db_has_prefetch_headroom():
+                return
+            cache_params = _BoundsParams(north=target.north, south=target.south, east=target.east, west=target.west,
+                                         category=category, search=search, page=target.page, limit=limit)
+            key = ("bounds", self._cache.generation, *cache_params.values())
+            if self._cache.get_bounds(**cache_params) is not None or self._single_flight.in_flight(key):
+                continue
+            try:
+                await self._single_flight.do(key, lambda: self._load_bounds(**cache_params))
+            except Exception as e:
+                logger.warning(f"지도 조회 선조회 실패 (bounds): {e}")
+                return
+
+    def stream_reports_in_bounds(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        limit: int,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        current_user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: str = "full",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """get_reports_in_bounds의 스트리밍 모드. 캐시·타일·공간 인덱스를 쓰지 않는다.
+
+        청크마다 영역 전체를 다시 세지 않도록 총 건수 없는 get_report_rows_in_bounds_after를 쓴다.
+        """
         query_params = BoundsQueryParams(
             north=north, south=south, east=east, west=west,
             category_filter=category,
             search_query=search,
         )
 
-        offset = (page - 1) * limit
+        async def fetch(after_created_at, after_id, size):
+            response = await execute(self._supabase.rpc(
+                "get_report_rows_in_bounds_after", query_params.for_get_after(after_created_at, after_id, size)
+            ))
+            return response.data or []
+
+        items = self._stream_after(fetch, limit, cursor, None if fields == "marker" else current_user_id)
+        if fields != "marker":
+            return items
+
+        async def markers() -> AsyncIterator[Dict[str, Any]]:
+            async for item in items:
+                yield to_marker(item)
+
+        return markers()
+
+    async def get_cached_bounds_body(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 100,
+        current_user_id: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """get_reports_in_bounds의 캐시 히트를 인코딩된 JSON 본문으로. 신선한 본문이 없으면 None."""
+        if not self._cache_response_bodies or (self._spatial_index is not None and search is None):
+            return None
+        entry = self._cache.get_bounds_body(north=north, south=south, east=east, west=west,
+                                            category=category, search=search, page=page, limit=limit)
+        return await self._patched_body(entry, current_user_id)
+
+    async def _load_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Cache miss path of get_reports_in_bounds: tiles or the page RPC, then cache the anonymous result."""
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
+
+        result = None
+        if self._bounds_tile_zoom is not None:
+            result = await self._compose_bounds_from_tiles(**cache_params, zoom=self._bounds_tile_zoom)
+
+        if result is None:
+            query_params = BoundsQueryParams(
+                north=north, south=south, east=east, west=west,
+                category_filter=category,
+                search_query=search,
+            )
+
+            payload = await self._bounds_page(query_params, (page - 1) * limit, limit)
+            bounded_reports = payload.get("items") or []
+            total_count = payload.get("total_count") or 0
+
+            result = build_page(enrich_reports(bounded_reports), total_count, page, limit)
+
+        self._cache.put_bounds(**cache_params, value=result)
+        if self._cache_response_bodies:
+            self._cache.put_bounds_body(**cache_params, value=encode_page_body(result))
+        return result
+
+    async def _bounds_page(self, query_params: BoundsQueryParams, offset: int, limit: int) -> Dict[str, Any]:
+        """영역 조회 페이지 RPC(bounds_rpc_name)의 {items, total_count}."""
+        if self._direct_queries is not None:
+            direct = self._direct_queries
+            return await db_executor.run_async(
+                lambda: direct.bounds_page(self._bounds_rpc_name, query_params.for_get(offset, limit))
+            )
+
         response = await execute(self._supabase.rpc(
             self._bounds_rpc_name, query_params.for_get(offset, limit)
         ))
+        return response.data or {}
+
+    async def _get_markers_in_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        cursor: Optional[str],
+    ) -> Dict[str, Any]:
+        """fields=marker 영역 조회. 마커에는 user_voted가 없으므로 사용자별 오버레이도 없다.
+
+        OFFSET 페이지는 마커 전용 RPC(get_report_markers_in_bounds_page)와 별도 캐시 항목을 쓴다.
+        cursor 페이지와 공간 인덱스 경로는 full 행을 투영한다.
+        """
+        if cursor is not None or (self._spatial_index is not None and search is None):
+            result = await self.get_reports_in_bounds(
+                north, south, east, west, category, search, page, limit, cursor=cursor,
+            )
+            return {**result, "items": [to_marker(r) for r in result["items"]]}
+
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
+
+        cached = self._cache.get_bounds_markers(**cache_params)
+        if cached is not None:
+            return cached
+
+        return await self._load_or_serve_stale(
+            ("bounds_markers", self._cache.generation, *cache_params.values()),
+            lambda: self._load_bounds_markers(**cache_params),
+            self._cache.get_stale_bounds_markers(**cache_params),
+        )
+
+    async def _load_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
+
+        query_params = BoundsQueryParams(
+            north=north, south=south, east=east, west=west,
+            category_filter=category,
+            search_query=search,
+        )
+        response = await execute(self._supabase.rpc(
+            "get_report_markers_in_bounds_page", query_params.for_get((page - 1) * limit, limit)
+        ))
         payload = response.data or {}
-        bounded_reports = payload.get("items") or []
-        total_count = payload.get("total_count") or 0
+        result = build_page(payload.get("items") or [], payload.get("total_count") or 0, page, limit)
+
+        self._cache.put_bounds_markers(**cache_params, value=result)
+        return result
+
+    async def get_grouped_reports_in_bounds(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 100,
+        current_user_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """get_reports_in_bounds 페이지에 근접 그룹(ADR-0008)을 붙인 응답.
+
+        그룹은 페이지의 items로 계산하며 익명 결과와 함께 캐시된다 — 같은 뷰포트는 한 번만 계산한다.
+        """
+        if self._spatial_index is not None and search is None:
+            result = await self.get_reports_in_bounds(
+                north, south, east, west, category, search, page, limit,
+            )
+            result = {**result, "groups": compute_proximity_groups(result["items"])}
+            return await self._overlay_user_voted(result, current_user_id)
+
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
+
+        cached = self._cache.get_bounds_groups(**cache_params)
+        if cached is not None:
+            return await self._overlay_user_voted(cached, current_user_id)
+
+        result = await self._load_or_serve_stale(
+            ("bounds_groups", self._cache.generation, *cache_params.values()),
+            lambda: self._load_bounds_groups(**cache_params),
+            self._cache.get_stale_bounds_groups(**cache_params),
+        )
+        return await self._overlay_user_voted(result, current_user_id)
+
+    async def _load_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Cache miss path of get_grouped_reports_in_bounds: the (cached) bounds page, grouped once."""
+        cache_params = _BoundsParams(north=north, south=south, east=east, west=west,
+                                     category=category, search=search, page=page, limit=limit)
+
+        bounds = await self.get_reports_in_bounds(north, south, east, west, category, search, page, limit)
+        result = {**bounds, "groups": compute_proximity_groups(bounds["items"])}
+
+        self._cache.put_bounds_groups(**cache_params, value=result)
+        return result
+
+    async def get_report_grid_in_bounds(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """축소된 지도용 격자 집계: 셀마다 제보 수·중심 좌표·카테고리별 수.
+
+        셀은 `zoom` 타일 격자(app.services.bounds_tiles)이며, 요청 영역은 셀 경계까지 넓혀
+        잘린 셀 없이 집계한다 — 조금씩 다른 뷰포트도 같은 캐시 항목을 쓴다. user_voted가 없으므로
+        응답은 사용자와 무관하다.
+        """
+        north, south, east, west = snap_to_tiles(north, south, east, west, zoom)
+
+        if self._spatial_index is not None and search is None:
+            index = await self._ready_spatial_index()
+            cells, total_count = index.aggregate_bounds(
+                north=north, south=south, east=east, west=west, category=category,
+                cell_degrees=tile_span(zoom),
+            )
+            return build_grid(zoom, cells, total_count)
+
+        cache_params = _GridParams(north=north, south=south, east=east, west=west,
+                                   zoom=zoom, category=category, search=search)
+
+        cached = self._cache.get_bounds_grid(**cache_params)
+        if cached is not None:
+            return cached
 
-        items = []
-        for r in bounded_reports:
-            items.append(enrich_report_data(r))
+        return await self._load_or_serve_stale(
+            ("bounds_grid", self._cache.generation, *cache_params.values()),
+            lambda: self._load_bounds_grid(**cache_params),
+            self._cache.get_stale_bounds_grid(**cache_params),
+        )
 
-        total_pages = math.ceil(total_count / limit) if limit > 0 else 1
-        result = {
+    async def _load_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Dict[str, Any]:
+        query_params = BoundsQueryParams(
+            north=north, south=south, east=east, west=west,
+            category_filter=category,
+            search_query=search,
+        )
+        response = await execute(self._supabase.rpc(
+            "get_report_grid_in_bounds", query_params.for_grid(tile_span(zoom))
+        ))
+        payload = response.data or {}
+        result = build_grid(zoom, payload.get("cells") or [], payload.get("total_count") or 0)
+
+        self._cache.put_bounds_grid(north=north, south=south, east=east, west=west,
+                                    zoom=zoom, category=category, search=search, value=result)
+        return result
+
+    async def get_report_changes_in_bounds(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        since_version: int,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 500,
+        current_user_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """델타 동기화: since_version 이후 영역 안에서 바뀐 제보와 사라진 제보 id.
+
+        응답마다 달라 캐시·타일·공간 인덱스를 쓰지 않는다. 클라이언트는 deletedIds를 먼저 지우고
+        items를 upsert한 뒤, 다음 요청에 version을 since_version으로 보낸다. reset이면 since_version
+        이후의 tombstone이 보존 기간이 지나 지워졌다 — 영역을 다시 읽고 version부터 이어 받는다.
+        """
+        query_params = BoundsQueryParams(
+            north=north, south=south, east=east, west=west,
+            category_filter=category,
+            search_query=search,
+        )
+        response = await execute(self._supabase.rpc(
+            "get_report_changes_in_bounds", query_params.for_changes(since_version, limit)
+        ))
+        payload = response.data or {}
+        items = enrich_reports(payload.get("items") or [])
+        if current_user_id:
+            items = await self._apply_user_voted(items, current_user_id)
+        return {
             "items": items,
-            "totalCount": total_count,
-            "totalPages": total_pages,
-            "page": page,
-            "limit": limit
+            "deletedIds": payload.get("deleted_ids") or [],
+            "version": payload.get("version") or since_version,
+            "hasMore": bool(payload.get("has_more")),
+            "reset": bool(payload.get("reset")),
         }
 
-        self._cache.put_bounds(**cache_params, value=result)
+    async def _fetch_bounds_tile(
+        self,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Dict[str, Any]:
+        """타일 하나의 제보 전체를 가져와 캐시한다. complete=False면 _TILE_FETCH_LIMIT에서 잘렸다."""
+        cached = self._cache.get_bounds_tile(tile=tile, category=category, search=search)
+        if cached is not None:
+            return cached
 
-        return await self._overlay_user_voted(result, current_user_id)
+        return await self._load_or_serve_stale(
+            ("bounds_tile", self._cache.generation, tile, category, search),
+            lambda: self._load_bounds_tile(tile, category, search),
+            self._cache.get_stale_bounds_tile(tile=tile, category=category, search=search),
+        )
 
-    async def get_report_by_id(self, report_id: str, current_user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get a single report by ID."""
-        # Use select with count to get vote/comment counts in one go
-        res = await execute(self._supabase.table("reports").select("*, votes(count), comments(count)").eq("id", report_id))
-        if not res.data:
+    async def _load_bounds_tile(
+        self,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Dict[str, Any]:
+        query_params = BoundsQueryParams(
+            north=tile.north, south=tile.south, east=tile.east, west=tile.west,
+            category_filter=category,
+            search_query=search,
+        )
+        payload = await self._bounds_page(query_params, 0, _TILE_FETCH_LIMIT)
+        items = enrich_reports(payload.get("items") or [])
+        total_count = payload.get("total_count") or 0
+
+        value = {"items": items, "complete": total_count <= len(items)}
+        self._cache.put_bounds_tile(tile=tile, category=category, search=search, value=value)
+        return value
+
+    async def _compose_bounds_from_tiles(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        zoom: int,
+    ) -> Optional[Dict[str, Any]]:
+        """zoom 타일 결과를 합쳐 요청 영역으로 잘라낸 페이지. 조립할 수 없으면 None."""
+        tiles = tiles_covering(north, south, east, west, zoom=zoom)
+        if len(tiles) > _MAX_TILES_PER_VIEWPORT:
             return None
 
-        report = res.data[0]
+        tile_results = await asyncio.gather(
+            *(self._fetch_bounds_tile(tile, category, search) for tile in tiles)
+        )
+        if not all(t["complete"] for t in tile_results):
+            return None
 
-        # Flatten counts from Supabase response
-        if "votes" in report and isinstance(report["votes"], list) and len(report["votes"]) > 0:
-            report["vote_count"] = report["votes"][0].get("count", 0)
-        elif "votes" in report and isinstance(report["votes"], dict):
-            report["vote_count"] = report["votes"].get("count", 0)
+        # 타일 경계 위의 점은 양쪽 타일에 모두 들어오므로 id로 중복을 제거한다.
+        matched: Dict[str, Dict[str, Any]] = {}
+        for tile_result in tile_results:
+            for r in tile_result["items"]:
+                loc = r["location"]
+                if south <= loc["lat"] <= north and west <= loc["lng"] <= east:
+                    matched[r["id"]] = r
+
+        ordered = sorted(
+            matched.values(),
+            key=lambda r: (r.get("created_at") or "", r["id"]),
+            reverse=True,
+        )
+        offset = (page - 1) * limit
+        return build_page(ordered[offset:offset + limit], len(ordered), page, limit)
 
-        if "comments" in report and isinstance(report["comments"], list) and len(report["comments"]) > 0:
-            report["comment_count"] = report["comments"][0].get("count", 0)
-        elif "comments" in report and isinstance(report["comments"], dict):
-            report["comment_count"] = report["comments"].get("count", 0)
+    async def get_report_by_id(self, report_id: str, current_user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get a single report by ID."""
+        # vote_count/comment_count are counter columns on reports (20261016_report_counters.sql)
+        res = await execute(self._supabase.table("reports").select("*").eq("id", report_id))
+        if not res.data:
+            return None
 
-        report = enrich_report_data(report)
+        report = enrich_report_data(res.data[0])
 
         if current_user_id:
             votes_res = await execute(self._supabase.table("votes").select("id").eq("report_id", report_id).eq("user_id", current_user_id))
@@ -374,7 +1380,7 @@ class ReportService:
     ) -> Optional[Dict[str, Any]]:
         """Update a report's data."""
         # Ownership check
-        existing = await execute(self._supabase.table("reports").select("user_id").eq("id", report_id).single())
+        existing = await execute(self._supabase.table("reports").select("user_id, location").eq("id", report_id).single())
         if not existing.data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
 
@@ -385,9 +1391,12 @@ class ReportService:
         if not res.data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Update failed")
 
-        self._cache.invalidate_all()
+        invalidate_map_caches(self._cache, [existing.data, res.data[0]])
 
-        return enrich_report_data(res.data[0])
+        updated = enrich_report_data(res.data[0])
+        if self._spatial_index is not None:
+            self._spatial_index.upsert(dict(updated), keep_counters=True)
+        return updated
 
     async def delete_report(
         self,
@@ -395,7 +1404,7 @@ class ReportService:
         current_user_id: str
     ) -> None:
         """Delete a report."""
-        existing = await execute(self._supabase.table("reports").select("user_id").eq("id", report_id).single())
+        existing = await execute(self._supabase.table("reports").select("user_id, location").eq("id", report_id).single())
         if not existing.data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
 
@@ -404,7 +1413,9 @@ class ReportService:
 
         await execute(self._supabase.table("reports").delete().eq("id", report_id))
 
-        self._cache.invalidate_all()
+        invalidate_map_caches(self._cache, [existing.data])
+        if self._spatial_index is not None:
+            self._spatial_index.remove(report_id)
 
     async def benchmark_nearby_rest_python(
         self,
@@ -412,34 +1423,58 @@ class ReportService:
         lng: float,
         radius_km: float = 3.0,
         category: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        scan_limit: int = 2000
     ) -> List[Dict[str, Any]]:
-        """[V1 Benchmark] Pure REST + Python Haversine calculation."""
+        """[V1 Benchmark] Pure REST + Python Haversine calculation.
+
+        scan_limit rows are fetched and measured in one batched haversine pass.
+        """
         query = self._supabase.table("reports").select("*")
         if category:
             query = query.eq("category", category)
 
-        res = await execute(query.limit(2000))
+        res = await execute(query.limit(scan_limit))
         all_reports = res.data
 
         radius_meters = radius_km * 1000
-        nearby_reports = []
-
-        for report in all_reports:
-            parsed_loc = parse_location(report.get("location"))
-            report["location"] = parsed_loc
 
-            dist = calculate_distance(lat, lng, parsed_loc["lat"], parsed_loc["lng"])
-            if dist <= radius_meters:
-                report["distance"] = dist
-                report["distance_km"] = round(dist / 1000, 2)
-                report["vote_count"] = 0
-                report["comment_count"] = 0
-                report["user_voted"] = False
-                nearby_reports.append(report)
+        enrich_reports(all_reports)
+        lats = [report["location"]["lat"] for report in all_reports]
+        lngs = [report["location"]["lng"] for report in all_reports]
 
-        nearby_reports.sort(key=lambda x: x.get("distance", float('inf')))
-        return nearby_reports[:limit]
+        distances = haversine_distances(lat, lng, lats, lngs)
+        within = [i for i, dist in enumerate(distances) if dist <= radius_meters]
+        # 반경 안 전체를 정렬하지 않고 가장 가까운 limit개만 고른다 (동거리는 조회 순서 유지).
+        nearest = heapq.nsmallest(limit, within, key=distances.__getitem__)
 
-
-report_service = ReportService(default_supabase, SpatialReportCache())
+        nearby_reports = []
+        for i in nearest:
+            report = all_reports[i]
+            dist = distances[i]
+            report["distance"] = dist
+            report["distance_km"] = round(dist / 1000, 2)
+            report["vote_count"] = 0
+            report["comment_count"] = 0
+            report["user_voted"] = False
+            nearby_reports.append(report)
+
+        return nearby_reports
+
+
+report_service = ReportService(
+    default_supabase,
+    SpatialReportCache(
+        stale_while_revalidate_seconds=settings.MAP_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+        stale_if_error_seconds=settings.MAP_CACHE_STALE_IF_ERROR_SECONDS,
+        backend=(
+            SqliteMapCacheBackend(settings.MAP_CACHE_SQLITE_PATH)
+            if settings.MAP_CACHE_BACKEND == "sqlite" else None
+        ),
+    ),
+    bounds_tile_zoom=settings.BOUNDS_TILE_ZOOM or None,
+    spatial_index=ReportSpatialIndex() if settings.REPORT_SPATIAL_INDEX else None,
+    cache_response_bodies=settings.MAP_CACHE_RESPONSE_BODIES,
+    prefetch_budget=settings.MAP_PREFETCH_BUDGET,
+    direct_queries=direct_map_queries,
+)
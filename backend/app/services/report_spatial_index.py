@@ -0,0 +1,295 @@
+"""프로세스 내 제보 공간 인덱스 — 지도 조회(Map Query)의 선택적 읽기 엔진.
+
+모든 제보의 좌표·카테고리·created_at을 슬롯 번호로 정렬된 열(column) 배열에 두고,
+고정 크기 위경도 격자(cell → 슬롯 집합)로 후보를 좁힌다. 영역 조회/주변 조회는
+후보 셀의 슬롯만 훑어 조건을 확인하고, (created_at, id) 내림차순 상위 `offset + limit`개만
+부분 정렬해 PostgREST 왕복 없이 응답한다. 정렬·페이지 의미는 공간 RPC와 같다.
+
+인덱스는 상태를 소유할 뿐 스스로 DB를 읽지 않는다. 적재(load/prepare+install)와 갱신은
+`ReportService`가 호출한다: 이 워커의 제보 변이 경로 — 지도 조회 캐시를 무효화하는 바로 그
+경로(ADR-0011) — 는 upsert/remove로 곧바로 반영하고, 다른 워커의 변이와 투표·댓글 카운터는
+`version` 이후의 change_version 델타(apply_changes)로 따라잡는다. `is_stale()`이 참이면 호출자가
+델타 동기화를 건다.
+
+검색어(search) 필터는 지원하지 않는다 — ILIKE 의미를 Python에 복제하지 않고 RPC에 맡긴다.
+저장된 행은 복사 없이 반환되므로 호출자는 반환값을 변이하지 말아야 한다.
+"""
+import heapq
+import math
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from app.utils.geo import haversine_distances
+
+_CELL_DEGREES = 0.01
+_MAX_AGE_SECONDS = 5
+_METERS_PER_DEGREE = 111320.0
+
+Cell = Tuple[int, int]
+
+
+class ReportSpatialIndex:
+    def __init__(
+        self,
+        *,
+        cell_degrees: float = _CELL_DEGREES,
+        max_age_seconds: float = _MAX_AGE_SECONDS,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cell_degrees = cell_degrees
+        self._max_age_seconds = max_age_seconds
+        self._timer = timer
+        self._loaded_at: Optional[float] = None
+        # 반영한 마지막 reports.change_version. 다음 델타 동기화는 이 값 이후를 읽는다.
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._slots: Dict[str, int] = {}
+        self._lat = array("d")
+        self._lng = array("d")
+        self._created_at: List[str] = []
+        self._category: List[Optional[str]] = []
+        self._rows: List[Optional[Dict[str, Any]]] = []
+        self._free: List[int] = []
+        self._cells: Dict[Cell, Set[int]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        """적재 전이거나 마지막 적재·동기화 후 허용 지연(max_age_seconds)을 넘겼으면 참."""
+        if self._loaded_at is None:
+            return True
+        return self._timer() - self._loaded_at >= self._max_age_seconds
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def load(self, reports: Iterable[Dict[str, Any]]) -> None:
+        """전체 교체. 각 행은 enrich_report_data를 거친 형태(location이 {lat, lng})여야 한다."""
+        self._reset()
+        for report in reports:
+            self._insert(report)
+        self._loaded_at = self._timer()
+
+    def prepare(self, reports: Iterable[Dict[str, Any]]) -> "ReportSpatialIndex":
+        """reports를 적재한 새 인덱스. 자신은 바꾸지 않으므로 다른 스레드에서 만들어도 된다."""
+        fresh = ReportSpatialIndex(
+            cell_degrees=self._cell_degrees, max_age_seconds=self._max_age_seconds, timer=self._timer,
+        )
+        fresh.load(reports)
+        return fresh
+
+    def install(self, fresh: "ReportSpatialIndex", version: int) -> None:
+        """prepare로 만든 내용으로 통째로 바꿔 끼운다. 이 객체를 공유하는 쪽(admin)은 그대로 본다."""
+        self._slots, self._lat, self._lng = fresh._slots, fresh._lat, fresh._lng
+        self._created_at, self._category, self._rows = fresh._created_at, fresh._category, fresh._rows
+        self._free, self._cells = fresh._free, fresh._cells
+        self._loaded_at = fresh._loaded_at
+        self.version = version
+
+    def apply_changes(self, changed: Iterable[Dict[str, Any]], removed: Iterable[Dict[str, Any]]) -> None:
+        """change_version 델타를 버전 순서대로 반영한다.
+
+        changed는 바뀐 행(enrich_report_data를 거친 형태), removed는 report_tombstones 행
+        ({change_version, report_id})이다. 이동한 제보는 낮은 버전의 tombstone 뒤에 새 행이 오므로
+        순서대로 적용하면 새 위치에 남는다. version은 changed의 마지막 버전까지만 올린다 — 그보다 뒤의
+        tombstone은 다음 동기화에 다시 읽혀도 remove라 무해하다.
+        """
+        ops = [(int(row["change_version"]), 1, row) for row in changed]
+        ops += [(int(row["change_version"]), 0, row) for row in removed]
+        for version, is_upsert, row in sorted(ops, key=lambda op: op[:2]):
+            if is_upsert:
+                self.upsert(row)
+                self.version = max(self.version, version)
+            else:
+                self.remove(row["report_id"])
+        self._loaded_at = self._timer()
+
+    def upsert(self, report: Dict[str, Any], *, keep_counters: bool = False) -> None:
+        """제보 하나를 추가하거나 교체한다. keep_counters면 기존 vote/comment 카운터를 유지한다."""
+        existing = self._pop(report["id"])
+        if keep_counters and existing is not None:
+            report = {
+                **report,
+                "vote_count": existing.get("vote_count", 0),
+                "comment_count": existing.get("comment_count", 0),
+            }
+        self._insert(report)
+
+    def remove(self, report_id: str) -> None:
+        self._pop(report_id)
+
+    def query_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """영역 안 제보의 (페이지, 전체 개수). created_at 내림차순."""
+        lat, lng = self._lat, self._lng
+        matched = [
+            slot for slot in self._candidates(north, south, east, west)
+            if south <= lat[slot] <= north
+            and west <= lng[slot] <= east
+            and self._matches_category(slot, category)
+        ]
+        page = self._newest_page(matched, offset, limit)
+        rows = self._live_rows()
+        return [rows[slot] for slot in page], len(matched)
+
+    def aggregate_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        cell_degrees: float,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """영역 안 제보를 cell_degrees 격자 셀로 집계한 (셀 목록, 전체 개수).
+
+        셀 모양과 순서는 get_report_grid_in_bounds RPC와 같다: {x, y, count, lat, lng, categories}, (y, x) 오름차순.
+        """
+        lat, lng, categories = self._lat, self._lng, self._category
+        cells: Dict[Cell, Dict[str, Any]] = {}
+        total = 0
+        for slot in self._candidates(north, south, east, west):
+            if not (south <= lat[slot] <= north and west <= lng[slot] <= east
+                    and self._matches_category(slot, category)):
+                continue
+            total += 1
+            x = math.floor((lng[slot] + 180.0) / cell_degrees)
+            y = math.floor((lat[slot] + 90.0) / cell_degrees)
+            cell = cells.get((y, x))
+            if cell is None:
+                cell = cells[(y, x)] = {"x": x, "y": y, "count": 0, "lat": 0.0, "lng": 0.0, "categories": {}}
+            cell["count"] += 1
+            cell["lat"] += lat[slot]
+            cell["lng"] += lng[slot]
+            slot_category = categories[slot]
+            cell["categories"][slot_category] = cell["categories"].get(slot_category, 0) + 1
+
+        ordered = [cells[key] for key in sorted(cells)]
+        for cell in ordered:
+            cell["lat"] /= cell["count"]
+            cell["lng"] /= cell["count"]
+        return ordered, total
+
+    def query_radius(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_meters: float,
+        category: Optional[str],
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """반경 안 제보의 (페이지, 전체 개수). created_at 내림차순, 각 행 복사본에 distance_meters를 붙인다."""
+        lat_delta = radius_meters / _METERS_PER_DEGREE
+        lng_delta = radius_meters / (_METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+
+        candidates = [
+            slot for slot in self._candidates(lat + lat_delta, lat - lat_delta, lng + lng_delta, lng - lng_delta)
+            if self._matches_category(slot, category)
+        ]
+        lats, lngs = self._lat, self._lng
+        candidate_distances = haversine_distances(
+            lat, lng, [lats[slot] for slot in candidates], [lngs[slot] for slot in candidates]
+        )
+        distances = {
+            slot: distance
+            for slot, distance in zip(candidates, candidate_distances)
+            if distance <= radius_meters
+        }
+
+        page = self._newest_page(list(distances), offset, limit)
+        rows = self._live_rows()
+        items = [{**rows[slot], "distance_meters": distances[slot]} for slot in page]
+        return items, len(distances)
+
+    # --- internals ---
+
+    def _cell_of(self, lat: float, lng: float) -> Cell:
+        return (math.floor(lat / self._cell_degrees), math.floor(lng / self._cell_degrees))
+
+    def _candidates(self, north: float, south: float, east: float, west: float) -> Iterable[int]:
+        row_min, col_min = self._cell_of(south, west)
+        row_max, col_max = self._cell_of(north, east)
+        cells = self._cells
+        # 넓은 영역은 빈 셀을 하나씩 두드리기보다 점유된 셀만 훑는 편이 싸다.
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(cells):
+            for (row, col), slots in cells.items():
+                if row_min <= row <= row_max and col_min <= col <= col_max:
+                    yield from slots
+            return
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                slots = cells.get((row, col))
+                if slots:
+                    yield from slots
+
+    def _live_rows(self) -> List[Dict[str, Any]]:
+        # 조회는 셀(_cells)에 든 칸만 읽고, _pop은 칸을 비우기(None) 전에 셀에서 뺀다.
+        return cast(List[Dict[str, Any]], self._rows)
+
+    def _matches_category(self, slot: int, category: Optional[str]) -> bool:
+        return category is None or self._category[slot] == category
+
+    def _newest_page(self, slots: List[int], offset: int, limit: int) -> List[int]:
+        offset, limit = max(offset, 0), max(limit, 0)
+        created_at, rows = self._created_at, self._live_rows()
+        # RPC와 같은 (created_at DESC, id DESC) 순서 — 같은 시각의 제보도 페이지 경계에서 흔들리지 않는다.
+        newest = heapq.nlargest(offset + limit, slots, key=lambda slot: (created_at[slot], rows[slot]["id"]))
+        return newest[offset:]
+
+    def _insert(self, report: Dict[str, Any]) -> None:
+        location = report["location"]
+        lat, lng = float(location["lat"]), float(location["lng"])
+        created_at = str(report.get("created_at") or "")
+        category = report.get("category")
+
+        if self._free:
+            slot = self._free.pop()
+            self._lat[slot] = lat
+            self._lng[slot] = lng
+            self._created_at[slot] = created_at
+            self._category[slot] = category
+            self._rows[slot] = report
+        else:
+            slot = len(self._rows)
+            self._lat.append(lat)
+            self._lng.append(lng)
+            self._created_at.append(created_at)
+            self._category.append(category)
+            self._rows.append(report)
+
+        self._slots[report["id"]] = slot
+        self._cells.setdefault(self._cell_of(lat, lng), set()).add(slot)
+
+    def _pop(self, report_id: str) -> Optional[Dict[str, Any]]:
+        slot = self._slots.pop(report_id, None)
+        if slot is None:
+            return None
+
+        cell = self._cell_of(self._lat[slot], self._lng[slot])
+        slots = self._cells.get(cell)
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del self._cells[cell]
+
+        report = self._rows[slot]
+        self._rows[slot] = None
+        self._free.append(slot)
+        return report
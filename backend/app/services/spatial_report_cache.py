@@ -1,25 +1,77 @@
 """지도 조회(Map Query) 결과 캐시.
 
-주변 조회(Nearby Query)/영역 조회(Bounds Query) 결과를 담는다.
+주변 조회(Nearby Query)/영역 조회(Bounds Query) 결과, 마커 투영(`fields=marker`) 영역 조회 결과,
+근접 그룹을 붙인 영역 조회 결과
+(`app.services.proximity_groups`), 격자 집계 영역 조회 결과, 타일 모드 영역 조회가 조립에
+쓰는 타일 단위 결과(`app.services.bounds_tiles`)를 담는다.
 키 조립·TTL·maxsize는 구현 세부사항이며 호출자에게 노출되지 않는다.
-무효화 정책은 ADR-0001: 제보 변이 시 invalidate_all()만 사용한다.
 
-get은 저장된 객체를 복사 없이 그대로 반환한다 — 호출자는 반환값을 변이하지 말고,
+무효화 정책은 ADR-0011(ADR-0001의 무효화 단위를 대체): 제보 변이 시 변이된 제보의 이전·이후
+좌표를 invalidate_locations()에 넘기면, 조회 영역(영역 조회·타일은 그 사각형, 주변 조회는
+반경을 감싸는 사각형)이 그 좌표를 포함하는 항목만 버린다. 좌표를 알 수 없는 변이는 invalidate_all().
+
+항목을 담고 버리는 저장소는 `app.services.map_cache_backends`의 백엔드다 — 기본은 프로세스 내
+메모리, 여러 워커가 캐시와 무효화를 공유하려면 SQLite 파일 백엔드를 주입한다.
+
+`generation`은 invalidate_all()·invalidate_locations()마다 1씩 증가한다 — 호출자는 이를 "지금 캐시가 어떤
+변이 이후의 상태인가"를 구분하는 값으로만 쓴다.
+
+`*_body` 항목은 같은 키의 주변·영역 조회 결과를 응답 본문으로 인코딩해 둔 것이다 ({"body": JSON 문자열,
+"ids": 항목 id 목록}). 같은 조회 영역으로 등록되므로 결과 항목과 함께 만료·무효화된다. stale 구간은 없다.
+
+get은 저장된 객체를 (메모리 백엔드에서는) 복사 없이 그대로 반환한다 — 호출자는 반환값을 변이하지 말고,
 사용자별 오버레이(user_voted 등)는 복사본 위에서 적용해야 한다.
+
+get_*은 15초(soft TTL) 안의 신선한 값만 돌려준다. soft TTL이 지난 항목은 두 구간 동안
+get_stale_*로 꺼낼 수 있다 (둘 다 기본 0초 = 끔):
+- stale_while_revalidate_seconds: `StaleEntry.revalidate=True` — 호출자는 stale 값을
+  즉시 응답하고 백그라운드에서 다시 조회한다. soft TTL + 이 값이 hard TTL이다.
+- stale_if_error_seconds: hard TTL을 넘긴 뒤에도 이 구간까지는 `revalidate=False`로
+  남는다 — 호출자는 다시 조회가 실패했을 때만 이 값을 대신 응답한다.
+무효화는 stale 항목까지 버린다. 변이 이전 결과는 어떤 구간에서도 응답하지 않는다.
 """
+import math
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Tuple
 
-from cachetools import TTLCache
+from app.services.bounds_tiles import Tile
+from app.services.map_cache_backends import Footprint, MapCacheBackend, MemoryMapCacheBackend
+from app.utils.geo import EARTH_RADIUS_METERS
 
 _TTL_SECONDS = 15
-_MAXSIZE = 1000
+# 경계 위 좌표를 놓치지 않도록 조회 영역을 이만큼(도, 약 10cm) 넓게 잡는다.
+_FOOTPRINT_MARGIN_DEGREES = 1e-6
+
+
+def _radius_footprint(lat: float, lng: float, radius_km: float) -> Footprint:
+    lat_delta = math.degrees(radius_km * 1000 / EARTH_RADIUS_METERS)
+    lng_delta = lat_delta / max(math.cos(math.radians(lat)), 1e-6)
+    return (lat + lat_delta, lat - lat_delta, lng + lng_delta, lng - lng_delta)
+
+
+class StaleEntry(NamedTuple):
+    value: Dict[str, Any]
+    # True면 stale-while-revalidate 구간, False면 stale-if-error 구간
+    revalidate: bool
 
 
 class SpatialReportCache:
-    def __init__(self, timer: Callable[[], float] = time.monotonic) -> None:
-        self._nearby: TTLCache = TTLCache(maxsize=_MAXSIZE, ttl=_TTL_SECONDS, timer=timer)
-        self._bounds: TTLCache = TTLCache(maxsize=_MAXSIZE, ttl=_TTL_SECONDS, timer=timer)
+    def __init__(
+        self,
+        timer: Callable[[], float] = time.monotonic,
+        *,
+        stale_while_revalidate_seconds: float = 0,
+        stale_if_error_seconds: float = 0,
+        backend: Optional[MapCacheBackend] = None,
+    ) -> None:
+        self._timer = timer
+        self._hard_ttl = _TTL_SECONDS + stale_while_revalidate_seconds
+        self._retention = self._hard_ttl + stale_if_error_seconds
+        self._backend = backend or MemoryMapCacheBackend(timer=timer)
+
+    @property
+    def generation(self) -> int:
+        return self._backend.generation
 
     def get_nearby(
         self,
@@ -32,7 +84,20 @@ class SpatialReportCache:
         page: int,
         limit: int,
     ) -> Optional[Dict[str, Any]]:
-        return self._nearby.get((lat, lng, radius_km, category, search, page, limit))
+        return self._get_fresh("nearby", (lat, lng, radius_km, category, search, page, limit))
+
+    def get_stale_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("nearby", (lat, lng, radius_km, category, search, page, limit))
 
     def put_nearby(
         self,
@@ -46,7 +111,36 @@ class SpatialReportCache:
         limit: int,
         value: Dict[str, Any],
     ) -> None:
-        self._nearby[(lat, lng, radius_km, category, search, page, limit)] = value
+        self._put("nearby", (lat, lng, radius_km, category, search, page, limit), value,
+                  _radius_footprint(lat, lng, radius_km))
+
+    def get_nearby_body(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("nearby_body", (lat, lng, radius_km, category, search, page, limit))
+
+    def put_nearby_body(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("nearby_body", (lat, lng, radius_km, category, search, page, limit), value,
+                  _radius_footprint(lat, lng, radius_km))
 
     def get_bounds(
         self,
@@ -60,7 +154,21 @@ class SpatialReportCache:
         page: int,
         limit: int,
     ) -> Optional[Dict[str, Any]]:
-        return self._bounds.get((north, south, east, west, category, search, page, limit))
+        return self._get_fresh("bounds", (north, south, east, west, category, search, page, limit))
+
+    def get_stale_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("bounds", (north, south, east, west, category, search, page, limit))
 
     def put_bounds(
         self,
@@ -75,8 +183,241 @@ class SpatialReportCache:
         limit: int,
         value: Dict[str, Any],
     ) -> None:
-        self._bounds[(north, south, east, west, category, search, page, limit)] = value
+        self._put("bounds", (north, south, east, west, category, search, page, limit), value,
+                  (north, south, east, west))
+
+    def get_bounds_body(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("bounds_body", (north, south, east, west, category, search, page, limit))
+
+    def put_bounds_body(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("bounds_body", (north, south, east, west, category, search, page, limit), value,
+                  (north, south, east, west))
+
+    def get_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("bounds_markers", (north, south, east, west, category, search, page, limit))
+
+    def get_stale_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("bounds_markers", (north, south, east, west, category, search, page, limit))
+
+    def put_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("bounds_markers", (north, south, east, west, category, search, page, limit), value,
+                  (north, south, east, west))
+
+    def get_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("bounds_groups", (north, south, east, west, category, search, page, limit))
+
+    def get_stale_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("bounds_groups", (north, south, east, west, category, search, page, limit))
+
+    def put_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("bounds_groups", (north, south, east, west, category, search, page, limit), value,
+                  (north, south, east, west))
+
+    def get_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("bounds_grid", (north, south, east, west, zoom, category, search))
+
+    def get_stale_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("bounds_grid", (north, south, east, west, zoom, category, search))
+
+    def put_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("bounds_grid", (north, south, east, west, zoom, category, search), value,
+                  (north, south, east, west))
+
+    def get_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("bounds_tile", (tile, category, search))
+
+    def get_stale_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[StaleEntry]:
+        return self._get_stale("bounds_tile", (tile, category, search))
+
+    def put_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+        value: Dict[str, Any],
+    ) -> None:
+        self._put("bounds_tile", (tile, category, search), value,
+                  (tile.north, tile.south, tile.east, tile.west))
+
+    def invalidate_locations(self, locations: Iterable[Dict[str, float]]) -> None:
+        """조회 영역이 주어진 좌표({"lat", "lng"}) 중 하나라도 포함하는 항목을 버린다."""
+        self._backend.invalidate_locations(locations)
 
     def invalidate_all(self) -> None:
-        self._nearby.clear()
-        self._bounds.clear()
+        self._backend.invalidate_all()
+
+    # --- internals ---
+
+    def _put(self, kind: str, key: Hashable, value: Dict[str, Any], footprint: Footprint) -> None:
+        north, south, east, west = footprint
+        stored_at = self._timer()
+        self._backend.put(
+            kind, key, value,
+            stored_at=stored_at,
+            expires_at=stored_at + self._retention,
+            footprint=(
+                north + _FOOTPRINT_MARGIN_DEGREES,
+                south - _FOOTPRINT_MARGIN_DEGREES,
+                east + _FOOTPRINT_MARGIN_DEGREES,
+                west - _FOOTPRINT_MARGIN_DEGREES,
+            ),
+        )
+
+    def _age(self, kind: str, key: Hashable) -> Optional[Tuple[float, Dict[str, Any]]]:
+        entry = self._backend.get(kind, key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        age = self._timer() - stored_at
+        return (age, value) if age < self._retention else None
+
+    def _get_fresh(self, kind: str, key: Hashable) -> Optional[Dict[str, Any]]:
+        entry = self._age(kind, key)
+        if entry is None:
+            return None
+        age, value = entry
+        return value if age < _TTL_SECONDS else None
+
+    def _get_stale(self, kind: str, key: Hashable) -> Optional[StaleEntry]:
+        entry = self._age(kind, key)
+        if entry is None:
+            return None
+        age, value = entry
+        if age < _TTL_SECONDS:
+            return None
+        return StaleEntry(value, revalidate=age < self._hard_ttl)
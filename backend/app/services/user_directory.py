@@ -16,6 +16,7 @@ from starlette.concurrency import run_in_threadpool
 from supabase.client import Client
 
 from app.core.logging import get_logger
+from app.db.supabase_client import QueryClient
 from app.utils.blocking_db import execute
 
 logger = get_logger(__name__)
@@ -31,7 +32,7 @@ def _unique(user_ids: Iterable[Optional[str]]) -> List[str]:
     return list(seen)
 
 
-async def fetch_profiles(supabase: Client, user_ids: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
+async def fetch_profiles(supabase: QueryClient, user_ids: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
     """user_id -> {nickname, avatar_url}. 프로필이 없는 작성자는 결과에서 빠진다."""
     ids = _unique(user_ids)
     if not ids:
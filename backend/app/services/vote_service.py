@@ -1,8 +1,7 @@
 from fastapi import HTTPException, status
 from typing import Any, Dict
-from supabase.client import Client
 from app.schemas.vote import VoteCreate
-from app.db.supabase_client import supabase as default_supabase
+from app.db.supabase_client import QueryClient, query_client as default_supabase
 from app.utils.blocking_db import execute
 
 
@@ -12,7 +11,7 @@ class VoteService:
     투표 변이는 지도 조회 캐시를 무효화하지 않는다(ADR-0001) — 캐시를 주입받지 않는다.
     """
 
-    def __init__(self, supabase: Client) -> None:
+    def __init__(self, supabase: QueryClient) -> None:
         self._supabase = supabase
 
     async def create_vote(
@@ -4,15 +4,171 @@ supabase-py's `Client` is synchronous. Calling `.execute()` directly inside an
 `async def` route or service blocks the whole event loop, so a single Uvicorn
 process serialises every concurrent request onto one thread — under load the
 response time becomes pure queueing (N users / throughput) rather than actual
-work. Routing each query through the threadpool keeps the loop free so requests
+work. Routing each query through a thread pool keeps the loop free so requests
 overlap on the network round trip to Supabase.
+
+Builders from the async client (`AsyncClient`, `SUPABASE_ASYNC_CLIENT`) are
+awaited directly instead: no thread is held per in-flight query, and cancelling
+the awaiting task (e.g. a client disconnect, see
+app/middleware/cancel_on_disconnect.py) aborts the HTTP request to PostgREST.
+A running thread call cannot be interrupted — cancelling only abandons its
+result (a call still waiting in the queue is dropped).
+
+Sync calls go to `db_executor`, a pool used only for DB calls with one thread
+per connection of the sync client's httpx pool (`_POOL_LIMITS`), so a query
+waits in exactly one visible queue instead of behind uploads and auth lookups
+in Starlette's shared pool and then again for an httpx connection. Admission is
+bounded: past `workers + DB_EXECUTOR_QUEUE_LIMIT` calls in flight, or after
+waiting longer than `DB_EXECUTOR_MAX_WAIT_SECONDS` in the queue, a call fails
+fast with `DbPoolSaturated` (503 + Retry-After) instead of letting latency grow
+without bound. Async-client calls count against the same admission limit.
+`db_executor.stats()` (served at /health/db-pool) reports queue depth and wait
+times.
 """
 
-from typing import Any
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.db.supabase_client import _POOL_LIMITS
+
+T = TypeVar("T")
+
+
+class DbPoolSaturated(HTTPException):
+    """DB 호출 대기열이 가득 찼거나 대기 시간 한도를 넘김 — 503 + Retry-After."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요",
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
+
+
+class DbExecutor:
+    """DB 호출 전용 스레드 풀과 유한 대기열."""
+
+    def __init__(
+        self,
+        workers: int,
+        queue_limit: int,
+        *,
+        max_wait_seconds: float = 0,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self._workers = max(workers, 1)
+        self._queue_limit = max(queue_limit, 0)
+        self._max_wait_seconds = max_wait_seconds
+        self._retry_after_seconds = retry_after_seconds
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="db")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._in_flight >= self._workers + self._queue_limit:
+                self._rejected += 1
+                raise DbPoolSaturated(self._retry_after_seconds)
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _start(self, waited: float) -> None:
+        with self._lock:
+            self._running += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+
+    def _call(self, fn: Callable[[], T], enqueued: float) -> T:
+        waited = time.perf_counter() - enqueued
+        self._start(waited)
+        try:
+            if self._max_wait_seconds and waited > self._max_wait_seconds:
+                with self._lock:
+                    self._wait_timeouts += 1
+                raise DbPoolSaturated(self._retry_after_seconds)
+            return fn()
+        finally:
+            self._finish()
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        """fn()을 DB 스레드에서 실행한다. 대기열이 가득 차면 곧바로 DbPoolSaturated."""
+        self._admit()
+        try:
+            future = self._executor.submit(self._call, fn, time.perf_counter())
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    async def run_async(self, call: Callable[[], Awaitable[T]]) -> T:
+        """비동기 클라이언트 호출도 같은 입장 한도로 센다 (대기는 httpx 연결 풀에서)."""
+        self._admit()
+        self._start(0.0)
+        try:
+            return await call()
+        finally:
+            self._finish()
+            self._release()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def idle_workers(self) -> int:
+        """대기 없이 곧바로 시작할 수 있는 호출 수. 선조회처럼 미뤄도 되는 호출이 양보할지 정할 때 본다."""
+        with self._lock:
+            return max(self._workers - self._in_flight, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                "workers": self._workers,
+                "running": self._running,
+                "queued": max(self._in_flight - self._running, 0),
+                "queue_limit": self._queue_limit,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_timeouts": self._wait_timeouts,
+                "wait_avg_ms": round(self._wait_total / started * 1000, 3) if started else 0.0,
+                "wait_max_ms": round(self._wait_max * 1000, 3),
+            }
+
 
-from starlette.concurrency import run_in_threadpool
+db_executor = DbExecutor(
+    # httpx.Limits allows None (no limit); app.db.supabase_client always sets one.
+    _POOL_LIMITS.max_connections or 20,
+    settings.DB_EXECUTOR_QUEUE_LIMIT,
+    max_wait_seconds=settings.DB_EXECUTOR_MAX_WAIT_SECONDS,
+    retry_after_seconds=settings.DB_EXECUTOR_RETRY_AFTER_SECONDS,
+)
 
 
 async def execute(query: Any) -> Any:
-    """Run a blocking supabase-py query builder off the event loop."""
-    return await run_in_threadpool(query.execute)
+    """Run a supabase-py query builder without blocking the event loop."""
+    if inspect.iscoroutinefunction(query.execute):
+        return await db_executor.run_async(query.execute)
+    return await db_executor.run(query.execute)
@@ -0,0 +1,29 @@
+"""Opaque keyset cursors for report lists ordered by (created_at DESC, id DESC).
+
+A cursor names the last report a client has seen. The `*_after` RPCs seek past
+it with `WHERE (created_at, id) < cursor` instead of `OFFSET`, so a deep page
+costs the same as the first one. Clients must treat the value as opaque; it is
+URL-safe base64 of the two fields and carries no signature — a forged cursor
+only moves the caller's own position in a list they can already read.
+"""
+
+import base64
+import json
+from typing import Any, Dict, Tuple
+
+
+def encode_report_cursor(report: Dict[str, Any]) -> str:
+    payload = json.dumps([report["created_at"], report["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_report_cursor(cursor: str) -> Tuple[str, str]:
+    """Return `(created_at, id)`. Raises ValueError for anything `encode_report_cursor` did not produce."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, report_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+    if not (isinstance(created_at, str) and isinstance(report_id, str)):
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return created_at, report_id
@@ -0,0 +1,52 @@
+"""좌표 거리 계산 유틸리티."""
+import math
+from typing import List, Sequence
+
+EARTH_RADIUS_METERS = 6371000
+
+
+def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Calculate distance between two points using Haversine formula.
+    Returns distance in meters.
+    """
+    R = EARTH_RADIUS_METERS
+
+    lat1_rad, lng1_rad = math.radians(lat1), math.radians(lng1)
+    lat2_rad, lng2_rad = math.radians(lat2), math.radians(lng2)
+
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+
+    a = (math.sin(dlat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return R * c
+
+
+def haversine_distances(
+    lat: float,
+    lng: float,
+    lats: Sequence[float],
+    lngs: Sequence[float],
+) -> List[float]:
+    """
+    Distances in meters from (lat, lng) to every (lats[i], lngs[i]) in one batched pass.
+    Same formula as calculate_distance, with the origin terms hoisted out of the loop.
+    """
+    R = EARTH_RADIUS_METERS
+    radians, sin, cos, sqrt, atan2 = math.radians, math.sin, math.cos, math.sqrt, math.atan2
+
+    lat1_rad, lng1_rad = radians(lat), radians(lng)
+    cos_lat1 = cos(lat1_rad)
+
+    distances: List[float] = []
+    append = distances.append
+    for lat2, lng2 in zip(lats, lngs):
+        lat2_rad = radians(lat2)
+        half_dlat = sin((lat2_rad - lat1_rad) / 2)
+        half_dlng = sin((radians(lng2) - lng1_rad) / 2)
+        a = half_dlat * half_dlat + cos_lat1 * cos(lat2_rad) * half_dlng * half_dlng
+        append(R * 2 * atan2(sqrt(a), sqrt(1 - a)))
+    return distances
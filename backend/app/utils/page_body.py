@@ -0,0 +1,94 @@
+"""Pre-encoded JSON bodies for cached report pages.
+
+A cached anonymous page is encoded once and stored next to the page. Both the
+route (`trusted_page_response`) and the cache go through `page_content`, so a
+hit and a miss render byte-identical JSON in either
+`STRICT_RESPONSE_VALIDATION` mode: the strict mode validates and serializes
+through the response schema, the default one projects the RPC row strings as
+they are. Cache hits then return those bytes as
+they are. A logged-in hit only flips `"user_voted":false` to `true` for the
+items the user voted on. Each item is located by its `"id":"<uuid>"` key: quotes
+inside string values are escaped in JSON, so the first `"user_voted":` after
+that key belongs to the same item.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from app.core.config import settings
+from app.schemas.report import PaginatedReportResponse, Report
+
+_NOT_VOTED = b'"user_voted":false'
+_VOTED = b'"user_voted":true'
+
+
+@lru_cache(maxsize=None)
+def _page_adapter(item_model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(PaginatedReportResponse[item_model])
+
+
+@lru_cache(maxsize=None)
+def item_fields(item_model: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """(field name, default) pairs of item_model, in schema order."""
+    return tuple(
+        (name, None if field.default is PydanticUndefined else field.default)
+        for name, field in item_model.model_fields.items()
+    )
+
+
+def page_content(page: Dict[str, Any], item_model: Type[BaseModel] = Report) -> Dict[str, Any]:
+    """JSON-ready dict of a report page, as every map/list response renders it.
+
+    Items keep only item_model's fields (missing ones get the default), and
+    timestamps, UUIDs and enums stay the strings the RPC returned. With
+    STRICT_RESPONSE_VALIDATION the page is validated and dumped through the
+    response schema instead.
+    """
+    if settings.STRICT_RESPONSE_VALIDATION:
+        adapter = _page_adapter(item_model)
+        return adapter.dump_python(adapter.validate_python(page), mode="json")
+
+    fields = item_fields(item_model)
+    items: List[Dict[str, Any]] = [
+        {name: row.get(name, default) for name, default in fields} for row in page["items"]
+    ]
+    return {
+        "items": items,
+        "totalCount": page["totalCount"],
+        "totalPages": page["totalPages"],
+        "page": page["page"],
+        "limit": page["limit"],
+        "nextCursor": page.get("nextCursor"),
+    }
+
+
+def encode_page_body(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache value for a page: {"body": JSON text as the route would render it, "ids": item ids}."""
+    body = orjson.dumps(page_content(page), option=orjson.OPT_NON_STR_KEYS)
+    return {"body": body.decode(), "ids": [str(r["id"]) for r in page["items"]]}
+
+
+def patch_user_voted(body: bytes, voted_ids: Iterable[str]) -> bytes:
+    """Return `body` with user_voted set to true for every item in `voted_ids`."""
+    positions = []
+    for report_id in voted_ids:
+        start = body.find(b'"id":"' + str(report_id).lower().encode() + b'"')
+        if start < 0:
+            continue
+        position = body.find(_NOT_VOTED, start)
+        if position >= 0:
+            positions.append(position)
+    if not positions:
+        return body
+
+    parts = []
+    previous = 0
+    for position in sorted(positions):
+        parts.append(body[previous:position])
+        parts.append(_VOTED)
+        previous = position + len(_NOT_VOTED)
+    parts.append(body[previous:])
+    return b"".join(parts)
@@ -0,0 +1,48 @@
+"""Coalesce concurrent identical loads into one in-flight call.
+
+When a hot map-query cache entry expires or `invalidate_all()` clears it, every
+concurrent request for that viewport misses at the same moment. Without
+coalescing each of them sends its own RPC through the threadpool — a thundering
+herd on Supabase right after every report mutation. `SingleFlight` lets the
+first miss for a key start the load and every later miss for the same key await
+that same future; the result or the exception is delivered to all of them.
+
+The load runs as its own task and waiters await it through `asyncio.shield`, so
+one client disconnecting does not cancel the shared call for the others.
+`start()` launches (or joins) a flight without waiting for it, for callers that
+refresh a value in the background.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, "asyncio.Future"] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    def start(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> "asyncio.Future[T]":
+        """Return the in-flight future for `key`, starting `load()` if there is none."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(load())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finish(key, done))
+        return flight
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Return `await load()`, sharing one call among concurrent callers with the same key."""
+        return await asyncio.shield(self.start(key, load))
+
+    def _finish(self, key: Hashable, done: "asyncio.Future") -> None:
+        if self._flights.get(key) is done:
+            del self._flights[key]
+        # Every waiter may have gone away; mark the exception as retrieved so
+        # asyncio does not log it as unhandled.
+        if not done.cancelled():
+            done.exception()
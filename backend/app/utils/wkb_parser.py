@@ -2,7 +2,12 @@
 PostGIS WKB (Well-Known Binary) 파싱 유틸리티
 """
 import struct
-from typing import Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
+
+# SRID 포함 little-endian POINT(EWKB): byte order(1) + type(4) + SRID(4) + X(8) + Y(8) = 25바이트
+_EWKB_POINT_LE = struct.Struct('<BIIdd')
+_EWKB_POINT_HEX_LEN = _EWKB_POINT_LE.size * 2
+_EWKB_POINT_TYPE = 0x20000001
 
 def parse_wkb_point(wkb_hex: str) -> Optional[Tuple[float, float]]:
     """
@@ -17,7 +22,18 @@ def parse_wkb_point(wkb_hex: str) -> Optional[Tuple[float, float]]:
     try:
         # 16진수 문자열을 바이트로 변환
         wkb_bytes = bytes.fromhex(wkb_hex)
-        
+    except Exception:
+        return None
+    return parse_ewkb_point(wkb_bytes)
+
+def parse_ewkb_point(wkb_bytes: bytes) -> Optional[Tuple[float, float]]:
+    """
+    EWKB POINT 바이트(예: asyncpg가 바이너리로 받은 geography 값)를 (lng, lat) 튜플로 반환
+
+    Returns:
+        (lng, lat) 튜플 또는 None (파싱 실패시)
+    """
+    try:
         # WKB 헤더 확인 (최소 21바이트 필요)
         if len(wkb_bytes) < 21:
             return None
@@ -44,6 +60,44 @@ def parse_wkb_point(wkb_hex: str) -> Optional[Tuple[float, float]]:
         # WKB parsing error occurred
         return None
 
+def parse_wkb_points(wkb_hexes: Sequence[str]) -> List[Optional[Tuple[float, float]]]:
+    """
+    한 페이지 분량의 EWKB POINT 16진수 문자열을 한 번에 (lng, lat) 목록으로 변환
+
+    PostGIS가 돌려주는 SRID 포함 little-endian POINT는 모두 25바이트 고정 길이이므로,
+    전체를 이어 붙여 한 번만 bytes.fromhex하고 미리 컴파일한 Struct로 연속 버퍼를 순회한다.
+    형식이 다른 행만 parse_wkb_point(단건 경로)로 되돌아간다.
+
+    Args:
+        wkb_hexes: PostGIS WKB 16진수 문자열 목록
+
+    Returns:
+        입력과 같은 순서의 (lng, lat) 튜플 또는 None (파싱 실패시) 목록
+    """
+    results: List[Optional[Tuple[float, float]]] = [None] * len(wkb_hexes)
+    fixed = [i for i, h in enumerate(wkb_hexes) if len(h) == _EWKB_POINT_HEX_LEN]
+    fixed_set = set(fixed)
+
+    try:
+        buffer = bytes.fromhex(''.join(wkb_hexes[i] for i in fixed))
+    except ValueError:
+        # 16진수가 아닌 행이 섞여 있으면 전부 단건 경로로 판정한다
+        buffer = b''
+        fixed_set = set()
+
+    if fixed_set:
+        for i, (byte_order, geom_type, _srid, x, y) in zip(fixed, _EWKB_POINT_LE.iter_unpack(buffer)):
+            if byte_order == 1 and geom_type == _EWKB_POINT_TYPE:
+                results[i] = (x, y)
+            else:
+                fixed_set.discard(i)
+
+    for i, wkb_hex in enumerate(wkb_hexes):
+        if i not in fixed_set:
+            results[i] = parse_wkb_point(wkb_hex)
+
+    return results
+
 def convert_wkb_to_location(wkb_data: str) -> dict:
     """
     WKB 데이터를 location 딕셔너리로 변환
@@ -0,0 +1,31 @@
+"""Recompute reports.vote_count / comment_count from votes and comments.
+
+The counters are kept exact by triggers (20261016_report_counters.sql). Run
+this after anything that bypasses them, e.g. a bulk import with triggers
+disabled. Only rows whose counters differ are rewritten.
+"""
+import os
+import sys
+
+from dotenv import load_dotenv
+from supabase import create_client
+
+load_dotenv()
+
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")  # repair_report_counters is not granted to anon/authenticated
+
+
+def main() -> int:
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        print("Error: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in .env")
+        return 1
+
+    client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    repaired = client.rpc("repair_report_counters").execute().data
+    print(f"Repaired counters on {repaired} report(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
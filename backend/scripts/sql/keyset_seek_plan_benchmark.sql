@@ -0,0 +1,309 @@
+-- Plan check for the keyset RPCs (20261016_report_seek_keyset_cursors.sql)
+-- and the bounds stream RPC (20261016_report_seek_chunked_rows.sql).
+--
+-- Builds 1M synthetic reports in a scratch schema with the
+-- (created_at DESC, id DESC) and GiST location indexes, then:
+--
+--   1. prepares the cursor page query of get_reports_paginated_after in the
+--      old (OR) and new (UNION ALL) shapes and EXPLAINs them with
+--      plan_cache_mode = force_generic_plan. That is how the RPC body is
+--      planned: a SECURITY DEFINER sql function with SET is never inlined and
+--      is planned without its argument values. The script fails (ASSERT) unless
+--      the new shape has the row comparison as an Index Cond;
+--   2. times a first page and a page 500,000 rows deep through sql functions
+--      with the RPC attributes, old and new shape. The new deep page should
+--      cost about the same as the first one;
+--   3. prepares the chunk query of get_report_rows_in_bounds_after and
+--      EXPLAINs it with plan_cache_mode = force_custom_plan, as the RPC is
+--      planned, for a viewport covering the whole table. The script fails
+--      (ASSERT) unless the cursor is an Index Cond. Then streams 20,000 rows in
+--      500-row chunks through the old (sql) and new (plpgsql, custom plan)
+--      functions and prints the time of each stream. The old one re-reads the
+--      viewport for every chunk; the new one should take about 40 first-page
+--      reads.
+--
+-- Does not touch public.reports; the schema is dropped at the end.
+--
+--   psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f scripts/sql/keyset_seek_plan_benchmark.sql
+
+\timing on
+SET search_path = public, extensions;
+
+DROP SCHEMA IF EXISTS keyset_benchmark CASCADE;
+CREATE SCHEMA keyset_benchmark;
+
+CREATE TABLE keyset_benchmark.reports AS
+SELECT
+  gen_random_uuid() AS id,
+  (ARRAY['NOISE', 'TRASH', 'FACILITY', 'TRAFFIC', 'OTHER'])[1 + n % 5] AS category,
+  -- Seeded rows share created_at in runs of 10, so the id tie-breaker matters.
+  now() - ((n / 10) || ' minutes')::interval AS created_at,
+  ST_SetSRID(ST_MakePoint(126.8 + random() * 0.4, 37.4 + random() * 0.3), 4326)::geography AS location
+FROM generate_series(1, 1000000) AS n;
+
+CREATE INDEX keyset_benchmark_reports_created_at_id_idx
+  ON keyset_benchmark.reports (created_at DESC, id DESC);
+CREATE INDEX keyset_benchmark_reports_location_idx
+  ON keyset_benchmark.reports USING GIST (location);
+ANALYZE keyset_benchmark.reports;
+
+-- ---------------------------------------------------------------------------
+-- 1. Generic plans
+-- ---------------------------------------------------------------------------
+
+PREPARE old_after(TEXT, TIMESTAMPTZ, UUID, INT) AS
+  SELECT r.id
+  FROM keyset_benchmark.reports r
+  WHERE
+    ($1 IS NULL OR r.category = $1)
+    AND ($2 IS NULL OR (r.created_at, r.id) < ($2, $3))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT $4;
+
+PREPARE new_after(TEXT, TIMESTAMPTZ, UUID, INT) AS
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      ($1 IS NULL OR r.category = $1)
+      AND $2 IS NULL
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT $4
+  )
+  UNION ALL
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      ($1 IS NULL OR r.category = $1)
+      AND $2 IS NOT NULL
+      AND (r.created_at, r.id) < ($2, $3)
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT $4
+  )
+  ORDER BY created_at DESC, id DESC;
+
+SET plan_cache_mode = force_generic_plan;
+
+\echo '--- old shape: generic plan ---'
+EXPLAIN EXECUTE old_after(NULL, now(), gen_random_uuid(), 20);
+
+\echo '--- new shape: generic plan ---'
+EXPLAIN EXECUTE new_after(NULL, now(), gen_random_uuid(), 20);
+
+DO $$
+DECLARE
+  plan TEXT;
+BEGIN
+  EXECUTE 'EXPLAIN (FORMAT JSON) EXECUTE new_after(NULL, now(), gen_random_uuid(), 20)' INTO plan;
+  -- Column names carry the branch alias (r, r_1) when the plan has several scans.
+  ASSERT plan LIKE '%"Index Cond": "(ROW(%created_at, %id) < ROW($2, $3))"%',
+    'cursor branch does not seek on the (created_at, id) index: ' || plan;
+END;
+$$;
+
+RESET plan_cache_mode;
+DEALLOCATE old_after;
+DEALLOCATE new_after;
+
+-- ---------------------------------------------------------------------------
+-- 2. First page vs deep page, called like the RPC
+-- ---------------------------------------------------------------------------
+
+CREATE FUNCTION keyset_benchmark.old_after(
+  category_filter TEXT, after_created_at TIMESTAMPTZ, after_id UUID, result_limit INT
+)
+RETURNS SETOF UUID
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT r.id
+  FROM keyset_benchmark.reports r
+  WHERE
+    (category_filter IS NULL OR r.category = category_filter)
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE FUNCTION keyset_benchmark.new_after(
+  category_filter TEXT, after_created_at TIMESTAMPTZ, after_id UUID, result_limit INT
+)
+RETURNS TABLE (id UUID, created_at TIMESTAMPTZ)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      (category_filter IS NULL OR r.category = category_filter)
+      AND after_created_at IS NULL
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  UNION ALL
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      (category_filter IS NULL OR r.category = category_filter)
+      AND after_created_at IS NOT NULL
+      AND (r.created_at, r.id) < (after_created_at, after_id)
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  ORDER BY created_at DESC, id DESC;
+$$;
+
+SELECT created_at AS deep_created_at, id AS deep_id
+FROM keyset_benchmark.reports
+ORDER BY created_at DESC, id DESC
+OFFSET 500000 LIMIT 1
+\gset
+
+\echo '--- old shape: first page ---'
+SELECT count(*) FROM keyset_benchmark.old_after(NULL, NULL, NULL, 20);
+
+\echo '--- old shape: page 500,000 rows deep ---'
+SELECT count(*) FROM keyset_benchmark.old_after(NULL, :'deep_created_at', :'deep_id', 20);
+
+\echo '--- new shape: first page ---'
+SELECT count(*) FROM keyset_benchmark.new_after(NULL, NULL, NULL, 20);
+
+\echo '--- new shape: page 500,000 rows deep ---'
+SELECT count(*) FROM keyset_benchmark.new_after(NULL, :'deep_created_at', :'deep_id', 20);
+
+-- ---------------------------------------------------------------------------
+-- 3. Bounds stream: custom plans, 20,000 rows in 500-row chunks
+-- ---------------------------------------------------------------------------
+
+PREPARE stream_after(FLOAT, FLOAT, FLOAT, FLOAT, TIMESTAMPTZ, UUID, INT) AS
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      r.location && ST_MakeEnvelope($4, $2, $3, $1, 4326)::geography
+      AND $5 IS NULL
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT $7
+  )
+  UNION ALL
+  (
+    SELECT r.id, r.created_at
+    FROM keyset_benchmark.reports r
+    WHERE
+      r.location && ST_MakeEnvelope($4, $2, $3, $1, 4326)::geography
+      AND $5 IS NOT NULL
+      AND (r.created_at, r.id) < ($5, $6)
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT $7
+  )
+  ORDER BY created_at DESC, id DESC;
+
+SET plan_cache_mode = force_custom_plan;
+
+\echo '--- stream chunk: custom plan, whole-table viewport ---'
+EXPLAIN EXECUTE stream_after(38.0, 37.0, 128.0, 126.0, :'deep_created_at', :'deep_id', 500);
+
+DO $$
+DECLARE
+  plan TEXT;
+BEGIN
+  EXECUTE format(
+    'EXPLAIN (FORMAT JSON) EXECUTE stream_after(38.0, 37.0, 128.0, 126.0, %L, %L, 500)',
+    now() - interval '1 day', gen_random_uuid()
+  ) INTO plan;
+  -- In a custom plan the cursor is a constant.
+  ASSERT plan LIKE '%"Index Cond": "(ROW(%created_at, %id) < ROW(''%',
+    'stream chunk does not seek on the (created_at, id) index: ' || plan;
+END;
+$$;
+
+RESET plan_cache_mode;
+DEALLOCATE stream_after;
+
+CREATE FUNCTION keyset_benchmark.old_rows(
+  north FLOAT, south FLOAT, east FLOAT, west FLOAT,
+  after_created_at TIMESTAMPTZ, after_id UUID, result_limit INT
+)
+RETURNS TABLE (id UUID, created_at TIMESTAMPTZ)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT r.id, r.created_at
+  FROM keyset_benchmark.reports r
+  WHERE
+    r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE FUNCTION keyset_benchmark.new_rows(
+  north FLOAT, south FLOAT, east FLOAT, west FLOAT,
+  after_created_at TIMESTAMPTZ, after_id UUID, result_limit INT
+)
+RETURNS TABLE (id UUID, created_at TIMESTAMPTZ)
+LANGUAGE plpgsql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+SET plan_cache_mode = force_custom_plan
+AS $$
+#variable_conflict use_column
+BEGIN
+  RETURN QUERY
+    (
+      SELECT r.id, r.created_at
+      FROM keyset_benchmark.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND after_created_at IS NULL
+      ORDER BY r.created_at DESC, r.id DESC
+      LIMIT result_limit
+    )
+    UNION ALL
+    (
+      SELECT r.id, r.created_at
+      FROM keyset_benchmark.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND after_created_at IS NOT NULL
+        AND (r.created_at, r.id) < (after_created_at, after_id)
+      ORDER BY r.created_at DESC, r.id DESC
+      LIMIT result_limit
+    )
+    ORDER BY created_at DESC, id DESC;
+END;
+$$;
+
+-- Streams like ReportService._stream_after: each chunk continues after the
+-- last row of the previous one.
+DO $$
+DECLARE
+  fn TEXT;
+  cursor_created_at TIMESTAMPTZ;
+  cursor_id UUID;
+  chunk INT;
+  streamed INT;
+  started TIMESTAMPTZ;
+BEGIN
+  FOREACH fn IN ARRAY ARRAY['old_rows', 'new_rows'] LOOP
+    cursor_created_at := NULL;
+    cursor_id := NULL;
+    streamed := 0;
+    started := clock_timestamp();
+    LOOP
+      EXECUTE format(
+        'SELECT count(*)::INT, min(c.created_at), (array_agg(c.id ORDER BY c.created_at, c.id))[1] '
+        'FROM keyset_benchmark.%I(38.0, 37.0, 128.0, 126.0, $1, $2, 500) c',
+        fn
+      ) INTO chunk, cursor_created_at, cursor_id USING cursor_created_at, cursor_id;
+      streamed := streamed + chunk;
+      EXIT WHEN chunk < 500 OR streamed >= 20000;
+    END LOOP;
+    RAISE NOTICE '%: streamed % rows in %', fn, streamed, clock_timestamp() - started;
+  END LOOP;
+END;
+$$;
+
+DROP SCHEMA keyset_benchmark CASCADE;
@@ -0,0 +1,165 @@
+-- Plan comparison for the report search RPCs (20261016_report_search_bigrams.sql).
+--
+-- Builds a scratch copy of the searchable columns with 1M synthetic Korean
+-- reports in its own schema, then calls the list-page search as the API
+-- calls it: sql functions with the RPC attributes (STABLE SECURITY DEFINER,
+-- SET search_path), taking search_query as an argument. Such a body is never
+-- inlined and is planned without the argument value, so the predicate is
+-- measured in the generic-plan shape the RPC actually runs, not with the
+-- search term as a literal. Each shape has a page function
+-- (get_reports_paginated: newest 20 matches) and a count function
+-- (count_reports_paginated):
+--
+--   old_*  search_query IS NULL OR (ILIKE pair AND bigrams @> query bigrams)
+--   new_*  UNION ALL of a search_query IS NULL branch and a search branch
+--          whose top-level containment condition can use the GIN index
+--
+-- auto_explain prints the nested plan of every call (look for
+-- "Bitmap Index Scan on ..._report_search_bigrams_idx" under the new
+-- functions); \timing gives the call latency. LOAD 'auto_explain' needs a
+-- role that may load it (superuser, or the postgres role on Supabase); without
+-- it only the timings are printed. Requires the migration
+-- (report_search_bigrams and report_search_query_bigrams). Does not touch
+-- public.reports; the schema is dropped at the end.
+--
+--   psql "$DATABASE_URL" -f scripts/sql/search_bigram_plan_benchmark.sql
+
+\timing on
+
+DROP SCHEMA IF EXISTS search_benchmark CASCADE;
+CREATE SCHEMA search_benchmark;
+
+CREATE TABLE search_benchmark.reports AS
+SELECT
+  gen_random_uuid() AS id,
+  (ARRAY['소음', '쓰레기', '가로등', '불법 주차', '포트홀', '공사', '악취', '신호등'])[1 + (n * 7) % 8]
+    || ' ' || (ARRAY['신고', '문의', '민원', '제보'])[1 + (n * 3) % 4]
+    || ' ' || n AS title,
+  (ARRAY['밤마다', '출근길에', '주말 내내', '비가 오면', '아이들 통학로에'])[1 + (n * 11) % 5]
+    || ' ' || (ARRAY['소리가 납니다', '방치되어 있습니다', '고장 났습니다', '막혀 있습니다', '위험합니다'])[1 + (n * 13) % 5]
+    || CASE WHEN n % 5000 = 0 THEN ' 싱크홀 의심' ELSE '' END AS description,
+  now() - (n || ' minutes')::interval AS created_at
+FROM generate_series(1, 1000000) AS n;
+
+CREATE INDEX ON search_benchmark.reports (created_at DESC, id DESC);
+CREATE INDEX search_benchmark_report_search_bigrams_idx ON search_benchmark.reports
+  USING GIN (public.report_search_bigrams(title || ' ' || description));
+ANALYZE search_benchmark.reports;
+
+CREATE FUNCTION search_benchmark.old_page(search_query TEXT)
+RETURNS SETOF UUID
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT r.id
+  FROM search_benchmark.reports r
+  WHERE
+    search_query IS NULL
+    OR (
+      (r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+      AND public.report_search_bigrams(r.title || ' ' || r.description)
+        @> public.report_search_query_bigrams(search_query)
+    )
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT 20;
+$$;
+
+CREATE FUNCTION search_benchmark.old_count(search_query TEXT)
+RETURNS INT
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT count(*)::int
+  FROM search_benchmark.reports r
+  WHERE
+    search_query IS NULL
+    OR (
+      (r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+      AND public.report_search_bigrams(r.title || ' ' || r.description)
+        @> public.report_search_query_bigrams(search_query)
+    );
+$$;
+
+CREATE FUNCTION search_benchmark.new_page(search_query TEXT)
+RETURNS SETOF UUID
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT r.id
+  FROM (
+    SELECT * FROM search_benchmark.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM search_benchmark.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT 20;
+$$;
+
+CREATE FUNCTION search_benchmark.new_count(search_query TEXT)
+RETURNS INT
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT count(*)::int
+  FROM (
+    SELECT * FROM search_benchmark.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM search_benchmark.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r;
+$$;
+
+LOAD 'auto_explain';
+SET auto_explain.log_min_duration = 0;
+SET auto_explain.log_nested_statements = on;
+SET auto_explain.log_analyze = on;
+SET auto_explain.log_buffers = on;
+SET auto_explain.log_level = notice;
+
+-- Rare term (200 matches), two-syllable term, common term (1 in 8 rows) and
+-- no search. Without a search the new functions must plan like the old ones
+-- (created_at index walk, no GIN scan).
+\set rare '싱크홀'
+\set short '악취'
+\set common '가로등'
+
+\echo '--- old predicate: rare term ---'
+SELECT count(*) FROM search_benchmark.old_page(:'rare');
+SELECT search_benchmark.old_count(:'rare');
+
+\echo '--- bigram predicate: rare term ---'
+SELECT count(*) FROM search_benchmark.new_page(:'rare');
+SELECT search_benchmark.new_count(:'rare');
+
+\echo '--- old predicate: two-syllable term ---'
+SELECT count(*) FROM search_benchmark.old_page(:'short');
+SELECT search_benchmark.old_count(:'short');
+
+\echo '--- bigram predicate: two-syllable term ---'
+SELECT count(*) FROM search_benchmark.new_page(:'short');
+SELECT search_benchmark.new_count(:'short');
+
+\echo '--- old predicate: common term ---'
+SELECT count(*) FROM search_benchmark.old_page(:'common');
+SELECT search_benchmark.old_count(:'common');
+
+\echo '--- bigram predicate: common term ---'
+SELECT count(*) FROM search_benchmark.new_page(:'common');
+SELECT search_benchmark.new_count(:'common');
+
+\echo '--- old predicate: no search ---'
+SELECT count(*) FROM search_benchmark.old_page(NULL);
+
+\echo '--- bigram predicate: no search ---'
+SELECT count(*) FROM search_benchmark.new_page(NULL);
+
+DROP SCHEMA search_benchmark CASCADE;
@@ -0,0 +1,93 @@
+-- 20261016_bounds_grid_aggregation.sql
+-- Grid aggregation for zoomed-out bounds queries.
+--
+-- A city-wide viewport through get_reports_in_bounds_page ships up to
+-- result_limit full rows that the Kakao clusterer then collapses into a few
+-- badges. get_report_grid_in_bounds returns one row per occupied grid cell
+-- instead: report count, centroid and per-category counts.
+--
+-- Cells are aligned to the bounds tile grid (app/services/bounds_tiles.py):
+-- x = floor((lng + 180) / cell_degrees), y = floor((lat + 90) / cell_degrees).
+-- The caller picks cell_degrees from the zoom level and snaps the envelope
+-- to whole cells, so every returned cell is complete.
+--
+-- category/search predicates are inlined as in get_reports_in_bounds_page
+-- (ADR-0010). total_count is derived from the same CTE, so they appear once.
+
+CREATE OR REPLACE FUNCTION public.get_report_grid_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  cell_degrees FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH matched AS (
+    SELECT
+      ST_Y(r.location::geometry) AS lat,
+      ST_X(r.location::geometry) AS lng,
+      r.category::text AS category
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+  ),
+  cell_categories AS (
+    SELECT
+      floor((m.lng + 180.0) / cell_degrees)::INT AS x,
+      floor((m.lat + 90.0) / cell_degrees)::INT AS y,
+      m.category,
+      count(*) AS report_count,
+      sum(m.lat) AS lat_sum,
+      sum(m.lng) AS lng_sum
+    FROM matched m
+    GROUP BY 1, 2, 3
+  ),
+  cells AS (
+    SELECT
+      c.x,
+      c.y,
+      sum(c.report_count) AS report_count,
+      sum(c.lat_sum) / sum(c.report_count) AS lat,
+      sum(c.lng_sum) / sum(c.report_count) AS lng,
+      jsonb_object_agg(c.category, c.report_count) AS categories
+    FROM cell_categories c
+    GROUP BY c.x, c.y
+  )
+  SELECT jsonb_build_object(
+    'cells',
+    COALESCE(
+      (
+        SELECT jsonb_agg(
+          jsonb_build_object(
+            'x', cell.x,
+            'y', cell.y,
+            'count', cell.report_count,
+            'lat', cell.lat,
+            'lng', cell.lng,
+            'categories', cell.categories
+          )
+          ORDER BY cell.y, cell.x
+        )
+        FROM cells cell
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (SELECT count(*) FROM matched)
+  );
+$$;
+
+COMMENT ON FUNCTION public.get_report_grid_in_bounds(
+  FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, TEXT, TEXT
+) IS 'Per-cell report counts, centroids and category breakdowns for a bounds query (zoomed-out map views).';
@@ -0,0 +1,79 @@
+-- 20261016_bounds_marker_projection.sql
+-- Marker projection of the active bounds RPC.
+--
+-- Map rendering needs only id, coordinates, category, status and the counters,
+-- but get_reports_in_bounds_page serializes full rows: description, address,
+-- image_url and the raw geography hex. get_report_markers_in_bounds_page has
+-- the same parameters, filters, ordering and {items, total_count} envelope,
+-- and returns only the marker columns. Coordinates are numeric columns rounded
+-- to 6 decimals (~0.1m) instead of WKB hex. created_at stays so that the page
+-- can still emit a keyset cursor.
+--
+-- category/search predicates are inlined as in get_reports_in_bounds_page
+-- (ADR-0010).
+
+CREATE OR REPLACE FUNCTION public.get_report_markers_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      round(ST_Y(r.location::geometry)::numeric, 6) AS lat,
+      round(ST_X(r.location::geometry)::numeric, 6) AS lng,
+      r.category,
+      r.status,
+      r.created_at,
+      (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+      (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+COMMENT ON FUNCTION public.get_report_markers_in_bounds_page(
+  FLOAT, FLOAT, FLOAT, FLOAT, TEXT, TEXT, INT, INT
+) IS 'Marker-only projection of get_reports_in_bounds_page: id, lat/lng (6 decimals), category, status, created_at and counters.';
@@ -0,0 +1,372 @@
+-- 20261016_keyset_pagination.sql
+-- Keyset (cursor) pagination for the bounds, radius and list report queries.
+--
+-- The OFFSET RPCs re-scan every earlier row for deep pages. The *_after
+-- variants seek past an opaque cursor (created_at, id) instead, so page N
+-- costs the same as page 1. Both families order by (created_at DESC, id DESC):
+-- the OFFSET RPCs gain the id tie-breaker here so that a cursor taken from the
+-- last item of an OFFSET page continues exactly where that page ended (seeded
+-- rows share one created_at).
+--
+-- Signatures of the existing RPCs are unchanged; only ORDER BY is updated.
+-- get_reports_in_bounds_page keeps its inlined filters (ADR-0010).
+
+CREATE INDEX IF NOT EXISTS reports_created_at_id_idx
+  ON public.reports (created_at DESC, id DESC);
+
+-- ---------------------------------------------------------------------------
+-- Existing OFFSET RPCs: add the id tie-breaker
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+      (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_within_radius(
+  target_lat FLOAT,
+  target_lng FLOAT,
+  radius_meters FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 50
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  distance_meters FLOAT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+    (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) as vote_count,
+    (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) as comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+    AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+    AND public.report_matches_filters(r, category_filter, search_query)
+  ORDER BY r.created_at DESC, r.id DESC
+  OFFSET result_offset
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_page INT DEFAULT 1,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) as vote_count,
+    (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) as comment_count
+  FROM public.reports r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+    AND (search_query IS NULL OR r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+  ORDER BY r.created_at DESC, r.id DESC
+  OFFSET (result_page - 1) * result_limit
+  LIMIT result_limit;
+$$;
+
+-- ---------------------------------------------------------------------------
+-- Keyset variants: seek past (after_created_at, after_id)
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+      (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+      AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+COMMENT ON FUNCTION public.get_reports_in_bounds_after(
+  FLOAT, FLOAT, FLOAT, FLOAT, TEXT, TEXT, TIMESTAMPTZ, UUID, INT
+) IS 'Keyset variant of get_reports_in_bounds_page: seeks past (created_at, id) instead of OFFSET.';
+
+CREATE OR REPLACE FUNCTION public.get_reports_within_radius_after(
+  target_lat FLOAT,
+  target_lng FLOAT,
+  radius_meters FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 50
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  distance_meters FLOAT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+    (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) as vote_count,
+    (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) as comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+    AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+    AND public.report_matches_filters(r, category_filter, search_query)
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated_after(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) as vote_count,
+    (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) as comment_count
+  FROM public.reports r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+    AND (search_query IS NULL OR r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
@@ -0,0 +1,338 @@
+-- 20261016_report_change_versions.sql
+-- Delta sync for bounds queries: change versions, tombstones and
+-- get_report_changes_in_bounds.
+--
+-- Every insert and update of a report takes the next value of
+-- report_change_version_seq into reports.change_version. Deletes, and updates
+-- that move a report, leave a tombstone with the old location and the version
+-- of that change. A client that remembers the highest change_version it has
+-- seen asks get_report_changes_in_bounds for everything after it within its
+-- viewport:
+--
+--   items        rows in the envelope changed after since_version that match
+--                the filters (upsert)
+--   deleted_ids  tombstones in the envelope after since_version, and changed
+--                rows in the envelope that no longer match the filters (remove)
+--   version      the since_version to send next
+--   has_more     items was truncated at result_limit; version is then the
+--                last returned item's version and the rest follows next call
+--
+-- Clients apply deleted_ids before items, so a report that moved within the
+-- viewport ends up upserted.
+--
+-- Versions come from a sequence, so a transaction that commits after a
+-- concurrent delta read can still hold a version at or below the returned
+-- version. The window is one commit long; vote and comment counts do not bump
+-- the version. 20261016_report_version_commit_order.sql closes the window and
+-- bounds the tombstone table.
+--
+-- get_reports_in_bounds_page and get_reports_in_bounds_after are re-created
+-- unchanged except that rows now carry change_version, which gives a first
+-- since_version to a client that loaded the viewport with them. Their
+-- category/search predicates stay inlined (ADR-0010).
+
+CREATE SEQUENCE IF NOT EXISTS public.report_change_version_seq;
+
+ALTER TABLE public.reports ADD COLUMN IF NOT EXISTS change_version BIGINT;
+UPDATE public.reports
+SET change_version = nextval('public.report_change_version_seq')
+WHERE change_version IS NULL;
+ALTER TABLE public.reports
+  ALTER COLUMN change_version SET DEFAULT nextval('public.report_change_version_seq'),
+  ALTER COLUMN change_version SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS reports_change_version_idx
+  ON public.reports (change_version);
+
+CREATE TABLE IF NOT EXISTS public.report_tombstones (
+  change_version BIGINT PRIMARY KEY,
+  report_id UUID NOT NULL,
+  location GEOGRAPHY(POINT, 4326) NOT NULL,
+  removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE public.report_tombstones ENABLE ROW LEVEL SECURITY;
+
+-- ---------------------------------------------------------------------------
+-- Triggers
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.bump_report_change_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- The move tombstone takes the lower version so that a truncated delta page
+  -- never removes a report whose new row it has not returned yet.
+  IF NOT ST_Equals(NEW.location::geometry, OLD.location::geometry) THEN
+    INSERT INTO public.report_tombstones (change_version, report_id, location)
+    VALUES (nextval('public.report_change_version_seq'), OLD.id, OLD.location);
+  END IF;
+  NEW.change_version = nextval('public.report_change_version_seq');
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+CREATE OR REPLACE FUNCTION public.record_report_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO public.report_tombstones (change_version, report_id, location)
+  VALUES (nextval('public.report_change_version_seq'), OLD.id, OLD.location);
+  RETURN OLD;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+DROP TRIGGER IF EXISTS bump_reports_change_version ON public.reports;
+CREATE TRIGGER bump_reports_change_version
+  BEFORE UPDATE ON public.reports
+  FOR EACH ROW EXECUTE PROCEDURE public.bump_report_change_version();
+
+DROP TRIGGER IF EXISTS record_reports_tombstone ON public.reports;
+CREATE TRIGGER record_reports_tombstone
+  AFTER DELETE ON public.reports
+  FOR EACH ROW EXECUTE PROCEDURE public.record_report_tombstone();
+
+-- ---------------------------------------------------------------------------
+-- Delta RPC
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_report_changes_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  since_version BIGINT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH changed AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      (
+        (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+      ) AS matches
+    FROM public.reports r
+    WHERE
+      r.change_version > since_version
+      AND r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    ORDER BY r.change_version
+    LIMIT GREATEST(result_limit, 0) + 1
+  ),
+  page AS (
+    SELECT * FROM changed ORDER BY change_version LIMIT GREATEST(result_limit, 0)
+  ),
+  horizon AS (
+    SELECT
+      CASE
+        WHEN (SELECT count(*) FROM changed) > GREATEST(result_limit, 0)
+          THEN (SELECT max(change_version) FROM page)
+        ELSE GREATEST(
+          since_version,
+          (SELECT max(change_version) FROM public.reports),
+          (SELECT max(change_version) FROM public.report_tombstones)
+        )
+      END AS version,
+      (SELECT count(*) FROM changed) > GREATEST(result_limit, 0) AS has_more
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(
+          to_jsonb(p) - 'matches'
+            || jsonb_build_object(
+              'vote_count', (SELECT count(*) FROM public.votes v WHERE v.report_id = p.id),
+              'comment_count', (SELECT count(*) FROM public.comments c WHERE c.report_id = p.id)
+            )
+          ORDER BY p.change_version
+        )
+        FROM page p
+        WHERE p.matches
+      ),
+      '[]'::jsonb
+    ),
+    'deleted_ids',
+    COALESCE(
+      (
+        SELECT jsonb_agg(DISTINCT removed.id)
+        FROM (
+          SELECT p.id FROM page p WHERE NOT p.matches
+          UNION ALL
+          SELECT t.report_id
+          FROM public.report_tombstones t, horizon h
+          WHERE
+            t.change_version > since_version
+            AND t.change_version <= h.version
+            AND t.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        ) removed
+      ),
+      '[]'::jsonb
+    ),
+    'version', (SELECT version FROM horizon),
+    'has_more', (SELECT has_more FROM horizon)
+  );
+$$;
+
+COMMENT ON FUNCTION public.get_report_changes_in_bounds(
+  FLOAT, FLOAT, FLOAT, FLOAT, BIGINT, TEXT, TEXT, INT
+) IS 'Reports changed (upserts) and removed (deleted_ids) within bounds after since_version, for delta sync.';
+
+-- ---------------------------------------------------------------------------
+-- Bounds page RPCs: expose change_version
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+      (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+      (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+      AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
@@ -0,0 +1,78 @@
+-- 20261016_report_chunked_rows_in_bounds.sql
+-- Count-free keyset RPC for streaming bounds exports.
+--
+-- NDJSON streaming (app/api/responses.py) walks a bounds result in keyset
+-- chunks. get_reports_in_bounds_after recounts the whole envelope on every
+-- call, so a large export would pay that count once per chunk.
+-- get_report_rows_in_bounds_after has the same parameters, filters and
+-- (created_at DESC, id DESC) order and returns only the rows.
+--
+-- category/search predicates are inlined as in get_reports_in_bounds_page
+-- (ADR-0010).
+--
+-- The body reads reports.change_version, so this file must sort after
+-- 20261016_report_change_versions.sql: a LANGUAGE sql body is checked when
+-- the function is created.
+
+CREATE OR REPLACE FUNCTION public.get_report_rows_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  change_version BIGINT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.change_version,
+    (SELECT count(*) FROM public.votes v WHERE v.report_id = r.id) AS vote_count,
+    (SELECT count(*) FROM public.comments c WHERE c.report_id = r.id) AS comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    AND (category_filter IS NULL OR r.category::text = category_filter)
+    AND (
+      search_query IS NULL
+      OR r.title ILIKE '%' || search_query || '%'
+      OR r.description ILIKE '%' || search_query || '%'
+    )
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT GREATEST(result_limit, 0);
+$$;
+
+COMMENT ON FUNCTION public.get_report_rows_in_bounds_after(
+  FLOAT, FLOAT, FLOAT, FLOAT, TEXT, TEXT, TIMESTAMPTZ, UUID, INT
+) IS 'Rows-only keyset variant of get_reports_in_bounds_after for streaming exports (no total_count).';
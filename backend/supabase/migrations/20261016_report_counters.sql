@@ -0,0 +1,739 @@
+-- 20261016_report_counters.sql
+-- Denormalized vote and comment counters on reports.
+--
+-- Every read RPC computed vote_count and comment_count with two correlated
+-- count(*) subqueries per returned row, so page assembly slowed down as the
+-- votes and comments tables grew. reports.vote_count and
+-- reports.comment_count now hold the counts, kept exact by AFTER INSERT /
+-- DELETE (and report_id UPDATE) triggers on votes and comments that run in
+-- the same transaction as the vote or comment. Concurrent votes on one report
+-- serialize on that report's row lock.
+--
+-- repair_report_counters() recomputes both counters from votes and comments
+-- with one grouped scan and rewrites only the rows that differ. The migration
+-- uses it as the backfill; scripts/repair_report_counters.py runs it on
+-- demand (e.g. after a bulk import with triggers disabled).
+--
+-- Counter updates are ordinary updates of reports:
+--   - update_reports_updated_at now fires only for content columns, so a vote
+--     does not move updated_at.
+--   - bump_reports_change_version still fires, so a vote or comment gives the
+--     report a new change_version and delta sync re-sends it with the new
+--     counts.
+--
+-- Every read RPC is re-created with r.vote_count / r.comment_count in place of
+-- the subqueries; signatures, filters (ADR-0010 inlining where it applies) and
+-- ordering are unchanged.
+
+ALTER TABLE public.reports
+  ADD COLUMN IF NOT EXISTS vote_count BIGINT NOT NULL DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS comment_count BIGINT NOT NULL DEFAULT 0;
+
+-- ---------------------------------------------------------------------------
+-- Counter triggers
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.count_report_votes()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('DELETE', 'UPDATE') THEN
+    UPDATE public.reports SET vote_count = vote_count - 1 WHERE id = OLD.report_id;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    UPDATE public.reports SET vote_count = vote_count + 1 WHERE id = NEW.report_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+CREATE OR REPLACE FUNCTION public.count_report_comments()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('DELETE', 'UPDATE') THEN
+    UPDATE public.reports SET comment_count = comment_count - 1 WHERE id = OLD.report_id;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    UPDATE public.reports SET comment_count = comment_count + 1 WHERE id = NEW.report_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+DROP TRIGGER IF EXISTS count_votes_on_reports ON public.votes;
+CREATE TRIGGER count_votes_on_reports
+  AFTER INSERT OR DELETE OR UPDATE OF report_id ON public.votes
+  FOR EACH ROW EXECUTE PROCEDURE public.count_report_votes();
+
+DROP TRIGGER IF EXISTS count_comments_on_reports ON public.comments;
+CREATE TRIGGER count_comments_on_reports
+  AFTER INSERT OR DELETE OR UPDATE OF report_id ON public.comments
+  FOR EACH ROW EXECUTE PROCEDURE public.count_report_comments();
+
+-- Counter updates must not look like edits.
+DROP TRIGGER IF EXISTS update_reports_updated_at ON public.reports;
+CREATE TRIGGER update_reports_updated_at
+  BEFORE UPDATE OF user_id, title, description, image_url, location, address, category, status
+  ON public.reports
+  FOR EACH ROW EXECUTE PROCEDURE update_updated_at_column();
+
+-- ---------------------------------------------------------------------------
+-- Backfill / repair
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.repair_report_counters()
+RETURNS INT
+LANGUAGE sql VOLATILE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH vote_totals AS (
+    SELECT v.report_id, count(*) AS total FROM public.votes v GROUP BY v.report_id
+  ),
+  comment_totals AS (
+    SELECT c.report_id, count(*) AS total FROM public.comments c GROUP BY c.report_id
+  ),
+  actual AS (
+    SELECT
+      r.id,
+      COALESCE(vt.total, 0) AS vote_count,
+      COALESCE(ct.total, 0) AS comment_count
+    FROM public.reports r
+    LEFT JOIN vote_totals vt ON vt.report_id = r.id
+    LEFT JOIN comment_totals ct ON ct.report_id = r.id
+  ),
+  repaired AS (
+    UPDATE public.reports r
+    SET vote_count = a.vote_count, comment_count = a.comment_count
+    FROM actual a
+    WHERE
+      r.id = a.id
+      AND (r.vote_count, r.comment_count) IS DISTINCT FROM (a.vote_count, a.comment_count)
+    RETURNING r.id
+  )
+  SELECT count(*)::INT FROM repaired;
+$$;
+
+COMMENT ON FUNCTION public.repair_report_counters()
+  IS 'Recomputes reports.vote_count / comment_count from votes and comments; returns the number of rows fixed.';
+
+REVOKE EXECUTE ON FUNCTION public.repair_report_counters() FROM PUBLIC, anon, authenticated;
+
+SELECT public.repair_report_counters();
+
+-- ---------------------------------------------------------------------------
+-- Read RPCs: counters instead of per-row subqueries
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_report_changes_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  since_version BIGINT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH changed AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count,
+      (
+        (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+      ) AS matches
+    FROM public.reports r
+    WHERE
+      r.change_version > since_version
+      AND r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    ORDER BY r.change_version
+    LIMIT GREATEST(result_limit, 0) + 1
+  ),
+  page AS (
+    SELECT * FROM changed ORDER BY change_version LIMIT GREATEST(result_limit, 0)
+  ),
+  horizon AS (
+    SELECT
+      CASE
+        WHEN (SELECT count(*) FROM changed) > GREATEST(result_limit, 0)
+          THEN (SELECT max(change_version) FROM page)
+        ELSE GREATEST(
+          since_version,
+          (SELECT max(change_version) FROM public.reports),
+          (SELECT max(change_version) FROM public.report_tombstones)
+        )
+      END AS version,
+      (SELECT count(*) FROM changed) > GREATEST(result_limit, 0) AS has_more
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(
+          to_jsonb(p) - 'matches'
+          ORDER BY p.change_version
+        )
+        FROM page p
+        WHERE p.matches
+      ),
+      '[]'::jsonb
+    ),
+    'deleted_ids',
+    COALESCE(
+      (
+        SELECT jsonb_agg(DISTINCT removed.id)
+        FROM (
+          SELECT p.id FROM page p WHERE NOT p.matches
+          UNION ALL
+          SELECT t.report_id
+          FROM public.report_tombstones t, horizon h
+          WHERE
+            t.change_version > since_version
+            AND t.change_version <= h.version
+            AND t.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        ) removed
+      ),
+      '[]'::jsonb
+    ),
+    'version', (SELECT version FROM horizon),
+    'has_more', (SELECT has_more FROM horizon)
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+      AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_report_markers_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      round(ST_Y(r.location::geometry)::numeric, 6) AS lat,
+      round(ST_X(r.location::geometry)::numeric, 6) AS lng,
+      r.category,
+      r.status,
+      r.created_at,
+      r.vote_count,
+      r.comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (
+        search_query IS NULL
+        OR r.title ILIKE '%' || search_query || '%'
+        OR r.description ILIKE '%' || search_query || '%'
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM public.reports r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_report_rows_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  change_version BIGINT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.change_version,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    AND (category_filter IS NULL OR r.category::text = category_filter)
+    AND (
+      search_query IS NULL
+      OR r.title ILIKE '%' || search_query || '%'
+      OR r.description ILIKE '%' || search_query || '%'
+    )
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT GREATEST(result_limit, 0);
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_within_radius(
+  target_lat FLOAT,
+  target_lng FLOAT,
+  radius_meters FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 50
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  distance_meters FLOAT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+    AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+    AND public.report_matches_filters(r, category_filter, search_query)
+  ORDER BY r.created_at DESC, r.id DESC
+  OFFSET result_offset
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_within_radius_after(
+  target_lat FLOAT,
+  target_lng FLOAT,
+  radius_meters FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 50
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  distance_meters FLOAT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+    AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+    AND public.report_matches_filters(r, category_filter, search_query)
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_page INT DEFAULT 1,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+    AND (search_query IS NULL OR r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+  ORDER BY r.created_at DESC, r.id DESC
+  OFFSET (result_page - 1) * result_limit
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated_after(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+    AND (search_query IS NULL OR r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.vote_count,
+    r.comment_count
+  FROM public.reports r
+  WHERE
+    r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    AND public.report_matches_filters(r, category_filter, search_query)
+  ORDER BY r.created_at DESC
+  OFFSET result_offset
+  LIMIT result_limit;
+$$;
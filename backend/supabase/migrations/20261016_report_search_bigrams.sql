@@ -0,0 +1,617 @@
+-- 20261016_report_search_bigrams.sql
+-- Indexed report search.
+--
+-- Search is a substring match: title ILIKE '%q%' OR description ILIKE '%q%'.
+-- A leading wildcard cannot use a btree, so every spatial candidate (and, in
+-- get_reports_paginated / count_reports_paginated, the whole table) was
+-- filtered row by row.
+--
+-- reports_search_bigrams_idx is a GIN index over the distinct lower-cased
+-- character bigrams of title || ' ' || description. Bigrams rather than
+-- pg_trgm trigrams because most Korean search terms are two syllables
+-- ("소음", "주차"), which yield no trigram and would fall back to a full scan.
+-- Bigrams containing whitespace are skipped on both sides.
+--
+-- Every searched scan of public.reports becomes a two-branch source:
+--
+--   FROM (
+--     SELECT * FROM public.reports WHERE search_query IS NULL
+--     UNION ALL
+--     SELECT * FROM public.reports s
+--     WHERE search_query IS NOT NULL
+--       AND report_search_bigrams(s.title || ' ' || s.description)
+--         @> report_search_query_bigrams(search_query)
+--       AND (s.title ILIKE ... OR s.description ILIKE ...)
+--   ) r
+--
+-- If q is a substring of title or description, every bigram of q is a bigram
+-- of the indexed text, so the containment test never drops a match and the
+-- unchanged ILIKE pair rechecks the candidates: results are identical.
+--
+-- The RPCs are SECURITY DEFINER sql functions, so they are never inlined and
+-- their bodies are planned without the argument values (a generic plan).
+-- `search_query IS NULL OR (... @> ...)` is then one opaque OR filter and the
+-- GIN index is never used. Split into UNION ALL branches, each IS [NOT] NULL
+-- test is a one-time filter that skips its branch at run time, and the
+-- containment is a top-level condition of the search branch, which the
+-- planner can take as a GIN index condition (alone or ANDed with the spatial
+-- index). The outer spatial, category and keyset conditions are pushed into
+-- both branches, so the unsearched plan is the same as before.
+-- report_search_query_bigrams blanks out ILIKE wildcards and escapes (% _ \)
+-- first, so only literal runs of q contribute bigrams. A one-character query
+-- has no bigrams; containment of '{}' is always true and the search scans as
+-- before.
+--
+-- Re-created: the inlined bounds RPCs (ADR-0010), the paginated list RPCs,
+-- the grid aggregation RPC and report_matches_filters (radius RPCs and the
+-- legacy bounds RPC). report_matches_filters is a per-row predicate and keeps
+-- the OR form; only the containment guard is added there.
+-- get_report_changes_in_bounds is left alone: there the search predicate only
+-- labels rows already selected by change_version.
+--
+-- scripts/sql/search_bigram_plan_benchmark.sql times RPC-shaped sql
+-- functions (same attributes, generic plan) with the old and the new source on
+-- a synthetic 1M-row table and prints their plans.
+
+CREATE OR REPLACE FUNCTION public.report_search_bigrams(body TEXT)
+RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+  SELECT COALESCE(array_agg(DISTINCT bigram), '{}')
+  FROM (
+    SELECT substr(s.t, i, 2) AS bigram
+    FROM (SELECT lower(body) AS t) s, generate_series(1, char_length(s.t) - 1) AS i
+  ) bigrams
+  WHERE bigram !~ '\s'
+$$;
+
+CREATE OR REPLACE FUNCTION public.report_search_query_bigrams(search_query TEXT)
+RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+  SELECT public.report_search_bigrams(regexp_replace(search_query, '[%_\\]', ' ', 'g'))
+$$;
+
+COMMENT ON FUNCTION public.report_search_bigrams(TEXT)
+  IS 'Distinct lower-cased character bigrams without whitespace; key of reports_search_bigrams_idx.';
+
+CREATE INDEX IF NOT EXISTS reports_search_bigrams_idx
+  ON public.reports USING GIN (public.report_search_bigrams(title || ' ' || description));
+
+-- ---------------------------------------------------------------------------
+-- Shared filter helper (radius RPCs, legacy bounds RPC)
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.report_matches_filters(
+  r public.reports,
+  category_filter TEXT,
+  search_query TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE sql IMMUTABLE
+AS $$
+  SELECT
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (
+      search_query IS NULL
+      OR (
+        (r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')
+        AND public.report_search_bigrams(r.title || ' ' || r.description)
+          @> public.report_search_query_bigrams(search_query)
+      )
+    )
+$$;
+
+-- ---------------------------------------------------------------------------
+-- Inlined search predicates
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+      AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_report_markers_in_bounds_page(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_offset INT DEFAULT 0,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    SELECT
+      r.id,
+      round(ST_Y(r.location::geometry)::numeric, 6) AS lat,
+      round(ST_X(r.location::geometry)::numeric, 6) AS lng,
+      r.category,
+      r.status,
+      r.created_at,
+      r.vote_count,
+      r.comment_count
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+    ORDER BY r.created_at DESC, r.id DESC
+    OFFSET GREATEST(result_offset, 0)
+    LIMIT GREATEST(result_limit, 0)
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_report_rows_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  change_version BIGINT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.change_version,
+    r.vote_count,
+    r.comment_count
+  FROM (
+    SELECT * FROM public.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM public.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r
+  WHERE
+    r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    AND (category_filter IS NULL OR r.category::text = category_filter)
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT GREATEST(result_limit, 0);
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_page INT DEFAULT 1,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.vote_count,
+    r.comment_count
+  FROM (
+    SELECT * FROM public.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM public.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+  ORDER BY r.created_at DESC, r.id DESC
+  OFFSET (result_page - 1) * result_limit
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated_after(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT
+    r.id,
+    r.user_id,
+    r.title,
+    r.description,
+    r.image_url,
+    r.location,
+    r.address,
+    r.category,
+    r.status,
+    r.created_at,
+    r.updated_at,
+    r.vote_count,
+    r.comment_count
+  FROM (
+    SELECT * FROM public.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM public.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+    AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+  ORDER BY r.created_at DESC, r.id DESC
+  LIMIT result_limit;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_report_grid_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  cell_degrees FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH matched AS (
+    SELECT
+      ST_Y(r.location::geometry) AS lat,
+      ST_X(r.location::geometry) AS lng,
+      r.category::text AS category
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+      AND (category_filter IS NULL OR r.category::text = category_filter)
+  ),
+  cell_categories AS (
+    SELECT
+      floor((m.lng + 180.0) / cell_degrees)::INT AS x,
+      floor((m.lat + 90.0) / cell_degrees)::INT AS y,
+      m.category,
+      count(*) AS report_count,
+      sum(m.lat) AS lat_sum,
+      sum(m.lng) AS lng_sum
+    FROM matched m
+    GROUP BY 1, 2, 3
+  ),
+  cells AS (
+    SELECT
+      c.x,
+      c.y,
+      sum(c.report_count) AS report_count,
+      sum(c.lat_sum) / sum(c.report_count) AS lat,
+      sum(c.lng_sum) / sum(c.report_count) AS lng,
+      jsonb_object_agg(c.category, c.report_count) AS categories
+    FROM cell_categories c
+    GROUP BY c.x, c.y
+  )
+  SELECT jsonb_build_object(
+    'cells',
+    COALESCE(
+      (
+        SELECT jsonb_agg(
+          jsonb_build_object(
+            'x', cell.x,
+            'y', cell.y,
+            'count', cell.report_count,
+            'lat', cell.lat,
+            'lng', cell.lng,
+            'categories', cell.categories
+          )
+          ORDER BY cell.y, cell.x
+        )
+        FROM cells cell
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (SELECT count(*) FROM matched)
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.count_reports_paginated(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL
+)
+RETURNS INT
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  SELECT count(*)::int
+  FROM (
+    SELECT * FROM public.reports WHERE search_query IS NULL
+    UNION ALL
+    SELECT * FROM public.reports s
+    WHERE
+      search_query IS NOT NULL
+      AND public.report_search_bigrams(s.title || ' ' || s.description)
+        @> public.report_search_query_bigrams(search_query)
+      AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+  ) r
+  WHERE
+    (category_filter IS NULL OR r.category::text = category_filter)
+    AND (status_filter IS NULL OR r.status::text = status_filter)
+    AND (user_id_filter IS NULL OR r.user_id = user_id_filter);
+$$;
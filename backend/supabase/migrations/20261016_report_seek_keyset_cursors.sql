@@ -0,0 +1,320 @@
+-- 20261016_report_seek_keyset_cursors.sql
+-- Keyset RPCs that seek to the cursor.
+--
+-- 20261016_keyset_pagination.sql filtered the cursor as
+--
+--   AND (after_created_at IS NULL OR (r.created_at, r.id) < (after_created_at, after_id))
+--
+-- The RPCs are SECURITY DEFINER sql functions, so they are never inlined and
+-- their bodies are planned without the argument values (a generic plan; see
+-- 20261016_report_search_bigrams.sql). The OR is then one opaque filter:
+-- reports_created_at_id_idx is walked from the newest row and every row
+-- before the cursor is read and discarded, so page N costs N pages.
+--
+-- Each *_after RPC now runs its page query as two UNION ALL branches, one
+-- with `after_created_at IS NULL` and one with `after_created_at IS NOT NULL`.
+-- Those tests are one-time filters that skip the other branch at run time,
+-- and in the cursor branch the row comparison is a top-level condition the
+-- planner can take as an index condition on reports_created_at_id_idx (an
+-- index seek). Each branch keeps its own ORDER BY / LIMIT; the RETURNS TABLE
+-- RPCs sort the (at most one non-empty) result again so the order is stated,
+-- not implied. Filters, columns and the ADR-0010 inlining are unchanged.
+--
+-- scripts/sql/keyset_seek_plan_benchmark.sql asserts the generic plan of the
+-- cursor branch seeks, and times deep pages with the old and new shapes.
+
+CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_after(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH page_reports AS (
+    (
+      SELECT
+        r.id,
+        r.user_id,
+        r.title,
+        r.description,
+        r.image_url,
+        r.location,
+        r.address,
+        r.category,
+        r.status,
+        r.created_at,
+        r.updated_at,
+        r.change_version,
+        r.vote_count,
+        r.comment_count
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND after_created_at IS NULL
+      ORDER BY r.created_at DESC, r.id DESC
+      LIMIT GREATEST(result_limit, 0)
+    )
+    UNION ALL
+    (
+      SELECT
+        r.id,
+        r.user_id,
+        r.title,
+        r.description,
+        r.image_url,
+        r.location,
+        r.address,
+        r.category,
+        r.status,
+        r.created_at,
+        r.updated_at,
+        r.change_version,
+        r.vote_count,
+        r.comment_count
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+        AND after_created_at IS NOT NULL
+        AND (r.created_at, r.id) < (after_created_at, after_id)
+      ORDER BY r.created_at DESC, r.id DESC
+      LIMIT GREATEST(result_limit, 0)
+    )
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(to_jsonb(page_report) ORDER BY page_report.created_at DESC, page_report.id DESC)
+        FROM page_reports page_report
+      ),
+      '[]'::jsonb
+    ),
+    'total_count',
+    (
+      SELECT count(*)
+      FROM (
+        SELECT * FROM public.reports WHERE search_query IS NULL
+        UNION ALL
+        SELECT * FROM public.reports s
+        WHERE
+          search_query IS NOT NULL
+          AND public.report_search_bigrams(s.title || ' ' || s.description)
+            @> public.report_search_query_bigrams(search_query)
+          AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+      ) r
+      WHERE
+        r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        AND (category_filter IS NULL OR r.category::text = category_filter)
+    )
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_within_radius_after(
+  target_lat FLOAT,
+  target_lng FLOAT,
+  radius_meters FLOAT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 50
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  distance_meters FLOAT,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+      r.vote_count,
+      r.comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+      AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+      AND public.report_matches_filters(r, category_filter, search_query)
+      AND after_created_at IS NULL
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  UNION ALL
+  (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      ST_Distance(r.location, ST_MakePoint(target_lng, target_lat)::geography) as distance_meters,
+      r.vote_count,
+      r.comment_count
+    FROM public.reports r
+    WHERE
+      r.location && ST_Expand(ST_MakePoint(target_lng, target_lat), radius_meters / 111320.0)::geography
+      AND ST_DWithin(r.location, ST_MakePoint(target_lng, target_lat)::geography, radius_meters)
+      AND public.report_matches_filters(r, category_filter, search_query)
+      AND after_created_at IS NOT NULL
+      AND (r.created_at, r.id) < (after_created_at, after_id)
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  ORDER BY created_at DESC, id DESC;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_reports_paginated_after(
+  category_filter TEXT DEFAULT NULL,
+  status_filter TEXT DEFAULT NULL,
+  user_id_filter UUID DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  after_created_at TIMESTAMPTZ DEFAULT NULL,
+  after_id UUID DEFAULT NULL,
+  result_limit INT DEFAULT 100
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  title TEXT,
+  description TEXT,
+  image_url TEXT,
+  location GEOGRAPHY,
+  address TEXT,
+  category report_category,
+  status report_status,
+  created_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ,
+  vote_count BIGINT,
+  comment_count BIGINT
+)
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.vote_count,
+      r.comment_count
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      (category_filter IS NULL OR r.category::text = category_filter)
+      AND (status_filter IS NULL OR r.status::text = status_filter)
+      AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+      AND after_created_at IS NULL
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  UNION ALL
+  (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.vote_count,
+      r.comment_count
+    FROM (
+      SELECT * FROM public.reports WHERE search_query IS NULL
+      UNION ALL
+      SELECT * FROM public.reports s
+      WHERE
+        search_query IS NOT NULL
+        AND public.report_search_bigrams(s.title || ' ' || s.description)
+          @> public.report_search_query_bigrams(search_query)
+        AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')
+    ) r
+    WHERE
+      (category_filter IS NULL OR r.category::text = category_filter)
+      AND (status_filter IS NULL OR r.status::text = status_filter)
+      AND (user_id_filter IS NULL OR r.user_id = user_id_filter)
+      AND after_created_at IS NOT NULL
+      AND (r.created_at, r.id) < (after_created_at, after_id)
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT result_limit
+  )
+  ORDER BY created_at DESC, id DESC;
+$$;
@@ -0,0 +1,42 @@
+-- 20261016_report_system_columns_guard.sql
+-- Keep client writes away from trigger-maintained report columns.
+--
+-- reports.vote_count / comment_count (20261016_report_counters.sql) and
+-- reports.change_version (20261016_report_change_versions.sql) are ordinary
+-- columns, and the "Users can update own reports" / insert policies let an
+-- owner write any column through PostgREST. A forged count or version would
+-- flow into every map RPC, cache entry and ETag.
+--
+-- A column-level REVOKE does not help here: Supabase grants table-level
+-- INSERT/UPDATE to anon and authenticated, and a table-level grant covers
+-- every column. guard_report_system_columns instead resets the columns
+-- whenever the writing role is anon or authenticated:
+--   INSERT  counters start at 0, change_version takes the next sequence value
+--   UPDATE  counters keep their old values; change_version is already
+--           replaced by bump_reports_change_version
+-- The counter triggers and repair_report_counters() are SECURITY DEFINER, so
+-- their updates run as the function owner and pass through unchanged, as do
+-- backend writes with the service role.
+
+CREATE OR REPLACE FUNCTION public.guard_report_system_columns()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF current_user NOT IN ('anon', 'authenticated') THEN
+    RETURN NEW;
+  END IF;
+  IF TG_OP = 'INSERT' THEN
+    NEW.vote_count = 0;
+    NEW.comment_count = 0;
+    NEW.change_version = nextval('public.report_change_version_seq');
+  ELSE
+    NEW.vote_count = OLD.vote_count;
+    NEW.comment_count = OLD.comment_count;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SET search_path = public, extensions;
+
+DROP TRIGGER IF EXISTS guard_reports_system_columns ON public.reports;
+CREATE TRIGGER guard_reports_system_columns
+  BEFORE INSERT OR UPDATE ON public.reports
+  FOR EACH ROW EXECUTE PROCEDURE public.guard_report_system_columns();
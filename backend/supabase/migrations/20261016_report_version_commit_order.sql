@@ -0,0 +1,256 @@
+-- 20261016_report_version_commit_order.sql
+-- Delta sync (20261016_report_change_versions.sql) without lost changes, and
+-- bounded tombstones.
+--
+-- Change versions in commit order
+-- -------------------------------
+-- change_version came straight from nextval at write time. A transaction
+-- could take version 10, stay open while another took 11 and committed, and
+-- a delta read in between returned version 11; the client then never asked
+-- for anything at or below 11 and the row with version 10 was skipped for
+-- good. The spatial index sync (_fetch_after_version) had the same hole.
+--
+-- next_report_change_version() takes a transaction-scoped advisory lock
+-- before nextval. The lock is held until the transaction ends and is released
+-- only after the commit is visible, so a version is handed out only when every
+-- transaction holding a lower one has committed or rolled back. Any snapshot
+-- that sees version v therefore sees every committed version below v, and the
+-- max(change_version) a delta read returns is a safe watermark.
+--
+-- The cost is that report writes (including the counter updates from votes
+-- and comments, which bump the version) run one transaction at a time from
+-- their first version to their commit. PostgREST writes are single-statement
+-- transactions, so the lock is held for the length of one statement. A
+-- multi-statement transaction that updates reports in a different order than
+-- a concurrent one can deadlock on the lock; PostgreSQL detects it and aborts
+-- one of them.
+--
+-- Tombstone retention
+-- -------------------
+-- prune_report_tombstones(retention) deletes tombstones older than retention
+-- and raises report_tombstone_floor.version to the highest version removed. A
+-- delta read with since_version below the floor may have missed a delete, so
+-- get_report_changes_in_bounds answers it with reset = true and no items: the
+-- client reloads the viewport and continues from the returned version. With
+-- pg_cron installed the prune runs daily with a 30-day retention; otherwise
+-- schedule `SELECT public.prune_report_tombstones();` yourself.
+
+-- Arbitrary constant: the advisory lock key for report change versions.
+CREATE OR REPLACE FUNCTION public.next_report_change_version()
+RETURNS BIGINT AS $$
+BEGIN
+  PERFORM pg_advisory_xact_lock(8246017);
+  RETURN nextval('public.report_change_version_seq');
+END;
+$$ LANGUAGE plpgsql VOLATILE SECURITY DEFINER SET search_path = public, extensions;
+
+COMMENT ON FUNCTION public.next_report_change_version()
+  IS 'Next reports change_version; serialises version holders until commit so versions become visible in order.';
+
+ALTER TABLE public.reports
+  ALTER COLUMN change_version SET DEFAULT public.next_report_change_version();
+
+CREATE OR REPLACE FUNCTION public.bump_report_change_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- The move tombstone takes the lower version so that a truncated delta page
+  -- never removes a report whose new row it has not returned yet.
+  IF NOT ST_Equals(NEW.location::geometry, OLD.location::geometry) THEN
+    INSERT INTO public.report_tombstones (change_version, report_id, location)
+    VALUES (public.next_report_change_version(), OLD.id, OLD.location);
+  END IF;
+  NEW.change_version = public.next_report_change_version();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+CREATE OR REPLACE FUNCTION public.record_report_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO public.report_tombstones (change_version, report_id, location)
+  VALUES (public.next_report_change_version(), OLD.id, OLD.location);
+  RETURN OLD;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, extensions;
+
+CREATE OR REPLACE FUNCTION public.guard_report_system_columns()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF current_user NOT IN ('anon', 'authenticated') THEN
+    RETURN NEW;
+  END IF;
+  IF TG_OP = 'INSERT' THEN
+    NEW.vote_count = 0;
+    NEW.comment_count = 0;
+    NEW.change_version = public.next_report_change_version();
+  ELSE
+    NEW.vote_count = OLD.vote_count;
+    NEW.comment_count = OLD.comment_count;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SET search_path = public, extensions;
+
+-- ---------------------------------------------------------------------------
+-- Tombstone retention
+-- ---------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS public.report_tombstone_floor (
+  singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+  version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO public.report_tombstone_floor (singleton, version)
+VALUES (TRUE, 0)
+ON CONFLICT (singleton) DO NOTHING;
+
+ALTER TABLE public.report_tombstone_floor ENABLE ROW LEVEL SECURITY;
+
+CREATE INDEX IF NOT EXISTS report_tombstones_removed_at_idx
+  ON public.report_tombstones (removed_at);
+
+CREATE OR REPLACE FUNCTION public.prune_report_tombstones(retention INTERVAL DEFAULT INTERVAL '30 days')
+RETURNS INT
+LANGUAGE sql VOLATILE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH pruned AS (
+    DELETE FROM public.report_tombstones
+    WHERE removed_at < NOW() - retention
+    RETURNING change_version
+  ),
+  raised AS (
+    UPDATE public.report_tombstone_floor f
+    SET version = GREATEST(f.version, (SELECT max(change_version) FROM pruned))
+    WHERE EXISTS (SELECT 1 FROM pruned)
+    RETURNING f.version
+  )
+  SELECT count(*)::INT FROM pruned;
+$$;
+
+COMMENT ON FUNCTION public.prune_report_tombstones(INTERVAL)
+  IS 'Deletes tombstones older than retention and raises report_tombstone_floor; returns the number deleted.';
+
+REVOKE EXECUTE ON FUNCTION public.prune_report_tombstones(INTERVAL) FROM PUBLIC, anon, authenticated;
+
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+    PERFORM cron.schedule(
+      'prune-report-tombstones', '17 3 * * *', 'SELECT public.prune_report_tombstones()'
+    );
+  END IF;
+END;
+$$;
+
+-- ---------------------------------------------------------------------------
+-- Delta RPC: reset below the tombstone floor
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.get_report_changes_in_bounds(
+  north FLOAT,
+  south FLOAT,
+  east FLOAT,
+  west FLOAT,
+  since_version BIGINT,
+  category_filter TEXT DEFAULT NULL,
+  search_query TEXT DEFAULT NULL,
+  result_limit INT DEFAULT 500
+)
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+  WITH expired AS (
+    SELECT since_version < f.version AS reset
+    FROM public.report_tombstone_floor f
+  ),
+  changed AS (
+    SELECT
+      r.id,
+      r.user_id,
+      r.title,
+      r.description,
+      r.image_url,
+      r.location,
+      r.address,
+      r.category,
+      r.status,
+      r.created_at,
+      r.updated_at,
+      r.change_version,
+      r.vote_count,
+      r.comment_count,
+      (
+        (category_filter IS NULL OR r.category::text = category_filter)
+        AND (
+          search_query IS NULL
+          OR r.title ILIKE '%' || search_query || '%'
+          OR r.description ILIKE '%' || search_query || '%'
+        )
+      ) AS matches
+    FROM public.reports r
+    WHERE
+      NOT (SELECT reset FROM expired)
+      AND r.change_version > since_version
+      AND r.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+    ORDER BY r.change_version
+    LIMIT GREATEST(result_limit, 0) + 1
+  ),
+  page AS (
+    SELECT * FROM changed ORDER BY change_version LIMIT GREATEST(result_limit, 0)
+  ),
+  horizon AS (
+    SELECT
+      CASE
+        WHEN (SELECT count(*) FROM changed) > GREATEST(result_limit, 0)
+          THEN (SELECT max(change_version) FROM page)
+        ELSE GREATEST(
+          since_version,
+          (SELECT max(change_version) FROM public.reports),
+          (SELECT max(change_version) FROM public.report_tombstones),
+          (SELECT version FROM public.report_tombstone_floor)
+        )
+      END AS version,
+      (SELECT count(*) FROM changed) > GREATEST(result_limit, 0) AS has_more
+  )
+  SELECT jsonb_build_object(
+    'items',
+    COALESCE(
+      (
+        SELECT jsonb_agg(
+          to_jsonb(p) - 'matches'
+          ORDER BY p.change_version
+        )
+        FROM page p
+        WHERE p.matches
+      ),
+      '[]'::jsonb
+    ),
+    'deleted_ids',
+    COALESCE(
+      (
+        SELECT jsonb_agg(DISTINCT removed.id)
+        FROM (
+          SELECT p.id FROM page p WHERE NOT p.matches
+          UNION ALL
+          SELECT t.report_id
+          FROM public.report_tombstones t, horizon h
+          WHERE
+            NOT (SELECT reset FROM expired)
+            AND t.change_version > since_version
+            AND t.change_version <= h.version
+            AND t.location && ST_MakeEnvelope(west, south, east, north, 4326)::geography
+        ) removed
+      ),
+      '[]'::jsonb
+    ),
+    'version', (SELECT version FROM horizon),
+    'has_more', (SELECT has_more FROM horizon),
+    'reset', (SELECT reset FROM expired)
+  );
+$$;
+
+COMMENT ON FUNCTION public.get_report_changes_in_bounds(
+  FLOAT, FLOAT, FLOAT, FLOAT, BIGINT, TEXT, TEXT, INT
+) IS 'Reports changed (upserts) and removed (deleted_ids) within bounds after since_version, for delta sync; reset when since_version predates the pruned tombstones.';
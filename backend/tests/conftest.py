@@ -7,6 +7,7 @@ os.environ["SUPABASE_URL"] = "https://example.supabase.co"
 os.environ["SUPABASE_KEY"] = "dummy-key"
 os.environ["JWT_SECRET"] = "test-secret"
 os.environ["ENVIRONMENT"] = "testing"
+os.environ["STRICT_RESPONSE_VALIDATION"] = "true"
 
 
 @pytest.fixture
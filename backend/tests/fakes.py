@@ -1,16 +1,48 @@
 """Test fakes implementing the same interfaces as production adapters."""
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.bounds_tiles import Tile
+from app.services.spatial_report_cache import StaleEntry
+from app.utils.geo import calculate_distance
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 class FakeSpatialReportCache:
     """In-memory fake with the same interface as SpatialReportCache.
 
-    No TTL, no maxsize — entries live until invalidate_all().
+    No TTL, no maxsize — entries live until invalidated, so get_stale_* never
+    finds anything. invalidate_locations() scans every entry; nearby entries
+    use the exact radius instead of the real adapter's bounding box.
     """
 
     def __init__(self) -> None:
         self._nearby: Dict[Any, Dict[str, Any]] = {}
+        self._nearby_bodies: Dict[Any, Dict[str, Any]] = {}
         self._bounds: Dict[Any, Dict[str, Any]] = {}
+        self._bounds_bodies: Dict[Any, Dict[str, Any]] = {}
+        self._bounds_markers: Dict[Any, Dict[str, Any]] = {}
+        self._bounds_groups: Dict[Any, Dict[str, Any]] = {}
+        self._bounds_grids: Dict[Any, Dict[str, Any]] = {}
+        self._bounds_tiles: Dict[Any, Dict[str, Any]] = {}
+        self._contains: Dict[Any, Callable[[float, float], bool]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def get_nearby(
         self,
@@ -25,6 +57,19 @@ class FakeSpatialReportCache:
     ) -> Optional[Dict[str, Any]]:
         return self._nearby.get((lat, lng, radius_km, category, search, page, limit))
 
+    def get_stale_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return None
+
     def put_nearby(
         self,
         *,
@@ -37,7 +82,42 @@ class FakeSpatialReportCache:
         limit: int,
         value: Dict[str, Any],
     ) -> None:
-        self._nearby[(lat, lng, radius_km, category, search, page, limit)] = value
+        key = (lat, lng, radius_km, category, search, page, limit)
+        self._nearby[key] = value
+        self._contains[("nearby", key)] = (
+            lambda p_lat, p_lng: calculate_distance(lat, lng, p_lat, p_lng) <= radius_km * 1000
+        )
+
+    def get_nearby_body(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._nearby_bodies.get((lat, lng, radius_km, category, search, page, limit))
+
+    def put_nearby_body(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        key = (lat, lng, radius_km, category, search, page, limit)
+        self._nearby_bodies[key] = value
+        self._contains[("nearby_body", key)] = (
+            lambda p_lat, p_lng: calculate_distance(lat, lng, p_lat, p_lng) <= radius_km * 1000
+        )
 
     def get_bounds(
         self,
@@ -53,6 +133,20 @@ class FakeSpatialReportCache:
     ) -> Optional[Dict[str, Any]]:
         return self._bounds.get((north, south, east, west, category, search, page, limit))
 
+    def get_stale_bounds(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return None
+
     def put_bounds(
         self,
         *,
@@ -66,8 +160,297 @@ class FakeSpatialReportCache:
         limit: int,
         value: Dict[str, Any],
     ) -> None:
-        self._bounds[(north, south, east, west, category, search, page, limit)] = value
+        key = (north, south, east, west, category, search, page, limit)
+        self._bounds[key] = value
+        self._contains[("bounds", key)] = (
+            lambda p_lat, p_lng: south <= p_lat <= north and west <= p_lng <= east
+        )
+
+    def get_bounds_body(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._bounds_bodies.get((north, south, east, west, category, search, page, limit))
+
+    def put_bounds_body(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        key = (north, south, east, west, category, search, page, limit)
+        self._bounds_bodies[key] = value
+        self._contains[("bounds_body", key)] = (
+            lambda p_lat, p_lng: south <= p_lat <= north and west <= p_lng <= east
+        )
+
+    def get_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._bounds_markers.get((north, south, east, west, category, search, page, limit))
+
+    def get_stale_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return None
+
+    def put_bounds_markers(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        key = (north, south, east, west, category, search, page, limit)
+        self._bounds_markers[key] = value
+        self._contains[("bounds_markers", key)] = (
+            lambda p_lat, p_lng: south <= p_lat <= north and west <= p_lng <= east
+        )
+
+    def get_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[Dict[str, Any]]:
+        return self._bounds_groups.get((north, south, east, west, category, search, page, limit))
+
+    def get_stale_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+    ) -> Optional[StaleEntry]:
+        return None
+
+    def put_bounds_groups(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        category: Optional[str],
+        search: Optional[str],
+        page: int,
+        limit: int,
+        value: Dict[str, Any],
+    ) -> None:
+        key = (north, south, east, west, category, search, page, limit)
+        self._bounds_groups[key] = value
+        self._contains[("bounds_groups", key)] = (
+            lambda p_lat, p_lng: south <= p_lat <= north and west <= p_lng <= east
+        )
+
+    def get_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        return self._bounds_grids.get((north, south, east, west, zoom, category, search))
+
+    def get_stale_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[StaleEntry]:
+        return None
+
+    def put_bounds_grid(
+        self,
+        *,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        zoom: int,
+        category: Optional[str],
+        search: Optional[str],
+        value: Dict[str, Any],
+    ) -> None:
+        key = (north, south, east, west, zoom, category, search)
+        self._bounds_grids[key] = value
+        self._contains[("bounds_grid", key)] = (
+            lambda p_lat, p_lng: south <= p_lat <= north and west <= p_lng <= east
+        )
+
+    def get_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        return self._bounds_tiles.get((tile, category, search))
+
+    def get_stale_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+    ) -> Optional[StaleEntry]:
+        return None
+
+    def put_bounds_tile(
+        self,
+        *,
+        tile: Tile,
+        category: Optional[str],
+        search: Optional[str],
+        value: Dict[str, Any],
+    ) -> None:
+        key = (tile, category, search)
+        self._bounds_tiles[key] = value
+        self._contains[("bounds_tile", key)] = (
+            lambda p_lat, p_lng: tile.south <= p_lat <= tile.north and tile.west <= p_lng <= tile.east
+        )
+
+    def invalidate_locations(self, locations: Iterable[Dict[str, float]]) -> None:
+        tables = {
+            "nearby": self._nearby,
+            "nearby_body": self._nearby_bodies,
+            "bounds": self._bounds,
+            "bounds_body": self._bounds_bodies,
+            "bounds_markers": self._bounds_markers,
+            "bounds_groups": self._bounds_groups,
+            "bounds_grid": self._bounds_grids,
+            "bounds_tile": self._bounds_tiles,
+        }
+        for location in locations:
+            for entry, contains in list(self._contains.items()):
+                if contains(location["lat"], location["lng"]):
+                    name, key = entry
+                    tables[name].pop(key, None)
+                    del self._contains[entry]
+        self._generation += 1
 
     def invalidate_all(self) -> None:
         self._nearby.clear()
+        self._nearby_bodies.clear()
         self._bounds.clear()
+        self._bounds_bodies.clear()
+        self._bounds_markers.clear()
+        self._bounds_groups.clear()
+        self._bounds_grids.clear()
+        self._bounds_tiles.clear()
+        self._contains.clear()
+        self._generation += 1
+
+
+class FakeTableReads:
+    """Read side of a PostgREST table over in-memory rows: select().gt/gte/lt().order().limit().execute().
+
+    Anything else — insert/update/delete, or eq()/single() after select() — goes to `fallback`
+    (usually `supabase.table.return_value`), so MagicMock chains a test configures keep working.
+    Rows are returned whole regardless of the selected columns.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], fallback: Any) -> None:
+        self._rows = rows
+        self._fallback = fallback
+        self._filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self._order: Optional[Tuple[str, bool]] = None
+        self._limit: Optional[int] = None
+        self._columns = "*"
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("insert", "update", "delete", "upsert"):
+            return getattr(self._fallback, name)
+        return getattr(self._fallback.select(self._columns), name)
+
+    def select(self, columns: str) -> "FakeTableReads":
+        self._columns = columns
+        return self
+
+    def gt(self, column: str, value: Any) -> "FakeTableReads":
+        self._filters.append(lambda row: row[column] > value)
+        return self
+
+    def gte(self, column: str, value: Any) -> "FakeTableReads":
+        self._filters.append(lambda row: row[column] >= value)
+        return self
+
+    def lt(self, column: str, value: Any) -> "FakeTableReads":
+        self._filters.append(lambda row: row[column] < value)
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeTableReads":
+        self._order = (column, desc)
+        return self
+
+    def limit(self, count: int) -> "FakeTableReads":
+        self._limit = count
+        return self
+
+    def execute(self) -> Any:
+        rows = [dict(row) for row in self._rows if all(f(row) for f in self._filters)]
+        if self._order is not None:
+            column, desc = self._order
+            rows.sort(key=lambda row: row[column], reverse=desc)
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return SimpleNamespace(data=rows)
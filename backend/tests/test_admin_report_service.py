@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 from app.services.admin.report_service import AdminReportService
 from app.services.report_service import ReportService
+from app.services.report_spatial_index import ReportSpatialIndex
 from tests.fakes import FakeSpatialReportCache
 
 
@@ -145,7 +146,7 @@ async def test_get_reports_error(mocker):
     assert result == []
 
 
-# --- 지도 조회 캐시 무효화 (ADR-0001: admin 상태 변경도 무효화 경로에 합류) ---
+# --- 지도 조회 캐시 무효화 (ADR-0011: admin 상태 변경도 무효화 경로에 합류) ---
 
 NEARBY = {"lat": 37.5665, "lng": 126.9780}
 
@@ -238,3 +239,57 @@ async def test_admin_bulk_action_immediately_visible_in_map_query(mocker):
 
     second = await map_service.get_nearby_reports(**NEARBY)
     assert second["items"][0]["status"] == "RESOLVED"
+
+
+@pytest.mark.asyncio
+async def test_admin_mutations_update_shared_spatial_index(mocker):
+    index = ReportSpatialIndex()
+    index.load([
+        {"id": "r1", "location": {"lat": 37.5665, "lng": 126.9780}, "created_at": "2026-01-01",
+         "category": "OTHER", "status": "OPEN", "vote_count": 3},
+        {"id": "r2", "location": {"lat": 37.5665, "lng": 126.9780}, "created_at": "2026-01-02",
+         "category": "OTHER", "status": "OPEN", "vote_count": 0},
+    ])
+    mock_supabase = mocker.Mock()
+    admin_service = AdminReportService(
+        mock_supabase, FakeSpatialReportCache(), log_admin_activity=mocker.AsyncMock(), spatial_index=index
+    )
+    mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
+        "id": "r1", "status": "OPEN", "title": "Test"
+    }
+    mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+        {"id": "r1", "location": "POINT(126.9780 37.5665)", "created_at": "2026-01-01",
+         "category": "OTHER", "status": "RESOLVED"}
+    ]
+
+    await admin_service.update_report_status("r1", "RESOLVED", None, None, str(uuid4()))
+    await admin_service.perform_report_action("r2", "delete", None, None, None, str(uuid4()), "admin")
+
+    items, total = index.query_bounds(
+        north=37.6, south=37.5, east=127.0, west=126.9, category=None, offset=0, limit=10
+    )
+    assert total == 1
+    assert items[0]["status"] == "RESOLVED"
+    assert items[0]["vote_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_admin_status_change_elsewhere_keeps_map_query_cache(mocker):
+    cache = FakeSpatialReportCache()
+    report_state = {"status": "OPEN"}
+    map_service = make_map_service(cache, report_state)
+
+    mock_supabase = mocker.Mock()
+    admin_service = AdminReportService(mock_supabase, cache, log_admin_activity=mocker.AsyncMock())
+    mock_supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
+        "id": "r2", "status": "OPEN", "title": "Busan", "location": "POINT(129.0756 35.1796)"
+    }
+    mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = MagicMock(
+        data=[{"id": "r2", "status": "RESOLVED"}]
+    )
+
+    await map_service.get_nearby_reports(**NEARBY)
+    await admin_service.update_report_status("r2", "RESOLVED", None, None, str(uuid4()))
+
+    cached = cache.get_nearby(**NEARBY, radius_km=3.0, category=None, search=None, page=1, limit=50)
+    assert cached is not None
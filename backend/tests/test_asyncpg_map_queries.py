@@ -0,0 +1,105 @@
+import struct
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.asyncpg_map_queries import AsyncpgMapQueries, _call_sql, _decode_geography
+from app.utils.wkb_parser import parse_ewkb_point
+
+
+class FakeConnection:
+    def __init__(self, fetchval_results=(), rows=()):
+        self.fetchval_results = list(fetchval_results)
+        self.rows = list(rows)
+        self.calls = []
+
+    async def fetchval(self, sql, *args):
+        self.calls.append(("fetchval", sql, args))
+        return self.fetchval_results.pop(0)
+
+    async def fetch(self, sql, *args):
+        self.calls.append(("fetch", sql, args))
+        return self.rows
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+        self.acquired = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        yield self.connection
+
+    async def close(self):
+        self.closed = True
+
+
+def test_call_sql_uses_named_arguments_in_param_order():
+    params = {"north": 1, "south": 2, "result_limit": 3}
+
+    assert _call_sql("get_reports_in_bounds_page", params, rows=False) == (
+        "SELECT public.get_reports_in_bounds_page(north => $1, south => $2, result_limit => $3)"
+    )
+    assert _call_sql("get_reports_within_radius", {"target_lat": 1}, rows=True) == (
+        "SELECT * FROM public.get_reports_within_radius(target_lat => $1)"
+    )
+
+
+@pytest.mark.parametrize("name, params", [
+    ("reports; DROP TABLE reports", {}),
+    ("get_reports_within_radius", {"target_lat)--": 1}),
+])
+def test_call_sql_rejects_non_identifiers(name, params):
+    with pytest.raises(ValueError):
+        _call_sql(name, params, rows=True)
+
+
+def test_binary_geography_decodes_to_location_dict():
+    data = struct.pack("<BIIdd", 1, 0x20000001, 4326, 126.978, 37.5665)
+
+    assert parse_ewkb_point(data) == (126.978, 37.5665)
+    assert _decode_geography(data) == {"lat": 37.5665, "lng": 126.978}
+    assert _decode_geography(b"\x01") is None
+
+
+@pytest.mark.asyncio
+async def test_bounds_page_returns_the_jsonb_payload_on_one_connection():
+    payload = {"items": [{"id": "r1"}], "total_count": 1}
+    connection = FakeConnection(fetchval_results=[payload])
+    queries = AsyncpgMapQueries("postgresql://unused", pool=FakePool(connection))
+
+    result = await queries.bounds_page("get_reports_in_bounds_page", {"north": 37.6, "result_limit": 10})
+
+    assert result == payload
+    assert connection.calls == [(
+        "fetchval",
+        "SELECT public.get_reports_in_bounds_page(north => $1, result_limit => $2)",
+        (37.6, 10),
+    )]
+
+
+@pytest.mark.asyncio
+async def test_radius_page_counts_and_fetches_rows_shaped_like_postgrest():
+    report_id = uuid.uuid4()
+    created_at = datetime(2026, 10, 16, 9, tzinfo=timezone.utc)
+    row = {"id": report_id, "created_at": created_at, "location": {"lat": 37.5, "lng": 127.0},
+           "distance_meters": 120.5}
+    connection = FakeConnection(fetchval_results=[7], rows=[row])
+    pool = FakePool(connection)
+    queries = AsyncpgMapQueries("postgresql://unused", pool=pool)
+
+    rows, total = await queries.radius_page({"target_lat": 37.5}, {"target_lat": 37.5, "result_offset": 0})
+
+    assert total == 7
+    assert rows == [{"id": str(report_id), "created_at": "2026-10-16T09:00:00+00:00",
+                     "location": {"lat": 37.5, "lng": 127.0}, "distance_meters": 120.5}]
+    assert [call[0] for call in connection.calls] == ["fetchval", "fetch"]
+    assert pool.acquired == 1
+
+    await queries.close()
+    assert pool.closed
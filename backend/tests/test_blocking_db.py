@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.utils.blocking_db import DbExecutor, DbPoolSaturated, execute
+
+
+@pytest.mark.asyncio
+async def test_async_builder_is_awaited_on_the_event_loop():
+    query = MagicMock()
+    query.execute = AsyncMock(return_value="rows")
+
+    assert await execute(query) == "rows"
+    query.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_builder_runs_on_a_db_thread():
+    loop_thread = threading.get_ident()
+    query = MagicMock()
+    query.execute.side_effect = lambda: threading.get_ident()
+
+    assert await execute(query) != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_workers_and_queue_are_full():
+    executor = DbExecutor(1, 1, retry_after_seconds=3)
+    release = threading.Event()
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(DbPoolSaturated) as excinfo:
+        await executor.run(lambda: None)
+
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.headers == {"Retry-After": "3"}
+    stats = executor.stats()
+    assert (stats["running"], stats["queued"], stats["rejected"]) == (1, 1, 1)
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_calls_that_waited_too_long():
+    executor = DbExecutor(1, 5, max_wait_seconds=0.01)
+    calls = []
+    slow = asyncio.ensure_future(executor.run(lambda: time.sleep(0.05)))
+    await asyncio.sleep(0)
+
+    with pytest.raises(DbPoolSaturated):
+        await executor.run(lambda: calls.append(1))
+
+    await slow
+    assert calls == []
+    assert executor.stats()["wait_timeouts"] == 1
+    assert executor.stats()["wait_max_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_call_is_dropped_and_frees_its_slot():
+    executor = DbExecutor(1, 1)
+    release = threading.Event()
+    calls = []
+    running = asyncio.ensure_future(executor.run(release.wait))
+    queued = asyncio.ensure_future(executor.run(lambda: calls.append(1)))
+    await asyncio.sleep(0.01)
+
+    queued.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await running
+
+    assert calls == []
+    assert executor.stats()["queued"] == 0
+    assert await executor.run(lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_admission_limit():
+    executor = DbExecutor(1, 0)
+    gate = asyncio.Event()
+    first = asyncio.ensure_future(executor.run_async(gate.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(DbPoolSaturated):
+        await executor.run_async(gate.wait)
+
+    gate.set()
+    await first
+
+
+@pytest.mark.asyncio
+async def test_idle_workers_counts_free_threads():
+    executor = DbExecutor(2, 5)
+    gate = asyncio.Event()
+    busy = asyncio.ensure_future(executor.run_async(gate.wait))
+    await asyncio.sleep(0)
+
+    assert (executor.workers, executor.idle_workers) == (2, 1)
+
+    gate.set()
+    await busy
+    assert executor.idle_workers == 2
@@ -38,3 +38,362 @@ def test_pre_inline_benchmark_rpc_has_matching_cleanup_script():
     assert create_sql.count("public.report_matches_filters") == 2
     assert "CREATE OR REPLACE FUNCTION public.get_reports_in_bounds_page" not in create_sql
     assert f"DROP FUNCTION IF EXISTS public.{BENCHMARK_RPC_NAME}" in drop_sql
+
+
+KEYSET_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_keyset_pagination.sql"
+)
+
+
+def test_keyset_migration_orders_every_page_rpc_with_id_tie_breaker():
+    sql = KEYSET_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    for name in (
+        "get_reports_in_bounds_page",
+        "get_reports_within_radius",
+        "get_reports_paginated",
+        "get_reports_in_bounds_after",
+        "get_reports_within_radius_after",
+        "get_reports_paginated_after",
+    ):
+        assert f"CREATE OR REPLACE FUNCTION public.{name}(" in sql
+    assert "ORDER BY r.created_at DESC" not in sql.replace(
+        "ORDER BY r.created_at DESC, r.id DESC", ""
+    )
+    assert "(created_at DESC, id DESC)" in sql
+    assert sql.count("(r.created_at, r.id) < (after_created_at, after_id)") == 3
+
+
+GRID_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_bounds_grid_aggregation.sql"
+)
+
+
+def test_grid_rpc_inlines_filters_and_uses_bounds_tile_cells():
+    sql = GRID_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "CREATE OR REPLACE FUNCTION public.get_report_grid_in_bounds(" in sql
+    assert "report_matches_filters" not in sql
+    assert "category_filter IS NULL OR r.category::text = category_filter" in sql
+    assert "floor((m.lng + 180.0) / cell_degrees)" in sql
+    assert "floor((m.lat + 90.0) / cell_degrees)" in sql
+
+
+MARKER_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_bounds_marker_projection.sql"
+)
+
+
+def test_marker_rpc_keeps_bounds_filters_and_drops_heavy_columns():
+    sql = MARKER_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "CREATE OR REPLACE FUNCTION public.get_report_markers_in_bounds_page(" in sql
+    assert sql.count("category_filter IS NULL OR r.category::text = category_filter") == 2
+    assert sql.count("r.title ILIKE '%' || search_query || '%'") == 2
+    assert "round(ST_Y(r.location::geometry)::numeric, 6) AS lat" in sql
+    assert "ORDER BY r.created_at DESC, r.id DESC" in sql
+    for column in ("r.description,", "r.address,", "r.image_url,", "r.location,"):
+        assert column not in sql
+
+
+CHANGE_VERSION_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_change_versions.sql"
+)
+
+
+def test_change_version_migration_keeps_bounds_rpcs_inlined_and_versioned():
+    sql = CHANGE_VERSION_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    for name in (
+        "get_report_changes_in_bounds",
+        "get_reports_in_bounds_page",
+        "get_reports_in_bounds_after",
+    ):
+        assert f"CREATE OR REPLACE FUNCTION public.{name}(" in sql
+    assert "report_matches_filters" not in sql
+    assert sql.count("r.change_version,") == 3
+    assert "r.change_version > since_version" in sql
+    assert "t.change_version > since_version" in sql
+
+
+STREAM_ROWS_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_chunked_rows_in_bounds.sql"
+)
+
+
+def test_stream_rows_rpc_is_count_free_keyset_with_inlined_filters():
+    sql = STREAM_ROWS_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "CREATE OR REPLACE FUNCTION public.get_report_rows_in_bounds_after(" in sql
+    assert "report_matches_filters" not in sql
+    assert "total_count" not in sql.split("$$")[1]
+    assert "(r.created_at, r.id) < (after_created_at, after_id)" in sql
+    assert "ORDER BY r.created_at DESC, r.id DESC" in sql
+
+
+COUNTERS_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_counters.sql"
+)
+
+
+def test_counters_migration_replaces_per_row_count_subqueries():
+    sql = COUNTERS_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    for name in (
+        "get_reports_in_bounds_page",
+        "get_reports_in_bounds_after",
+        "get_report_markers_in_bounds_page",
+        "get_report_rows_in_bounds_after",
+        "get_report_changes_in_bounds",
+        "get_reports_within_radius",
+        "get_reports_within_radius_after",
+        "get_reports_paginated",
+        "get_reports_paginated_after",
+        "get_reports_in_bounds",
+    ):
+        assert f"CREATE OR REPLACE FUNCTION public.{name}(" in sql
+    assert "v.report_id = r.id)" not in sql
+    assert "c.report_id = r.id)" not in sql
+    assert "v.report_id = p.id" not in sql
+    read_rpcs = sql.split("Read RPCs")[1]
+    assert read_rpcs.count("r.vote_count,") == 10
+    assert read_rpcs.count("r.comment_count") == 10
+    assert sql.count("category_filter IS NULL OR r.category::text = category_filter") == 10
+
+
+def test_counters_migration_keeps_counters_exact_and_updated_at_stable():
+    sql = COUNTERS_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "AFTER INSERT OR DELETE OR UPDATE OF report_id ON public.votes" in sql
+    assert "AFTER INSERT OR DELETE OR UPDATE OF report_id ON public.comments" in sql
+    assert "CREATE OR REPLACE FUNCTION public.repair_report_counters()" in sql
+    assert "SELECT public.repair_report_counters();" in sql
+    assert "BEFORE UPDATE OF user_id, title, description, image_url, location, address, category, status" in sql
+
+
+SEARCH_MIGRATION_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_search_bigrams.sql"
+)
+SEARCH_BENCHMARK_PATH = BENCHMARK_SQL_DIR / "search_bigram_plan_benchmark.sql"
+
+
+def test_search_migration_guards_every_ilike_pair_with_indexed_bigrams():
+    sql = SEARCH_MIGRATION_PATH.read_text(encoding="utf-8")
+
+    assert "USING GIN (public.report_search_bigrams(title || ' ' || description))" in sql
+    for name in (
+        "report_matches_filters",
+        "get_reports_in_bounds_page",
+        "get_reports_in_bounds_after",
+        "get_report_markers_in_bounds_page",
+        "get_report_rows_in_bounds_after",
+        "get_reports_paginated",
+        "get_reports_paginated_after",
+        "count_reports_paginated",
+        "get_report_grid_in_bounds",
+    ):
+        assert f"CREATE OR REPLACE FUNCTION public.{name}(" in sql
+    # report_matches_filters는 행 단위 술어라 OR 형태 그대로다.
+    assert sql.count(
+        "(r.title ILIKE '%' || search_query || '%' OR r.description ILIKE '%' || search_query || '%')"
+    ) == 1
+    assert sql.count("AND public.report_search_bigrams(r.title || ' ' || r.description)") == 1
+    # 나머지 검색 조회는 전부 두 가지 UNION ALL 원천을 쓴다 — OR 안의 포함 조건은 일반 계획에서
+    # GIN 인덱스 조건이 되지 못한다.
+    assert "FROM public.reports r\n" not in sql
+    assert _squash(sql).count(_search_source("public.reports")) == 11
+
+
+def _squash(sql):
+    return " ".join(sql.split())
+
+
+def _search_source(table):
+    return _squash(
+        f"SELECT * FROM {table} WHERE search_query IS NULL UNION ALL SELECT * FROM {table} s"
+        " WHERE search_query IS NOT NULL"
+        " AND public.report_search_bigrams(s.title || ' ' || s.description)"
+        " @> public.report_search_query_bigrams(search_query)"
+        " AND (s.title ILIKE '%' || search_query || '%' OR s.description ILIKE '%' || search_query || '%')"
+    )
+
+
+def test_search_benchmark_calls_rpc_shaped_functions_in_a_scratch_schema():
+    sql = SEARCH_BENCHMARK_PATH.read_text(encoding="utf-8")
+
+    assert "FROM public.reports" not in sql
+    # 검색어를 리터럴로 넣으면 RPC가 실제로 도는 일반 계획과 다른 계획을 잰다.
+    assert "ILIKE '%' || :'" not in sql
+    assert sql.count("LANGUAGE sql STABLE SECURITY DEFINER\nSET search_path = public, extensions") == 4
+    assert _squash(sql).count(_search_source("search_benchmark.reports")) == 2
+    assert "SET auto_explain.log_nested_statements = on;" in sql
+    assert sql.count("--- old predicate") == sql.count("--- bigram predicate") > 0
+    assert sql.rstrip().endswith("DROP SCHEMA search_benchmark CASCADE;")
+
+
+def test_migrations_reading_change_version_sort_after_the_column_is_added():
+    migrations = sorted((Path(__file__).parents[1] / "supabase" / "migrations").glob("*.sql"))
+    names = [path.name for path in migrations]
+    added_at = names.index("20261016_report_change_versions.sql")
+
+    readers = [path.name for path in migrations if "r.change_version" in path.read_text(encoding="utf-8")]
+
+    assert readers
+    assert all(names.index(name) >= added_at for name in readers)
+
+
+SYSTEM_COLUMNS_GUARD_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_system_columns_guard.sql"
+)
+
+
+def test_client_roles_cannot_write_counters_or_change_version():
+    sql = SYSTEM_COLUMNS_GUARD_PATH.read_text(encoding="utf-8")
+    body = sql.split("$$")[1]
+
+    assert "current_user NOT IN ('anon', 'authenticated')" in body
+    for column in ("vote_count", "comment_count"):
+        assert f"NEW.{column} = 0;" in body
+        assert f"NEW.{column} = OLD.{column};" in body
+    assert "NEW.change_version = nextval('public.report_change_version_seq');" in body
+    assert "SECURITY DEFINER" not in sql.split("$$")[2]
+    assert "BEFORE INSERT OR UPDATE ON public.reports" in sql
+    assert SYSTEM_COLUMNS_GUARD_PATH.name > COUNTERS_MIGRATION_PATH.name
+
+
+VERSION_ORDER_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_version_commit_order.sql"
+)
+
+
+def test_change_versions_are_taken_in_commit_order_everywhere():
+    sql = VERSION_ORDER_PATH.read_text(encoding="utf-8")
+
+    assert "PERFORM pg_advisory_xact_lock(" in sql
+    assert "SET DEFAULT public.next_report_change_version()" in sql
+    for name in ("bump_report_change_version", "record_report_tombstone", "guard_report_system_columns"):
+        assert f"CREATE OR REPLACE FUNCTION public.{name}()" in sql
+    # nextval은 잠금을 잡은 next_report_change_version 안에서만 부른다.
+    assert sql.count("nextval('public.report_change_version_seq')") == 1
+    assert sql.count("= public.next_report_change_version();") == 2
+    assert sql.count("VALUES (public.next_report_change_version(), OLD.id, OLD.location);") == 2
+    # 이후 마이그레이션이 버전을 다시 nextval로 직접 받으면 안 된다.
+    later = [
+        path for path in VERSION_ORDER_PATH.parent.glob("*.sql")
+        if path.name > VERSION_ORDER_PATH.name
+        and "nextval('public.report_change_version_seq')" in path.read_text(encoding="utf-8")
+    ]
+    assert later == []
+
+
+def test_tombstones_are_pruned_and_old_cursors_reset():
+    sql = VERSION_ORDER_PATH.read_text(encoding="utf-8")
+
+    assert "CREATE OR REPLACE FUNCTION public.prune_report_tombstones(retention INTERVAL" in sql
+    assert "REVOKE EXECUTE ON FUNCTION public.prune_report_tombstones(INTERVAL) FROM PUBLIC, anon, authenticated;" in sql
+    assert "cron.schedule(" in sql
+    assert "SELECT since_version < f.version AS reset" in sql
+    assert sql.count("NOT (SELECT reset FROM expired)") == 2
+    assert "'reset', (SELECT reset FROM expired)" in sql
+
+
+KEYSET_SEEK_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_seek_keyset_cursors.sql"
+)
+KEYSET_BENCHMARK_PATH = BENCHMARK_SQL_DIR / "keyset_seek_plan_benchmark.sql"
+
+
+def _latest_definitions(name):
+    """name을 정의하는 마이그레이션 중 마지막 것의 함수 본문."""
+    migrations = sorted(KEYSET_SEEK_PATH.parent.glob("*.sql"))
+    header = f"CREATE OR REPLACE FUNCTION public.{name}("
+    last = [path for path in migrations if header in path.read_text(encoding="utf-8")][-1]
+    sql = last.read_text(encoding="utf-8")
+    start = sql.index(header)
+    return last.name, sql[start:sql.index("$$;", start)]
+
+
+def test_keyset_rpcs_seek_to_the_cursor_in_their_final_form():
+    for name in ("get_reports_in_bounds_after", "get_reports_within_radius_after", "get_reports_paginated_after"):
+        path, body = _latest_definitions(name)
+
+        assert path == KEYSET_SEEK_PATH.name
+        # OR 안의 행 비교는 일반 계획에서 인덱스 조건이 되지 못한다.
+        assert "after_created_at IS NULL OR" not in body
+        assert body.count("UNION ALL\n") >= 1
+        assert "AND after_created_at IS NULL\n" in body
+        assert "AND after_created_at IS NOT NULL\n" in body
+        assert body.count("AND (r.created_at, r.id) < (after_created_at, after_id)") == 1
+
+
+def test_keyset_benchmark_asserts_the_generic_plan_seeks():
+    sql = KEYSET_BENCHMARK_PATH.read_text(encoding="utf-8")
+
+    assert "FROM public.reports" not in sql
+    assert "SET plan_cache_mode = force_generic_plan;" in sql
+    assert "ASSERT plan LIKE '%\"Index Cond\": \"(ROW(%created_at, %id) < ROW($2, $3))\"%'" in sql
+    assert sql.rstrip().endswith("DROP SCHEMA keyset_benchmark CASCADE;")
+
+
+CHUNKED_SEEK_PATH = (
+    Path(__file__).parents[1]
+    / "supabase"
+    / "migrations"
+    / "20261016_report_seek_chunked_rows.sql"
+)
+
+
+def test_stream_rows_rpc_is_planned_per_chunk_and_seeks_to_the_cursor():
+    path, body = _latest_definitions("get_report_rows_in_bounds_after")
+
+    assert path == CHUNKED_SEEK_PATH.name
+    # 일반 계획에서는 && 선택도를 몰라 GiST로 뷰포트 전체를 청크마다 다시 읽는다.
+    assert "LANGUAGE plpgsql STABLE SECURITY DEFINER" in body
+    assert "SET plan_cache_mode = force_custom_plan" in body
+    assert "#variable_conflict use_column" in body
+    assert "after_created_at IS NULL OR" not in body
+    assert "AND after_created_at IS NULL\n" in body
+    assert "AND after_created_at IS NOT NULL\n" in body
+    assert body.count("AND (r.created_at, r.id) < (after_created_at, after_id)") == 1
+    assert _squash(body).count(_search_source("public.reports")) == 2
+    assert body.rstrip().endswith("ORDER BY created_at DESC, id DESC;\nEND;")
+
+
+def test_keyset_benchmark_streams_chunks_with_custom_plans():
+    sql = KEYSET_BENCHMARK_PATH.read_text(encoding="utf-8")
+    stream = sql.split("3. Bounds stream")[1]
+
+    assert "SET plan_cache_mode = force_custom_plan;" in stream
+    assert "ASSERT plan LIKE '%\"Index Cond\": \"(ROW(%created_at, %id) < ROW(''%'" in stream
+    assert "FOREACH fn IN ARRAY ARRAY['old_rows', 'new_rows'] LOOP" in stream
+    assert "EXIT WHEN chunk < 500 OR streamed >= 20000;" in stream
@@ -0,0 +1,65 @@
+import pytest
+
+from app.services.bounds_tiles import Tile, align_to_tiles, snap_to_tiles, tile_span, tiles_covering
+
+
+def test_tile_span_halves_per_zoom_level():
+    assert tile_span(14) == pytest.approx(2 * tile_span(15))
+
+
+def test_tile_bounds_contain_points_that_map_to_it():
+    (tile,) = tiles_covering(37.4979, 37.4979, 127.0276, 127.0276)
+
+    assert tile.south <= 37.4979 < tile.north
+    assert tile.west <= 127.0276 < tile.east
+    assert tile.north - tile.south == pytest.approx(tile_span(tile.zoom))
+
+
+def test_viewports_one_pixel_apart_share_tiles():
+    first = tiles_covering(37.5090, 37.4860, 127.0390, 127.0160)
+    nudged = tiles_covering(37.5091, 37.4861, 127.0391, 127.0161)
+
+    assert first == nudged
+
+
+def test_tiles_cover_whole_viewport_without_gaps():
+    north, south, east, west = 37.51, 37.48, 127.05, 127.00
+    tiles = tiles_covering(north, south, east, west)
+
+    assert min(t.south for t in tiles) <= south
+    assert max(t.north for t in tiles) >= north
+    assert min(t.west for t in tiles) <= west
+    assert max(t.east for t in tiles) >= east
+    assert len(tiles) == len(set(tiles))
+
+
+def test_zoom_is_part_of_tile_identity():
+    assert Tile(14, 1, 1) != Tile(15, 1, 1)
+
+
+def test_snap_to_tiles_is_outer_edge_of_covering_tiles():
+    north, south, east, west = 37.51, 37.48, 127.05, 127.00
+    tiles = tiles_covering(north, south, east, west, zoom=12)
+
+    assert snap_to_tiles(north, south, east, west, zoom=12) == pytest.approx((
+        max(t.north for t in tiles),
+        min(t.south for t in tiles),
+        max(t.east for t in tiles),
+        min(t.west for t in tiles),
+    ))
+
+
+def test_snapped_viewports_one_pixel_apart_are_equal():
+    assert snap_to_tiles(37.5090, 37.4860, 127.0390, 127.0160, zoom=12) == snap_to_tiles(
+        37.5091, 37.4861, 127.0391, 127.0161, zoom=12
+    )
+
+
+def test_align_to_tiles_contains_viewport_and_is_idempotent():
+    viewport = (37.5090, 37.4860, 127.0390, 127.0160)
+    aligned = align_to_tiles(*viewport, zoom=12)
+
+    north, south, east, west = aligned
+    assert north >= viewport[0] and south <= viewport[1]
+    assert east >= viewport[2] and west <= viewport[3]
+    assert align_to_tiles(*aligned, zoom=12) == aligned
@@ -0,0 +1,129 @@
+"""MapCacheWarmup — 예열 뷰포트 출처, 제한된 동시성, 준비 상태."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.services.cache_warmup import (
+    MapCacheWarmup, WarmupViewport, grid_viewports, parse_centers, viewports_from_request_log,
+)
+
+
+class RecordingReportService:
+    """get_reports_in_bounds 호출과 최대 동시 실행 수를 기록한다."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.active = self.max_active = 0
+        self._fail = fail
+
+    async def get_reports_in_bounds(self, north, south, east, west, category, search, page, limit):
+        self.calls.append(WarmupViewport(north, south, east, west, category, limit))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        if self._fail:
+            raise RuntimeError("boom")
+        return {"items": [], "totalCount": 0}
+
+
+async def wait_ready(warmup):
+    for _ in range(200):
+        if warmup.ready:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("warmup never became ready")
+
+
+def test_parse_centers_skips_malformed_entries():
+    assert parse_centers("37.4979,127.0276; bad ;37.5665,126.9780") == [(37.4979, 127.0276), (37.5665, 126.978)]
+    assert parse_centers("") == []
+
+
+def test_grid_viewports_tile_the_area_around_the_center():
+    viewports = grid_viewports((37.5, 127.0), size=3, half_span=0.01)
+
+    assert len(viewports) == 9
+    middle = viewports[4]
+    assert middle.north == pytest.approx(37.51) and middle.west == pytest.approx(126.99)
+    assert viewports[3].east == pytest.approx(middle.west)
+
+
+def test_request_log_keeps_most_requested_cacheable_first_pages():
+    hot = "/api/v1/reports/bounds?north=37.6&south=37.5&east=127.1&west=127.0&limit=200"
+    lines = [
+        f'127.0.0.1 - "GET {hot} HTTP/1.1" 200',
+        f'127.0.0.1 - "GET {hot} HTTP/1.1" 200',
+        '"GET /api/v1/reports/bounds?north=1&south=0&east=1&west=0&category=TRASH HTTP/1.1" 200',
+        '"GET /api/v1/reports/bounds?north=1&south=0&east=1&west=0&search=x HTTP/1.1" 200',
+        '"GET /api/v1/reports/bounds?north=1&south=0&east=1&west=0&page=2 HTTP/1.1" 200',
+        '"GET /api/v1/reports/bounds?north=1&south=0&east=1&west=0&fields=marker HTTP/1.1" 200',
+        '"GET /api/v1/reports/nearby?lat=1&lng=1 HTTP/1.1" 200',
+    ]
+
+    assert viewports_from_request_log(lines) == [
+        WarmupViewport(37.6, 37.5, 127.1, 127.0, None, 200),
+        WarmupViewport(1.0, 0.0, 1.0, 0.0, "TRASH", 100),
+    ]
+
+
+def test_warmup_without_sources_is_ready_from_the_start():
+    assert MapCacheWarmup(RecordingReportService(), MagicMock()).ready
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_with_limited_concurrency_then_becomes_ready():
+    service = RecordingReportService()
+    warmup = MapCacheWarmup(service, MagicMock(), centers=[(37.5, 127.0)], concurrency=2)
+    assert not warmup.ready
+
+    warmup.start()
+    await wait_ready(warmup)
+
+    assert len(service.calls) == 9
+    assert service.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_warmup_still_becomes_ready():
+    warmup = MapCacheWarmup(RecordingReportService(fail=True), MagicMock(), centers=[(37.5, 127.0)])
+
+    assert await warmup.run() == 0
+    warmup.start()
+    await wait_ready(warmup)
+
+
+@pytest.mark.asyncio
+async def test_canonical_zoom_aligns_warmup_viewports():
+    warmup = MapCacheWarmup(RecordingReportService(), MagicMock(), centers=[(37.5, 127.0)], canonical_zoom=12)
+
+    viewports = await warmup.viewports()
+
+    span = 360 / 2 ** 12
+    assert all(((v.north + 90) / span).is_integer() and ((v.west + 180) / span).is_integer() for v in viewports)
+    assert len(viewports) == len(set(viewports))
+
+
+def test_warmed_entries_outlive_warmup_only_with_a_long_enough_revalidate_window():
+    def warmup(stale_while_revalidate_seconds):
+        return MapCacheWarmup(
+            RecordingReportService(), MagicMock(), centers=[(37.5, 127.0)], timeout_seconds=60,
+            stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+        )
+
+    assert not warmup(0).outlives_warmup
+    assert not warmup(30).outlives_warmup
+    assert warmup(60).outlives_warmup
+
+
+def test_ready_probe_is_unavailable_until_warmup_completes(monkeypatch):
+    warmup = MapCacheWarmup(RecordingReportService(), MagicMock(), centers=[(37.5, 127.0)])
+    monkeypatch.setattr(main, "map_cache_warmup", warmup)
+
+    response = TestClient(main.app).get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming_up"
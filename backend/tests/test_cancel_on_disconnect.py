@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from app.middleware.cancel_on_disconnect import CancelOnDisconnectMiddleware
+
+
+def http_scope(method="GET"):
+    return {"type": "http", "method": method, "path": "/", "headers": []}
+
+
+def client(disconnect_after: asyncio.Event):
+    """요청 본문을 보낸 뒤 disconnect_after가 설정되면 끊는 receive."""
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect_after.wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+async def discard(message):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_get_handler_is_cancelled_when_client_disconnects():
+    started, disconnect = asyncio.Event(), asyncio.Event()
+    cancelled = False
+
+    async def app(scope, receive, send):
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    call = asyncio.ensure_future(CancelOnDisconnectMiddleware(app)(http_scope(), client(disconnect), discard))
+    await started.wait()
+    disconnect.set()
+    await asyncio.wait_for(call, 1)
+
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_write_requests_run_to_completion_after_disconnect():
+    disconnect = asyncio.Event()
+    disconnect.set()
+    finished = False
+
+    async def app(scope, receive, send):
+        nonlocal finished
+        await asyncio.sleep(0.01)
+        finished = True
+
+    await CancelOnDisconnectMiddleware(app)(http_scope("POST"), client(disconnect), discard)
+
+    assert finished
+
+
+@pytest.mark.asyncio
+async def test_disconnect_after_response_does_not_cancel_background_work():
+    disconnect = asyncio.Event()
+    finished = False
+
+    async def app(scope, receive, send):
+        nonlocal finished
+        await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+        disconnect.set()
+        await asyncio.sleep(0.01)
+        finished = True
+
+    await CancelOnDisconnectMiddleware(app)(http_scope(), client(disconnect), discard)
+
+    assert finished
+
+
+@pytest.mark.asyncio
+async def test_handler_reads_request_body_through_the_middleware():
+    received = []
+
+    async def app(scope, receive, send):
+        received.append(await receive())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    await CancelOnDisconnectMiddleware(app)(http_scope(), client(asyncio.Event()), discard)
+
+    assert received == [{"type": "http.request", "body": b"", "more_body": False}]
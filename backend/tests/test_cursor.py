@@ -0,0 +1,24 @@
+import pytest
+
+from app.utils.cursor import decode_report_cursor, encode_report_cursor
+
+
+def test_cursor_round_trips_created_at_and_id():
+    report = {"id": "4f1c2a9e-0000-4000-8000-000000000001", "created_at": "2026-10-16T09:00:00.123456+00:00"}
+
+    cursor = encode_report_cursor(report)
+
+    assert decode_report_cursor(cursor) == (report["created_at"], report["id"])
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_report_cursor({"id": "r1", "created_at": "2026-10-16T09:00:00+00:00"})
+
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "bnVsbA", "WzEsMl0", "WyJhIl0"])
+def test_decode_rejects_anything_encode_did_not_produce(cursor):
+    with pytest.raises(ValueError):
+        decode_report_cursor(cursor)
@@ -0,0 +1,28 @@
+import pytest
+
+from app.utils.geo import calculate_distance, haversine_distances
+
+
+def test_calculate_distance_same_point_is_zero():
+    assert calculate_distance(37.5665, 126.9780, 37.5665, 126.9780) == pytest.approx(0)
+
+
+def test_calculate_distance_known_points():
+    # Seoul City Hall to Gangnam Station, roughly 8.6km apart.
+    dist = calculate_distance(37.5665, 126.9780, 37.4979, 127.0276)
+    assert dist == pytest.approx(8800, rel=0.05)
+
+
+def test_haversine_distances_matches_scalar_formula():
+    lats = [37.5665, 37.4979, 35.1796, -33.8688]
+    lngs = [126.9780, 127.0276, 129.0756, 151.2093]
+
+    distances = haversine_distances(37.5665, 126.9780, lats, lngs)
+
+    assert distances == pytest.approx(
+        [calculate_distance(37.5665, 126.9780, la, ln) for la, ln in zip(lats, lngs)]
+    )
+
+
+def test_haversine_distances_empty_batch():
+    assert haversine_distances(37.5665, 126.9780, [], []) == []
@@ -0,0 +1,38 @@
+"""app/api/http_cache — 본문 ETag와 If-None-Match 비교."""
+from fastapi import Response
+from starlette.requests import Request
+
+from app.api.http_cache import body_etag, matches_if_none_match, with_validator
+
+
+def _request(if_none_match: str) -> Request:
+    return Request({"type": "http", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+def test_etag_depends_only_on_body_bytes():
+    etag = body_etag(b'{"items":[]}')
+
+    assert body_etag(b'{"items":[]}') == etag
+    assert body_etag(b'{"items":[1]}') != etag
+    assert body_etag(b"\x81\xa5items\x90") != etag
+
+
+def test_if_none_match_uses_weak_comparison_over_a_list():
+    etag = body_etag(b"body")
+
+    assert matches_if_none_match(_request(f'"other", {etag.removeprefix("W/")}'), etag)
+    assert matches_if_none_match(_request("*"), etag)
+    assert not matches_if_none_match(_request('W/"other"'), etag)
+
+
+def test_with_validator_turns_matching_revalidation_into_304():
+    etag = body_etag(b"body")
+
+    fresh = with_validator(_request('W/"other"'), Response(b"body"), 15)
+    revalidated = with_validator(_request(etag), Response(b"body"), 15)
+
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] == etag
+    assert fresh.headers["cache-control"] == "public, max-age=15"
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
@@ -0,0 +1,29 @@
+from app.services.map_prefetch import PrefetchTarget, bounds_prefetch_targets
+
+VIEWPORT = dict(north=37.6, south=37.5, east=127.1, west=127.0)
+
+
+def test_next_page_comes_first_then_edge_neighbours():
+    targets = bounds_prefetch_targets(**VIEWPORT, page=1, limit=100, total_count=250)
+
+    assert targets[0] == PrefetchTarget(37.6, 37.5, 127.1, 127.0, 2)
+    north_neighbour = targets[1]
+    assert north_neighbour.south == VIEWPORT["north"] and north_neighbour.page == 1
+    assert len(targets) == 9
+
+
+def test_last_page_has_no_next_page_target():
+    targets = bounds_prefetch_targets(**VIEWPORT, page=3, limit=100, total_count=250)
+
+    assert all(t.page == 1 for t in targets)
+    assert len(targets) == 8
+
+
+def test_neighbours_past_the_poles_or_antimeridian_are_dropped():
+    targets = bounds_prefetch_targets(north=90.0, south=80.0, east=180.0, west=170.0, page=1, limit=100, total_count=0)
+
+    assert targets == [
+        PrefetchTarget(80.0, 70.0, 180.0, 170.0, 1),
+        PrefetchTarget(90.0, 80.0, 170.0, 160.0, 1),
+        PrefetchTarget(80.0, 70.0, 170.0, 160.0, 1),
+    ]
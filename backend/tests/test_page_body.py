@@ -0,0 +1,63 @@
+import json
+
+from app.utils.page_body import encode_page_body, patch_user_voted
+
+REPORT_ID = "3f2b8c1e-5d4a-4c3b-9a8e-1f2e3d4c5b6a"
+OTHER_ID = "7a6b5c4d-3e2f-4a1b-8c9d-0e1f2a3b4c5d"
+
+
+def make_valid_report(report_id, description="Desc"):
+    return {
+        "id": report_id,
+        "user_id": "11111111-2222-4333-8444-555555555555",
+        "title": "Report",
+        "description": description,
+        "location": {"lat": 37.5665, "lng": 126.978},
+        "address": "Seoul",
+        "category": "OTHER",
+        "status": "OPEN",
+        "image_url": None,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+        "vote_count": 0,
+        "comment_count": 0,
+        "user_voted": False,
+    }
+
+
+def make_page(*reports):
+    return {"items": list(reports), "totalCount": len(reports), "totalPages": 1, "page": 1, "limit": 100}
+
+
+def test_encoded_body_is_the_page_as_json_with_item_ids():
+    entry = encode_page_body(make_page(make_valid_report(REPORT_ID)))
+
+    decoded = json.loads(entry["body"])
+    assert decoded["items"][0]["id"] == REPORT_ID
+    assert decoded["items"][0]["location"] == {"lat": 37.5665, "lng": 126.978}
+    assert decoded["nextCursor"] is None
+    assert entry["ids"] == [REPORT_ID]
+
+
+def test_patch_sets_user_voted_only_for_voted_items():
+    body = encode_page_body(make_page(make_valid_report(REPORT_ID), make_valid_report(OTHER_ID)))["body"].encode()
+
+    patched = json.loads(patch_user_voted(body, {OTHER_ID}))
+
+    assert [r["user_voted"] for r in patched["items"]] == [False, True]
+
+
+def test_patch_ignores_lookalike_text_inside_strings():
+    tricky = f'"id":"{OTHER_ID}" "user_voted":false'
+    body = encode_page_body(make_page(make_valid_report(REPORT_ID, description=tricky)))["body"].encode()
+
+    patched = json.loads(patch_user_voted(body, {OTHER_ID, REPORT_ID}))
+
+    assert patched["items"][0]["user_voted"] is True
+    assert patched["items"][0]["description"] == tricky
+
+
+def test_patch_without_votes_returns_same_bytes():
+    body = encode_page_body(make_page(make_valid_report(REPORT_ID)))["body"].encode()
+
+    assert patch_user_voted(body, set()) is body
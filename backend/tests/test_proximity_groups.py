@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from app.services.proximity_groups import compute_proximity_groups
+from app.utils.geo import calculate_distance
+
+
+def located(report_id, lat, lng):
+    return {"id": report_id, "location": {"lat": lat, "lng": lng}}
+
+
+def brute_force_groups(items, radius_meters=30):
+    """프론트엔드 computeProximityGroups를 그대로 옮긴 O(n²) 기준 구현."""
+    groups = []
+    assigned = [False] * len(items)
+    for i, seed in enumerate(items):
+        if assigned[i]:
+            continue
+        assigned[i] = True
+        members = [seed]
+        for j in range(i + 1, len(items)):
+            if not assigned[j] and calculate_distance(
+                seed["location"]["lat"], seed["location"]["lng"],
+                items[j]["location"]["lat"], items[j]["location"]["lng"],
+            ) <= radius_meters:
+                assigned[j] = True
+                members.append(items[j])
+        groups.append([m["id"] for m in members])
+    return groups
+
+
+def test_empty_list_has_no_groups():
+    assert compute_proximity_groups([]) == []
+
+
+def test_points_within_radius_of_seed_share_a_group():
+    items = [
+        located("a", 37.49790, 127.02760),
+        located("b", 37.49800, 127.02760),  # ~11m north of a
+        located("far", 37.50000, 127.02760),
+    ]
+
+    groups = compute_proximity_groups(items)
+
+    assert [g["memberIds"] for g in groups] == [["a", "b"], ["far"]]
+    assert groups[0]["id"] == "proximity-a"
+    assert groups[0]["center"]["lat"] == pytest.approx(37.49795)
+    assert groups[0]["center"]["lng"] == pytest.approx(127.02760)
+
+
+def test_groups_do_not_chain_through_members():
+    # a-b, b-c are ~22m apart but a-c is ~44m: c must start its own group.
+    items = [
+        located("a", 37.49790, 127.02760),
+        located("b", 37.49810, 127.02760),
+        located("c", 37.49830, 127.02760),
+    ]
+
+    assert [g["memberIds"] for g in compute_proximity_groups(items)] == [["a", "b"], ["c"]]
+
+
+def test_matches_pairwise_reference_on_dense_viewport():
+    rng = random.Random(8)
+    items = [
+        located(f"r{i}", 37.4979 + rng.uniform(-0.002, 0.002), 127.0276 + rng.uniform(-0.002, 0.002))
+        for i in range(400)
+    ]
+
+    groups = compute_proximity_groups(items)
+
+    assert [g["memberIds"] for g in groups] == brute_force_groups(items)
@@ -1,14 +1,20 @@
+import asyncio
+import json
+
 import pytest
 from fastapi import HTTPException
-from unittest.mock import MagicMock
+from unittest.mock import DEFAULT, MagicMock
 from app.services.report_service import (
     ReportService,
-    calculate_distance,
     enrich_report_data,
+    enrich_reports,
     parse_location,
 )
 from app.schemas.report import ReportCreate, ReportCategory, Location
-from tests.fakes import FakeSpatialReportCache
+from app.services.report_spatial_index import ReportSpatialIndex
+from app.services.spatial_report_cache import SpatialReportCache
+from app.utils.cursor import decode_report_cursor, encode_report_cursor
+from tests.fakes import FakeClock, FakeSpatialReportCache, FakeTableReads
 
 
 def make_report(report_id="r1", **overrides):
@@ -59,17 +65,7 @@ NEARBY = {"lat": 37.5665, "lng": 126.9780}
 BOUNDS = {"north": 37.6, "south": 37.5, "east": 127.0, "west": 126.9}
 
 
-# --- calculate_distance / parse_location (pure helpers stay module-level) ---
-
-def test_calculate_distance_same_point_is_zero():
-    assert calculate_distance(37.5665, 126.9780, 37.5665, 126.9780) == pytest.approx(0)
-
-
-def test_calculate_distance_known_points():
-    # Seoul City Hall to Gangnam Station, roughly 8.6km apart.
-    dist = calculate_distance(37.5665, 126.9780, 37.4979, 127.0276)
-    assert dist == pytest.approx(8800, rel=0.05)
-
+# --- parse_location (pure helpers stay module-level) ---
 
 def test_parse_location_wkb():
     # WKB for POINT(126.9780 37.5665)
@@ -129,6 +125,25 @@ def test_enrich_report_data_defaults_missing_counts():
     assert result["user_voted"] is False
 
 
+def test_enrich_reports_decodes_every_location_shape():
+    reports = [
+        {"id": "ewkb", "location": "0101000020E610000097900F7A36BF5F400D71AC8BDBC84240"},
+        {"id": "point", "location": "POINT(127.0276 37.4979)"},
+        {"id": "dict", "location": {"lat": 1.0, "lng": 2.0}},
+        {"id": "broken", "location": "0101000020E6100000ZZ"},
+        {"id": "missing"},
+    ]
+
+    result = enrich_reports(reports)
+
+    assert result[0]["location"] == pytest.approx({"lat": 37.5692, "lng": 126.9877})
+    assert result[1]["location"] == {"lat": 37.4979, "lng": 127.0276}
+    assert result[2]["location"] == {"lat": 1.0, "lng": 2.0}
+    assert result[3]["location"] == {"lat": 37.5665, "lng": 126.9780}
+    assert result[4]["location"] == {"lat": 37.5665, "lng": 126.9780}
+    assert all(r["vote_count"] == 0 and r["user_voted"] is False for r in result)
+
+
 # --- create ---
 
 @pytest.mark.asyncio
@@ -259,6 +274,248 @@ async def test_bounds_same_params_is_cache_hit():
     assert second == first
 
 
+@pytest.mark.asyncio
+async def test_concurrent_bounds_misses_share_one_rpc():
+    service, supabase = make_service()
+
+    results = await asyncio.gather(*(service.get_reports_in_bounds(**BOUNDS) for _ in range(5)))
+
+    assert supabase.rpc.call_count == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_nearby_misses_share_one_count_and_fetch():
+    service, supabase = make_service()
+
+    await asyncio.gather(*(service.get_nearby_reports(**NEARBY) for _ in range(5)))
+
+    assert supabase.rpc.call_count == 2  # count + fetch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_miss_failure_reaches_every_waiter_then_retries():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.side_effect = [
+        Exception("boom"),
+        MagicMock(data={"items": [make_report()], "total_count": 1}),
+    ]
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    results = await asyncio.gather(
+        *(service.get_reports_in_bounds(**BOUNDS) for _ in range(3)), return_exceptions=True
+    )
+    assert [str(result) for result in results] == ["boom"] * 3
+
+    result = await service.get_reports_in_bounds(**BOUNDS)
+    assert result["totalCount"] == 1
+    assert supabase.rpc.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_miss_after_invalidation_does_not_join_older_flight():
+    service, supabase = make_service()
+
+    in_flight = asyncio.ensure_future(service.get_reports_in_bounds(**BOUNDS))
+    await asyncio.sleep(0)
+    service.cache.invalidate_all()
+    await asyncio.gather(in_flight, service.get_reports_in_bounds(**BOUNDS))
+
+    assert supabase.rpc.call_count == 2
+
+
+# --- pre-encoded response bodies ---
+
+def make_body_service():
+    report = make_report(
+        "3f2b8c1e-5d4a-4c3b-9a8e-1f2e3d4c5b6a",
+        user_id="11111111-2222-4333-8444-555555555555",
+        created_at="2026-01-01T00:00:00+00:00",
+        updated_at="2026-01-01T00:00:00+00:00",
+    )
+    supabase = make_spatial_supabase(report)
+    return ReportService(supabase, FakeSpatialReportCache(), cache_response_bodies=True), supabase, report
+
+
+@pytest.mark.asyncio
+async def test_cached_bounds_body_is_the_encoded_anonymous_page():
+    service, supabase, report = make_body_service()
+
+    assert await service.get_cached_bounds_body(**BOUNDS) is None
+    result = await service.get_reports_in_bounds(**BOUNDS)
+    body = await service.get_cached_bounds_body(**BOUNDS)
+
+    decoded = json.loads(body)
+    assert decoded["items"][0]["id"] == report["id"]
+    assert decoded["totalCount"] == result["totalCount"]
+    assert decoded["items"][0]["user_voted"] is False
+    assert supabase.rpc.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_nearby_body_patches_user_voted_for_logged_in_user():
+    service, supabase, report = make_body_service()
+    supabase.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = MagicMock(
+        data=[{"report_id": report["id"]}]
+    )
+
+    await service.get_nearby_reports(**NEARBY)
+    body = await service.get_cached_nearby_body(**NEARBY, current_user_id="user-123")
+
+    assert json.loads(body)["items"][0]["user_voted"] is True
+    assert json.loads(await service.get_cached_nearby_body(**NEARBY))["items"][0]["user_voted"] is False
+
+
+@pytest.mark.asyncio
+async def test_cached_body_is_dropped_with_its_page_on_invalidation():
+    service, supabase, report = make_body_service()
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    service.cache.invalidate_locations([{"lat": 37.5665, "lng": 126.9780}])
+
+    assert await service.get_cached_bounds_body(**BOUNDS) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_bodies_are_off_by_default():
+    service, supabase = make_service()
+
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    assert await service.get_cached_bounds_body(**BOUNDS) is None
+
+
+# --- stale-while-revalidate / stale-if-error ---
+
+def make_stale_service(*responses):
+    """Real cache on a fake clock (SWR 30s, stale-if-error 60s) over a bounds RPC serving `responses` in turn."""
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.side_effect = list(responses)
+    clock = FakeClock()
+    cache = SpatialReportCache(timer=clock, stale_while_revalidate_seconds=30, stale_if_error_seconds=60)
+    return ReportService(supabase, cache), supabase, clock
+
+
+def bounds_page(total):
+    return MagicMock(data={"items": [make_report()], "total_count": total})
+
+
+async def wait_until(predicate):
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_stale_bounds_is_served_immediately_and_refreshed_in_background():
+    service, supabase, clock = make_stale_service(bounds_page(1), bounds_page(2))
+    await service.get_reports_in_bounds(**BOUNDS)
+    clock.advance(20)
+
+    stale = await service.get_reports_in_bounds(**BOUNDS)
+    assert stale["totalCount"] == 1
+
+    await wait_until(lambda: service.cache.get_bounds(**BOUNDS, category=None, search=None, page=1, limit=100))
+    refreshed = await service.get_reports_in_bounds(**BOUNDS)
+    assert refreshed["totalCount"] == 2
+    assert supabase.rpc.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_serving_stale():
+    service, supabase, clock = make_stale_service(bounds_page(1), Exception("boom"))
+    await service.get_reports_in_bounds(**BOUNDS)
+    clock.advance(20)
+
+    assert (await service.get_reports_in_bounds(**BOUNDS))["totalCount"] == 1
+    await wait_until(lambda: supabase.rpc.call_count == 2)
+    assert (await service.get_reports_in_bounds(**BOUNDS))["totalCount"] == 1
+
+
+@pytest.mark.asyncio
+async def test_past_hard_ttl_serves_stale_only_when_rpc_fails():
+    service, supabase, clock = make_stale_service(bounds_page(1), Exception("boom"), bounds_page(3))
+    await service.get_reports_in_bounds(**BOUNDS)
+    clock.advance(60)
+
+    assert (await service.get_reports_in_bounds(**BOUNDS))["totalCount"] == 1  # RPC failed
+    assert (await service.get_reports_in_bounds(**BOUNDS))["totalCount"] == 3  # RPC succeeded
+
+
+@pytest.mark.asyncio
+async def test_rpc_failure_without_stale_entry_raises():
+    service, _, clock = make_stale_service(bounds_page(1), Exception("boom"))
+    await service.get_reports_in_bounds(**BOUNDS)
+    clock.advance(106)
+
+    with pytest.raises(Exception, match="boom"):
+        await service.get_reports_in_bounds(**BOUNDS)
+
+
+# --- predictive prefetch ---
+
+@pytest.mark.asyncio
+async def test_bounds_prefetches_next_page_and_neighbours_into_cache():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = bounds_page(150)
+    service = ReportService(supabase, FakeSpatialReportCache(), prefetch_budget=1)
+
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    lat_span = BOUNDS["north"] - BOUNDS["south"]
+    north_neighbour = {**BOUNDS, "north": BOUNDS["north"] + lat_span, "south": BOUNDS["north"]}
+    await wait_until(lambda: supabase.rpc.call_count == 10)
+    assert service.cache.get_bounds(**BOUNDS, category=None, search=None, page=2, limit=100)
+    assert service.cache.get_bounds(**north_neighbour, category=None, search=None, page=1, limit=100)
+
+    # 두 번째 상호작용은 캐시 히트
+    await service.get_reports_in_bounds(**BOUNDS, page=2)
+    await service.get_reports_in_bounds(**north_neighbour)
+    assert supabase.rpc.call_count == 10
+
+
+@pytest.mark.asyncio
+async def test_bounds_cache_hit_does_not_prefetch():
+    supabase = MagicMock()
+    cache = FakeSpatialReportCache()
+    cache.put_bounds(**BOUNDS, category=None, search=None, page=1, limit=100,
+                     value={"items": [], "totalCount": 150, "totalPages": 2, "page": 1, "limit": 100})
+    service = ReportService(supabase, cache, prefetch_budget=1)
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await asyncio.sleep(0.05)
+
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bounds_skips_prefetch_while_db_executor_is_busy(mocker):
+    # 스레드 20개 중 4개만 놀고 있다 — 선조회 하한(25%) 아래.
+    mocker.patch("app.services.report_service.db_executor", MagicMock(workers=20, idle_workers=4))
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = bounds_page(150)
+    service = ReportService(supabase, FakeSpatialReportCache(), prefetch_budget=1)
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await asyncio.sleep(0.05)
+
+    assert supabase.rpc.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bounds_without_prefetch_budget_only_serves_the_request():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = bounds_page(150)
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await asyncio.sleep(0.05)
+
+    assert supabase.rpc.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_bounds_fetches_page_and_total_count_in_one_rpc():
     supabase = MagicMock()
@@ -314,6 +571,174 @@ async def test_bounds_uses_injected_rpc_name():
     )
 
 
+class FakeDirectQueries:
+    """AsyncpgMapQueries stand-in recording the RPC calls it serves."""
+
+    def __init__(self, report=None, total=1):
+        self.report = report or make_report()
+        self.total = total
+        self.calls = []
+
+    async def bounds_page(self, rpc_name, params):
+        self.calls.append((rpc_name, params))
+        return {"items": [dict(self.report)], "total_count": self.total}
+
+    async def radius_page(self, count_params, page_params):
+        self.calls.append(("radius", count_params, page_params))
+        return [dict(self.report)], self.total
+
+
+@pytest.mark.asyncio
+async def test_bounds_goes_through_direct_queries_instead_of_postgrest():
+    supabase = MagicMock()
+    direct = FakeDirectQueries()
+    service = ReportService(supabase, FakeSpatialReportCache(), direct_queries=direct)
+
+    result = await service.get_reports_in_bounds(**BOUNDS, limit=10)
+
+    supabase.rpc.assert_not_called()
+    assert direct.calls == [(
+        "get_reports_in_bounds_page",
+        {**BOUNDS, "category_filter": None, "search_query": None, "result_offset": 0, "result_limit": 10},
+    )]
+    assert result["totalCount"] == 1
+    assert result["items"][0]["location"] == {"lat": 37.5665, "lng": 126.978}
+
+
+@pytest.mark.asyncio
+async def test_nearby_goes_through_direct_queries_instead_of_postgrest():
+    supabase = MagicMock()
+    direct = FakeDirectQueries(make_report(distance_meters=1500))
+    service = ReportService(supabase, FakeSpatialReportCache(), direct_queries=direct)
+
+    result = await service.get_nearby_reports(**NEARBY, page=2, limit=5)
+
+    supabase.rpc.assert_not_called()
+    [(_, count_params, page_params)] = direct.calls
+    assert count_params["radius_meters"] == 3000
+    assert (page_params["result_offset"], page_params["result_limit"]) == (5, 5)
+    assert result["totalCount"] == 1
+    assert result["items"][0]["distance_km"] == 1.5
+
+
+# --- keyset cursor pagination ---
+
+CREATED_AT = "2026-10-16T09:00:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_offset_page_with_more_rows_emits_next_cursor():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={"items": [make_report("r1", created_at=CREATED_AT)], "total_count": 2}
+    )
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    result = await service.get_reports_in_bounds(**BOUNDS, page=1, limit=1)
+
+    assert decode_report_cursor(result["nextCursor"]) == (CREATED_AT, "r1")
+
+
+@pytest.mark.asyncio
+async def test_last_offset_page_has_no_next_cursor():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={"items": [make_report("r1", created_at=CREATED_AT)], "total_count": 1}
+    )
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    result = await service.get_reports_in_bounds(**BOUNDS, page=1, limit=1)
+
+    assert result["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_bounds_cursor_seeks_past_cursor_and_skips_cache():
+    cache = FakeSpatialReportCache()
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={
+            "items": [
+                make_report("r2", created_at="2026-10-16T08:00:00+00:00"),
+                make_report("r3", created_at="2026-10-16T07:00:00+00:00"),
+            ],
+            "total_count": 3,
+        }
+    )
+    service = ReportService(supabase, cache)
+    cursor = encode_report_cursor({"id": "r1", "created_at": CREATED_AT})
+
+    result = await service.get_reports_in_bounds(**BOUNDS, limit=1, cursor=cursor)
+
+    supabase.rpc.assert_called_once_with(
+        "get_reports_in_bounds_after",
+        {
+            **BOUNDS,
+            "category_filter": None,
+            "search_query": None,
+            "after_created_at": CREATED_AT,
+            "after_id": "r1",
+            "result_limit": 2,
+        },
+    )
+    assert [item["id"] for item in result["items"]] == ["r2"]
+    assert result["page"] is None
+    assert result["totalCount"] == 3
+    assert decode_report_cursor(result["nextCursor"]) == ("2026-10-16T08:00:00+00:00", "r2")
+    assert cache.get_bounds(**BOUNDS, category=None, search=None, page=1, limit=1) is None
+
+
+@pytest.mark.asyncio
+async def test_nearby_cursor_uses_keyset_rpc_and_adds_distance():
+    supabase = make_spatial_supabase(make_report("r2", created_at=CREATED_AT, distance_meters=1500), total=5)
+    service, _ = make_service(supabase)
+    cursor = encode_report_cursor({"id": "r1", "created_at": CREATED_AT})
+
+    result = await service.get_nearby_reports(**NEARBY, radius_km=3.0, limit=10, cursor=cursor)
+
+    name, params = supabase.rpc.call_args_list[-1].args
+    assert name == "get_reports_within_radius_after"
+    assert (params["after_created_at"], params["after_id"], params["result_limit"]) == (CREATED_AT, "r1", 11)
+    assert result["items"][0]["distance_km"] == 1.5
+    assert result["totalCount"] == 5
+    assert result["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_reports_cursor_calls_keyset_rpc():
+    supabase = MagicMock()
+    supabase.rpc.side_effect = [
+        MagicMock(execute=MagicMock(return_value=MagicMock(data=10))),
+        MagicMock(execute=MagicMock(return_value=MagicMock(data=[make_report("r2")]))),
+    ]
+    service = ReportService(supabase, FakeSpatialReportCache())
+    cursor = encode_report_cursor({"id": "r1", "created_at": CREATED_AT})
+
+    result = await service.list_reports(limit=5, cursor=cursor)
+
+    supabase.rpc.assert_any_call("get_reports_paginated_after", {
+        "category_filter": None,
+        "status_filter": None,
+        "user_id_filter": None,
+        "search_query": None,
+        "after_created_at": CREATED_AT,
+        "after_id": "r1",
+        "result_limit": 6,
+    })
+    assert result["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_bad_request():
+    service, supabase = make_service()
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_reports_in_bounds(**BOUNDS, cursor="not-a-cursor")
+
+    assert exc.value.status_code == 400
+    supabase.rpc.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_create_report_invalidates_map_caches():
     service, supabase = make_service()
@@ -376,6 +801,53 @@ async def test_delete_report_invalidates_map_caches():
     assert supabase.rpc.call_count == 6
 
 
+@pytest.mark.asyncio
+async def test_create_report_elsewhere_keeps_map_caches():
+    service, supabase = make_service()
+    supabase.table.return_value.insert.return_value.execute.return_value.data = [
+        make_report()
+    ]
+    await service.get_nearby_reports(**NEARBY)
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    report_in = ReportCreate(
+        title="Busan",
+        description="Desc",
+        location=Location(lat=35.1796, lng=129.0756),
+        address="Busan",
+        category=ReportCategory.OTHER,
+        image_url=None,
+    )
+    await service.create_report(report_in, "user-123")
+
+    await service.get_nearby_reports(**NEARBY)
+    await service.get_reports_in_bounds(**BOUNDS)
+    assert supabase.rpc.call_count == 3  # both still served from cache
+
+
+@pytest.mark.asyncio
+async def test_update_report_invalidates_old_and_new_locations():
+    service, supabase = make_service()
+    busan = {"north": 35.2, "south": 35.1, "east": 129.1, "west": 129.0}
+    supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
+        "user_id": "user-123", "location": "POINT(126.9780 37.5665)"
+    }
+    supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+        make_report(location="POINT(129.0756 35.1796)")
+    ]
+    await service.get_reports_in_bounds(**BOUNDS)
+    await service.get_reports_in_bounds(**busan)
+    await service.get_reports_in_bounds(north=33.6, south=33.2, east=126.9, west=126.1)  # 제주
+    assert supabase.rpc.call_count == 3
+
+    await service.update_report("r1", {"location": "POINT(129.0756 35.1796)"}, "user-123")
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await service.get_reports_in_bounds(**busan)
+    await service.get_reports_in_bounds(north=33.6, south=33.2, east=126.9, west=126.1)
+    assert supabase.rpc.call_count == 5  # 서울·부산만 다시 조회
+
+
 @pytest.mark.asyncio
 async def test_nearby_cache_hit_applies_user_voted_overlay():
     service, supabase = make_service()
@@ -420,13 +892,589 @@ async def test_bounds_cache_hit_applies_user_voted_overlay():
     assert supabase.rpc.call_count == 1
 
 
-# --- map query count RPC failures raise, same as get RPC failures (ADR-0004) ---
+# --- marker projection ---
+
+MARKER_ROW = {
+    "id": "r1", "lat": 37.5665, "lng": 126.978, "category": "OTHER", "status": "OPEN",
+    "created_at": "2026-01-01T00:00:00+00:00", "vote_count": 2, "comment_count": 1,
+}
+
 
 @pytest.mark.asyncio
-async def test_nearby_count_rpc_error_raises():
+async def test_marker_bounds_uses_marker_rpc_and_its_own_cache_entry():
     supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(data={"items": [MARKER_ROW], "total_count": 1})
+    service = ReportService(supabase, FakeSpatialReportCache())
 
-    def rpc(name, params):
+    result = await service.get_reports_in_bounds(**BOUNDS, fields="marker")
+    again = await service.get_reports_in_bounds(**BOUNDS, fields="marker", current_user_id="user-123")
+
+    assert result["items"] == [MARKER_ROW]
+    assert result["totalCount"] == 1
+    assert again == result
+    supabase.rpc.assert_called_once_with(
+        "get_report_markers_in_bounds_page",
+        {**BOUNDS, "category_filter": None, "search_query": None, "result_offset": 0, "result_limit": 100},
+    )
+    supabase.table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_marker_cursor_page_projects_keyset_rows():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(data={
+        "items": [make_report("r2", created_at="2026-01-01T00:00:00+00:00", description="long text")],
+        "total_count": 5,
+    })
+    service = ReportService(supabase, FakeSpatialReportCache())
+    cursor = encode_report_cursor({"id": "r1", "created_at": "2026-02-01T00:00:00+00:00"})
+
+    result = await service.get_reports_in_bounds(**BOUNDS, cursor=cursor, limit=1, fields="marker")
+
+    assert supabase.rpc.call_args.args[0] == "get_reports_in_bounds_after"
+    assert result["items"] == [{
+        "id": "r2", "lat": 37.5665, "lng": 126.978, "category": "OTHER", "status": "OPEN",
+        "created_at": "2026-01-01T00:00:00+00:00", "vote_count": 0, "comment_count": 0,
+    }]
+
+
+# --- proximity groups ---
+
+@pytest.mark.asyncio
+async def test_grouped_bounds_groups_page_items():
+    service, supabase = make_service()
+
+    result = await service.get_grouped_reports_in_bounds(**BOUNDS)
+
+    assert [r["id"] for r in result["items"]] == ["r1"]
+    assert result["totalCount"] == 1
+    assert result["groups"] == [{
+        "id": "proximity-r1",
+        "center": {"lat": pytest.approx(37.5665), "lng": pytest.approx(126.9780)},
+        "memberIds": ["r1"],
+    }]
+
+
+@pytest.mark.asyncio
+async def test_grouped_bounds_is_cached_and_shares_the_bounds_rpc(mocker):
+    service, supabase = make_service()
+    grouping = mocker.patch(
+        "app.services.report_service.compute_proximity_groups", return_value=[]
+    )
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await service.get_grouped_reports_in_bounds(**BOUNDS)
+    await service.get_grouped_reports_in_bounds(**BOUNDS)
+
+    assert supabase.rpc.call_count == 1
+    assert grouping.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_grouped_bounds_is_regrouped_after_invalidation():
+    service, supabase = make_service()
+
+    await service.get_grouped_reports_in_bounds(**BOUNDS)
+    service.cache.invalidate_locations([{"lat": 37.5665, "lng": 126.9780}])
+    await service.get_grouped_reports_in_bounds(**BOUNDS)
+
+    assert supabase.rpc.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_grouped_bounds_cache_hit_applies_user_voted_overlay():
+    service, supabase = make_service()
+    supabase.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = MagicMock(
+        data=[{"report_id": "r1"}]
+    )
+
+    await service.get_grouped_reports_in_bounds(**BOUNDS)
+    voted = await service.get_grouped_reports_in_bounds(**BOUNDS, current_user_id="user-123")
+    anonymous = await service.get_grouped_reports_in_bounds(**BOUNDS)
+
+    assert voted["items"][0]["user_voted"] is True
+    assert anonymous["items"][0]["user_voted"] is False
+    assert voted["groups"] == anonymous["groups"]
+
+
+# --- grid aggregation ---
+
+def make_grid_supabase(cells, total_count):
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={"cells": cells, "total_count": total_count}
+    )
+    return supabase
+
+
+@pytest.mark.asyncio
+async def test_grid_snaps_bounds_to_cells_and_shapes_response():
+    supabase = make_grid_supabase(
+        [{"x": 3489, "y": 1450, "count": 2, "lat": 37.55, "lng": 126.97, "categories": {"OTHER": 2}}], 2,
+    )
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    result = await service.get_report_grid_in_bounds(**BOUNDS, zoom=12)
+
+    name, params = supabase.rpc.call_args.args
+    assert name == "get_report_grid_in_bounds"
+    assert params["cell_degrees"] == pytest.approx(360 / 2 ** 12)
+    assert params["north"] >= BOUNDS["north"] and params["south"] <= BOUNDS["south"]
+    assert params["east"] >= BOUNDS["east"] and params["west"] <= BOUNDS["west"]
+    assert result["totalCount"] == 2
+    assert result["cells"] == [{
+        "x": 3489, "y": 1450, "count": 2,
+        "center": {"lat": 37.55, "lng": 126.97},
+        "categories": {"OTHER": 2},
+    }]
+
+
+@pytest.mark.asyncio
+async def test_grid_viewports_within_the_same_cells_share_a_cache_entry():
+    supabase = make_grid_supabase([], 0)
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    await service.get_report_grid_in_bounds(**BOUNDS, zoom=12)
+    await service.get_report_grid_in_bounds(**{k: v + 0.0001 for k, v in BOUNDS.items()}, zoom=12)
+
+    assert supabase.rpc.call_count == 1
+
+
+# --- delta sync ---
+
+@pytest.mark.asyncio
+async def test_changes_in_bounds_shapes_delta_and_bypasses_cache():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(data={
+        "items": [make_report("r1", change_version=42)],
+        "deleted_ids": ["r9"],
+        "version": 42,
+        "has_more": False,
+    })
+    votes = MagicMock(data=[{"report_id": "r1"}])
+    supabase.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = votes
+    cache = FakeSpatialReportCache()
+    service = ReportService(supabase, cache)
+
+    result = await service.get_report_changes_in_bounds(
+        **BOUNDS, since_version=40, limit=10, current_user_id="user-1"
+    )
+    await service.get_report_changes_in_bounds(**BOUNDS, since_version=40, limit=10)
+
+    name, params = supabase.rpc.call_args.args
+    assert name == "get_report_changes_in_bounds"
+    assert params["since_version"] == 40 and params["result_limit"] == 10
+    assert supabase.rpc.call_count == 2
+    assert result["items"][0]["location"] == {"lat": 37.5665, "lng": 126.978}
+    assert result["items"][0]["user_voted"] is True
+    assert result["deletedIds"] == ["r9"]
+    assert result["version"] == 42
+    assert result["hasMore"] is False
+    assert result["reset"] is False
+
+
+@pytest.mark.asyncio
+async def test_changes_in_bounds_passes_reset_below_the_tombstone_floor():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(data={
+        "items": [], "deleted_ids": [], "version": 900, "has_more": False, "reset": True,
+    })
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    result = await service.get_report_changes_in_bounds(**BOUNDS, since_version=3)
+
+    assert result == {"items": [], "deletedIds": [], "version": 900, "hasMore": False, "reset": True}
+
+
+# --- streaming ---
+
+def make_keyset_supabase(reports):
+    """Mock supabase whose keyset RPCs seek past (after_created_at, after_id) in (created_at, id) DESC order."""
+    ordered = sorted(reports, key=lambda r: (r["created_at"], r["id"]), reverse=True)
+    supabase = MagicMock()
+
+    def rpc(name, params):
+        after = params["after_created_at"], params["after_id"]
+        rows = [dict(r) for r in ordered if after[0] is None or (r["created_at"], r["id"]) < after]
+        call = MagicMock()
+        call.execute.return_value = MagicMock(data=rows[:params["result_limit"]])
+        return call
+
+    supabase.rpc.side_effect = rpc
+    return supabase
+
+
+@pytest.mark.asyncio
+async def test_stream_in_bounds_walks_keyset_chunks_up_to_limit(mocker):
+    mocker.patch("app.services.report_service._STREAM_CHUNK", 2)
+    reports = [make_report(f"r{i}", created_at=f"2026-10-0{i}T00:00:00+00:00") for i in range(1, 6)]
+    supabase = make_keyset_supabase(reports)
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    streamed = [item async for item in service.stream_reports_in_bounds(**BOUNDS, limit=4)]
+
+    assert [r["id"] for r in streamed] == ["r5", "r4", "r3", "r2"]
+    assert streamed[0]["location"] == {"lat": 37.5665, "lng": 126.978}
+    assert [c.args[0] for c in supabase.rpc.call_args_list] == ["get_report_rows_in_bounds_after"] * 2
+    assert [c.args[1]["result_limit"] for c in supabase.rpc.call_args_list] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_at_short_chunk_and_projects_markers(mocker):
+    mocker.patch("app.services.report_service._STREAM_CHUNK", 2)
+    reports = [make_report(f"r{i}", created_at=f"2026-10-0{i}T00:00:00+00:00") for i in range(1, 4)]
+    supabase = make_keyset_supabase(reports)
+    service = ReportService(supabase, FakeSpatialReportCache())
+
+    streamed = [item async for item in service.stream_reports_in_bounds(**BOUNDS, limit=100, fields="marker")]
+
+    assert [r["id"] for r in streamed] == ["r3", "r2", "r1"]
+    assert set(streamed[0]) == {"id", "lat", "lng", "category", "status", "created_at", "vote_count", "comment_count"}
+    assert supabase.rpc.call_count == 2
+
+
+def test_stream_rejects_invalid_cursor_before_streaming():
+    service = ReportService(MagicMock(), FakeSpatialReportCache())
+
+    with pytest.raises(HTTPException) as exc:
+        service.stream_reports(limit=10, cursor="not-a-cursor")
+
+    assert exc.value.status_code == 400
+
+
+# --- tile mode bounds query ---
+
+def make_tiled_supabase(reports, total_count=None):
+    """Mock supabase whose bounds RPC serves only the reports inside the requested envelope."""
+    supabase = MagicMock()
+
+    def rpc(name, params):
+        inside = [
+            dict(r) for r in reports
+            if params["south"] <= r["_lat"] <= params["north"]
+            and params["west"] <= r["_lng"] <= params["east"]
+        ]
+        page = inside[params["result_offset"]:params["result_offset"] + params["result_limit"]]
+        call = MagicMock()
+        call.execute.return_value = MagicMock(data={
+            "items": page,
+            "total_count": total_count if total_count is not None else len(inside),
+        })
+        return call
+
+    supabase.rpc.side_effect = rpc
+    return supabase
+
+
+def make_located_report(report_id, lat, lng, created_at):
+    return make_report(
+        report_id,
+        location=f"POINT({lng} {lat})",
+        created_at=created_at,
+        _lat=lat,
+        _lng=lng,
+    )
+
+
+GANGNAM_BOUNDS = {"north": 37.5090, "south": 37.4860, "east": 127.0390, "west": 127.0160}
+
+
+@pytest.mark.asyncio
+async def test_tile_mode_composes_tiles_and_clips_to_exact_bounds():
+    supabase = make_tiled_supabase([
+        make_located_report("older", 37.4979, 127.0276, "2026-01-01T00:00:00+00:00"),
+        make_located_report("newer", 37.5000, 127.0300, "2026-02-01T00:00:00+00:00"),
+        # Inside a covering tile but just outside the viewport.
+        make_located_report("outside", 37.5095, 127.0276, "2026-03-01T00:00:00+00:00"),
+    ])
+    service = ReportService(supabase, FakeSpatialReportCache(), bounds_tile_zoom=14)
+
+    result = await service.get_reports_in_bounds(**GANGNAM_BOUNDS)
+
+    assert [r["id"] for r in result["items"]] == ["newer", "older"]
+    assert result["totalCount"] == 2
+    assert result["totalPages"] == 1
+    for name, params in (c.args for c in supabase.rpc.call_args_list):
+        assert name == "get_reports_in_bounds_page"
+        assert params["result_offset"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tile_mode_nearby_viewports_share_cached_tiles():
+    supabase = make_tiled_supabase([
+        make_located_report("r1", 37.4979, 127.0276, "2026-01-01T00:00:00+00:00"),
+    ])
+    service = ReportService(supabase, FakeSpatialReportCache(), bounds_tile_zoom=14)
+
+    await service.get_reports_in_bounds(**GANGNAM_BOUNDS)
+    rpc_calls = supabase.rpc.call_count
+
+    nudged = {k: v + 0.0001 for k, v in GANGNAM_BOUNDS.items()}
+    result = await service.get_reports_in_bounds(**nudged)
+
+    assert supabase.rpc.call_count == rpc_calls
+    assert [r["id"] for r in result["items"]] == ["r1"]
+
+
+@pytest.mark.asyncio
+async def test_tile_mode_pages_over_composed_result():
+    supabase = make_tiled_supabase([
+        make_located_report(f"r{i}", 37.4979, 127.0276, f"2026-01-0{i}T00:00:00+00:00")
+        for i in range(1, 6)
+    ])
+    service = ReportService(supabase, FakeSpatialReportCache(), bounds_tile_zoom=14)
+
+    result = await service.get_reports_in_bounds(**GANGNAM_BOUNDS, page=2, limit=2)
+
+    assert [r["id"] for r in result["items"]] == ["r3", "r2"]
+    assert result["totalCount"] == 5
+    assert result["totalPages"] == 3
+
+
+@pytest.mark.asyncio
+async def test_tile_mode_truncated_tile_falls_back_to_viewport_rpc():
+    supabase = make_tiled_supabase(
+        [make_located_report("r1", 37.4979, 127.0276, "2026-01-01T00:00:00+00:00")],
+        total_count=10_000,
+    )
+    service = ReportService(supabase, FakeSpatialReportCache(), bounds_tile_zoom=14)
+
+    await service.get_reports_in_bounds(**GANGNAM_BOUNDS, page=3, limit=10)
+
+    supabase.rpc.assert_called_with(
+        "get_reports_in_bounds_page",
+        {
+            **GANGNAM_BOUNDS,
+            "category_filter": None,
+            "search_query": None,
+            "result_offset": 20,
+            "result_limit": 10,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_tile_mode_wide_viewport_uses_single_viewport_rpc():
+    supabase = make_tiled_supabase([])
+    service = ReportService(supabase, FakeSpatialReportCache(), bounds_tile_zoom=14)
+
+    await service.get_reports_in_bounds(north=37.7, south=37.4, east=127.2, west=126.8)
+
+    assert supabase.rpc.call_count == 1
+
+
+# --- in-process spatial index ---
+
+def make_indexed_service(rows, tombstones=None, index=None, floor=None):
+    """Indexed service whose reports / report_tombstones / report_tombstone_floor reads come from in-memory lists."""
+    supabase = make_spatial_supabase()
+    tables = {
+        "reports": rows,
+        "report_tombstones": tombstones if tombstones is not None else [],
+        "report_tombstone_floor": floor if floor is not None else [{"version": 0}],
+    }
+    supabase.table.side_effect = lambda name: (
+        FakeTableReads(tables[name], supabase.table.return_value) if name in tables else DEFAULT
+    )
+    service = ReportService(supabase, FakeSpatialReportCache(), spatial_index=index if index is not None else ReportSpatialIndex())
+    return service, supabase
+
+
+INDEXED_ROWS = [
+    make_report("old", location="POINT(126.9780 37.5665)", created_at="2026-01-01T00:00:00+00:00",
+                vote_count=4, comment_count=1, change_version=1),
+    make_report("new", location="POINT(126.9790 37.5670)", created_at="2026-02-01T00:00:00+00:00",
+                vote_count=0, comment_count=0, change_version=2),
+]
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_serves_bounds_without_rpc():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    result = await service.get_reports_in_bounds(**BOUNDS)
+    again = await service.get_reports_in_bounds(**BOUNDS)
+
+    assert [r["id"] for r in result["items"]] == ["new", "old"]
+    assert result["items"][1]["vote_count"] == 4
+    assert result["totalCount"] == 2
+    assert again == result
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_serves_grouped_bounds_without_rpc():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    result = await service.get_grouped_reports_in_bounds(**BOUNDS)
+
+    # "new" and "old" are ~100m apart.
+    assert [g["memberIds"] for g in result["groups"]] == [["new"], ["old"]]
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_serves_grid_without_rpc():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    result = await service.get_report_grid_in_bounds(**BOUNDS, zoom=10)
+
+    assert result["totalCount"] == 2
+    assert [c["count"] for c in result["cells"]] == [2]
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_serves_marker_bounds_without_rpc():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    result = await service.get_reports_in_bounds(**BOUNDS, fields="marker")
+
+    assert [(m["id"], m["lat"], m["lng"], m["vote_count"]) for m in result["items"]] == [
+        ("new", 37.567, 126.979, 0), ("old", 37.5665, 126.978, 4),
+    ]
+    assert "description" not in result["items"][0]
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_serves_nearby_with_distance():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    result = await service.get_nearby_reports(**NEARBY, radius_km=1.0)
+
+    assert [r["id"] for r in result["items"]] == ["new", "old"]
+    assert result["items"][1]["distance_km"] == 0
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_loads_id_partitions_in_keyset_batches(mocker):
+    mocker.patch("app.services.report_service._INDEX_LOAD_BATCH", 1)
+    rows = [
+        make_report(f"{prefix}{n}", created_at=f"2026-01-0{n + 1}T00:00:00+00:00", change_version=n + 1)
+        for prefix in ("0a", "7b", "fc") for n in range(2)
+    ]
+    service, _ = make_indexed_service(rows)
+
+    result = await service.get_reports_in_bounds(**BOUNDS)
+
+    assert result["totalCount"] == 6
+    assert service.spatial_index.version == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_spatial_index_is_served_while_deltas_sync_in_background():
+    clock = FakeClock()
+    rows = [dict(r) for r in INDEXED_ROWS]
+    tombstones = []
+    index = ReportSpatialIndex(max_age_seconds=5, timer=clock)
+    service, _ = make_indexed_service(rows, tombstones, index)
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    # Another worker votes on "old", deletes "new" and creates "other".
+    rows[0] = {**rows[0], "vote_count": 9, "change_version": 3}
+    del rows[1]
+    tombstones.append({"change_version": 4, "report_id": "new"})
+    rows.append(make_report("other", location="POINT(126.9500 37.5500)",
+                            created_at="2026-03-01T00:00:00+00:00", change_version=5))
+    clock.advance(5)
+
+    stale = await service.get_reports_in_bounds(**BOUNDS, limit=10)
+    await wait_until(lambda: index.version == 5)
+    synced = await service.get_reports_in_bounds(**BOUNDS, limit=20)
+
+    assert [r["id"] for r in stale["items"]] == ["new", "old"]
+    assert [(r["id"], r["vote_count"]) for r in synced["items"]] == [("other", 0), ("old", 9)]
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_reloads_when_pruned_tombstones_pass_its_version():
+    clock = FakeClock()
+    rows = [dict(r) for r in INDEXED_ROWS]
+    floor = [{"version": 0}]
+    index = ReportSpatialIndex(max_age_seconds=5, timer=clock)
+    service, _ = make_indexed_service(rows, [], index, floor)
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    # "new" was deleted and its tombstone (version 3) already pruned: no delta can remove it.
+    del rows[1]
+    floor[0] = {"version": 3}
+    clock.advance(5)
+
+    await service.get_reports_in_bounds(**BOUNDS)
+    await wait_until(lambda: index.version == 3)
+    synced = await service.get_reports_in_bounds(**BOUNDS)
+
+    assert [r["id"] for r in synced["items"]] == ["old"]
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_search_falls_back_to_rpc():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+
+    await service.get_reports_in_bounds(**BOUNDS, search="소음")
+
+    assert supabase.rpc.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_follows_report_mutations():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+    await service.get_reports_in_bounds(**BOUNDS)
+
+    supabase.table.return_value.insert.return_value.execute.return_value.data = [
+        make_report("created", location=None, created_at="2026-03-01T00:00:00+00:00")
+    ]
+    report_in = ReportCreate(
+        title="New",
+        description="Desc",
+        location=Location(lat=37.55, lng=126.95),
+        address="Seoul",
+        category=ReportCategory.OTHER,
+        image_url=None,
+    )
+    await service.create_report(report_in, "user-123")
+
+    supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
+        "user_id": "user-123"
+    }
+    supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+        make_report("old", location="POINT(126.9780 37.5665)", created_at="2026-01-01T00:00:00+00:00",
+                    status="RESOLVED")
+    ]
+    await service.update_report("old", {"status": "RESOLVED"}, "user-123")
+    await service.delete_report("new", "user-123")
+
+    result = await service.get_reports_in_bounds(**BOUNDS)
+
+    assert [r["id"] for r in result["items"]] == ["created", "old"]
+    assert result["items"][1]["status"] == "RESOLVED"
+    assert result["items"][1]["vote_count"] == 4
+    supabase.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spatial_index_cache_hit_applies_user_voted_overlay():
+    service, supabase = make_indexed_service(INDEXED_ROWS)
+    supabase.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = MagicMock(
+        data=[{"report_id": "old"}]
+    )
+
+    voted = await service.get_reports_in_bounds(**BOUNDS, current_user_id="user-123")
+    anonymous = await service.get_reports_in_bounds(**BOUNDS)
+
+    assert [r["user_voted"] for r in voted["items"]] == [False, True]
+    assert [r["user_voted"] for r in anonymous["items"]] == [False, False]
+
+
+# --- map query count RPC failures raise, same as get RPC failures (ADR-0004) ---
+
+@pytest.mark.asyncio
+async def test_nearby_count_rpc_error_raises():
+    supabase = MagicMock()
+
+    def rpc(name, params):
         call = MagicMock()
         if name.startswith("count_"):
             call.execute.side_effect = Exception("boom")
@@ -473,11 +1521,9 @@ async def test_get_report_by_id_not_found():
 
 
 @pytest.mark.asyncio
-async def test_get_report_by_id_flattens_list_counts_and_applies_user_voted():
+async def test_get_report_by_id_reads_counter_columns_and_applies_user_voted():
     service, supabase = make_service()
-    report = make_report()
-    report["votes"] = [{"count": 3}]
-    report["comments"] = [{"count": 2}]
+    report = make_report(vote_count=3, comment_count=2)
     supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [report]
     supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
         {"id": "vote-1"}
@@ -488,20 +1534,7 @@ async def test_get_report_by_id_flattens_list_counts_and_applies_user_voted():
     assert result["vote_count"] == 3
     assert result["comment_count"] == 2
     assert result["user_voted"] is True
-
-
-@pytest.mark.asyncio
-async def test_get_report_by_id_flattens_dict_counts():
-    service, supabase = make_service()
-    report = make_report()
-    report["votes"] = {"count": 7}
-    report["comments"] = {"count": 4}
-    supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [report]
-
-    result = await service.get_report_by_id("r1")
-
-    assert result["vote_count"] == 7
-    assert result["comment_count"] == 4
+    supabase.table.return_value.select.assert_any_call("*")
 
 
 # --- update_report error branches ---
@@ -586,3 +1619,21 @@ async def test_benchmark_nearby_rest_python_filters_by_radius_and_category():
     assert [r["id"] for r in result] == ["near"]
     assert result[0]["user_voted"] is False
     supabase.table.return_value.select.return_value.eq.assert_called_with("category", "OTHER")
+
+
+@pytest.mark.asyncio
+async def test_benchmark_nearby_rest_python_returns_nearest_limit_sorted_by_distance():
+    service, supabase = make_service()
+    rows = [
+        make_report("1km", location="POINT(126.9780 37.5755)"),
+        make_report("0km", location="POINT(126.9780 37.5665)"),
+        make_report("2km", location="POINT(126.9780 37.5845)"),
+        make_report("busan", location="POINT(129.0756 35.1796)"),
+    ]
+    supabase.table.return_value.select.return_value.limit.return_value.execute.return_value.data = rows
+
+    result = await service.benchmark_nearby_rest_python(37.5665, 126.9780, radius_km=3.0, limit=2, scan_limit=100_000)
+
+    assert [r["id"] for r in result] == ["0km", "1km"]
+    assert result[1]["distance_km"] == 1.0
+    supabase.table.return_value.select.return_value.limit.assert_called_with(100_000)
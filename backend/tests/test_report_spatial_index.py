@@ -0,0 +1,190 @@
+import pytest
+
+from app.services.report_spatial_index import ReportSpatialIndex
+from tests.fakes import FakeClock
+
+
+def make_row(report_id, lat, lng, created_at, category="OTHER", **extra):
+    return {
+        "id": report_id,
+        "location": {"lat": lat, "lng": lng},
+        "created_at": created_at,
+        "category": category,
+        "vote_count": 0,
+        "comment_count": 0,
+        **extra,
+    }
+
+
+GANGNAM = make_row("gangnam", 37.4979, 127.0276, "2026-01-02T00:00:00+00:00")
+CITY_HALL = make_row("city-hall", 37.5665, 126.9780, "2026-01-03T00:00:00+00:00", category="NOISE")
+BUSAN = make_row("busan", 35.1796, 129.0756, "2026-01-01T00:00:00+00:00")
+
+SEOUL_BOUNDS = {"north": 37.7, "south": 37.4, "east": 127.2, "west": 126.8}
+
+
+@pytest.fixture
+def index():
+    index = ReportSpatialIndex()
+    index.load([GANGNAM, CITY_HALL, BUSAN])
+    return index
+
+
+def test_bounds_returns_reports_inside_newest_first(index):
+    items, total = index.query_bounds(**SEOUL_BOUNDS, category=None, offset=0, limit=10)
+
+    assert [r["id"] for r in items] == ["city-hall", "gangnam"]
+    assert total == 2
+
+
+def test_bounds_filters_category(index):
+    items, total = index.query_bounds(**SEOUL_BOUNDS, category="NOISE", offset=0, limit=10)
+
+    assert [r["id"] for r in items] == ["city-hall"]
+    assert total == 1
+
+
+def test_bounds_pages_with_offset_and_limit(index):
+    items, total = index.query_bounds(**SEOUL_BOUNDS, category=None, offset=1, limit=1)
+
+    assert [r["id"] for r in items] == ["gangnam"]
+    assert total == 2
+
+
+def test_bounds_edges_are_inclusive(index):
+    items, _ = index.query_bounds(
+        north=37.4979, south=37.4979, east=127.0276, west=127.0276,
+        category=None, offset=0, limit=10,
+    )
+
+    assert [r["id"] for r in items] == ["gangnam"]
+
+
+def test_aggregate_bounds_counts_cells_with_centroid_and_categories(index):
+    index.upsert(make_row("gangnam-2", 37.4981, 127.0280, "2026-01-04T00:00:00+00:00", category="TRASH"))
+
+    cells, total = index.aggregate_bounds(**SEOUL_BOUNDS, category=None, cell_degrees=0.1)
+
+    assert total == 3
+    assert [(c["x"], c["y"], c["count"]) for c in cells] == [(3070, 1274, 2), (3069, 1275, 1)]
+    assert cells[0]["lat"] == pytest.approx((37.4979 + 37.4981) / 2)
+    assert cells[0]["lng"] == pytest.approx((127.0276 + 127.0280) / 2)
+    assert cells[0]["categories"] == {"OTHER": 1, "TRASH": 1}
+    assert cells[1]["categories"] == {"NOISE": 1}
+
+
+def test_aggregate_bounds_filters_category(index):
+    cells, total = index.aggregate_bounds(**SEOUL_BOUNDS, category="NOISE", cell_degrees=0.1)
+
+    assert total == 1
+    assert [c["categories"] for c in cells] == [{"NOISE": 1}]
+
+
+def test_radius_attaches_distance_without_mutating_stored_rows(index):
+    items, total = index.query_radius(
+        lat=37.5665, lng=126.9780, radius_meters=3000, category=None, offset=0, limit=10,
+    )
+
+    assert [r["id"] for r in items] == ["city-hall"]
+    assert total == 1
+    assert items[0]["distance_meters"] == pytest.approx(0)
+    assert "distance_meters" not in CITY_HALL
+
+
+def test_radius_excludes_points_in_bbox_corner(index):
+    # Gangnam is ~8.8km away; a 8km radius box contains it but the circle does not.
+    items, _ = index.query_radius(
+        lat=37.5665, lng=126.9780, radius_meters=8000, category=None, offset=0, limit=10,
+    )
+
+    assert "gangnam" not in [r["id"] for r in items]
+
+
+def test_upsert_moves_report_between_cells(index):
+    index.upsert(make_row("busan", 37.5, 127.0, "2026-01-01T00:00:00+00:00"))
+
+    items, total = index.query_bounds(**SEOUL_BOUNDS, category=None, offset=0, limit=10)
+
+    assert [r["id"] for r in items] == ["city-hall", "gangnam", "busan"]
+    assert len(index) == 3
+
+
+def test_upsert_keep_counters_preserves_indexed_counts(index):
+    index.upsert({**CITY_HALL, "vote_count": 7})
+    index.upsert({**CITY_HALL, "status": "RESOLVED", "vote_count": 0}, keep_counters=True)
+
+    items, _ = index.query_bounds(**SEOUL_BOUNDS, category="NOISE", offset=0, limit=10)
+
+    assert items[0]["status"] == "RESOLVED"
+    assert items[0]["vote_count"] == 7
+
+
+def test_remove_drops_report_and_reuses_slot(index):
+    index.remove("gangnam")
+    index.remove("missing")
+    index.upsert(make_row("new", 37.5, 127.0, "2026-01-04T00:00:00+00:00"))
+
+    items, total = index.query_bounds(**SEOUL_BOUNDS, category=None, offset=0, limit=10)
+
+    assert [r["id"] for r in items] == ["new", "city-hall"]
+    assert len(index) == 3
+
+
+def test_wide_bounds_scan_only_occupied_cells(index):
+    items, total = index.query_bounds(
+        north=89.0, south=-89.0, east=179.0, west=-179.0, category=None, offset=0, limit=10,
+    )
+
+    assert total == 3
+
+
+def test_is_stale_until_loaded_and_after_max_age():
+    clock = FakeClock()
+    index = ReportSpatialIndex(max_age_seconds=60, timer=clock)
+    assert index.is_stale()
+
+    index.load([])
+    assert not index.is_stale()
+
+    clock.now = 60
+    assert index.is_stale()
+
+
+def test_same_created_at_breaks_ties_by_id_descending():
+    index = ReportSpatialIndex()
+    index.load([
+        make_row("a", 37.5, 127.0, "2026-01-01T00:00:00+00:00"),
+        make_row("c", 37.5, 127.0, "2026-01-01T00:00:00+00:00"),
+        make_row("b", 37.5, 127.0, "2026-01-01T00:00:00+00:00"),
+    ])
+
+    items, _ = index.query_bounds(**SEOUL_BOUNDS, category=None, offset=0, limit=10)
+
+    assert [r["id"] for r in items] == ["c", "b", "a"]
+
+
+def test_install_swaps_prepared_contents_into_the_shared_object(index):
+    fresh = index.prepare([GANGNAM])
+
+    assert len(index) == 3
+    index.install(fresh, version=12)
+
+    assert len(index) == 1
+    assert index.version == 12
+    assert not index.is_stale()
+
+
+def test_deltas_apply_in_version_order(index):
+    moved = {**GANGNAM, "location": {"lat": 35.18, "lng": 129.08}, "change_version": 7}
+
+    index.apply_changes(
+        [moved],
+        [{"change_version": 6, "report_id": "gangnam"}, {"change_version": 8, "report_id": "busan"}],
+    )
+
+    items, total = index.query_bounds(
+        north=35.2, south=35.1, east=129.1, west=129.0, category=None, offset=0, limit=10,
+    )
+    assert [item["id"] for item in items] == ["gangnam"]
+    assert len(index) == 2
+    assert index.version == 7
@@ -3,6 +3,8 @@
 캐시 히트/무효화/user_voted 오버레이 시나리오는 전부 서비스 interface
 단위 테스트(test_report_service.py)에 있다. 여기에 다시 쓰지 않는다.
 """
+import msgpack
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock
@@ -58,6 +60,10 @@ def test_admin_default_shares_map_cache_with_report_default():
     assert admin_report_service._cache is report_service.cache
 
 
+def test_admin_default_shares_spatial_index_with_report_default():
+    assert admin_report_service._spatial_index is report_service.spatial_index
+
+
 def test_get_nearby_reports_smoke(mock_supabase):
     report_data = create_mock_report()
     report_data["distance_meters"] = 100
@@ -88,3 +94,212 @@ def test_get_bounds_reports_smoke(mock_supabase):
     assert body["items"][0]["id"] == report_data["id"]
     assert body["totalCount"] == 1
     assert mock_supabase.rpc.call_count == 1
+
+
+def test_get_grouped_bounds_reports_smoke(mock_supabase):
+    report_data = create_mock_report()
+    mock_rpc_call = MagicMock()
+    mock_rpc_call.execute.return_value = MagicMock(
+        data={"items": [report_data], "total_count": 1}
+    )
+    mock_supabase.rpc.return_value = mock_rpc_call
+
+    response = client.get("/api/v1/reports/bounds/groups?north=37.6&south=37.5&east=127.0&west=126.9")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["items"][0]["id"] == report_data["id"]
+    assert body["groups"] == [{
+        "id": f"proximity-{report_data['id']}",
+        "center": {"lat": body["items"][0]["location"]["lat"], "lng": body["items"][0]["location"]["lng"]},
+        "memberIds": [report_data["id"]],
+    }]
+
+
+def test_get_bounds_grid_smoke(mock_supabase):
+    mock_rpc_call = MagicMock()
+    mock_rpc_call.execute.return_value = MagicMock(data={
+        "cells": [{"x": 3489, "y": 1450, "count": 2, "lat": 37.55, "lng": 126.97, "categories": {"OTHER": 2}}],
+        "total_count": 2,
+    })
+    mock_supabase.rpc.return_value = mock_rpc_call
+
+    response = client.get("/api/v1/reports/bounds/grid?north=37.6&south=37.5&east=127.0&west=126.9&zoom=12")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["totalCount"] == 2
+    assert body["cells"][0]["center"] == {"lat": 37.55, "lng": 126.97}
+    assert mock_supabase.rpc.call_args.args[0] == "get_report_grid_in_bounds"
+
+
+def test_get_bounds_marker_fields_smoke(mock_supabase):
+    report_data = create_mock_report()
+    marker = {
+        "id": report_data["id"], "lat": 37.5665, "lng": 126.978,
+        "category": "OTHER", "status": "OPEN", "created_at": report_data["created_at"],
+        "vote_count": 0, "comment_count": 0,
+    }
+    mock_rpc_call = MagicMock()
+    mock_rpc_call.execute.return_value = MagicMock(data={"items": [marker], "total_count": 1})
+    mock_supabase.rpc.return_value = mock_rpc_call
+
+    response = client.get("/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9&fields=marker")
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert set(item) == {"id", "lat", "lng", "category", "status", "created_at", "vote_count", "comment_count"}
+    assert mock_supabase.rpc.call_args.args[0] == "get_report_markers_in_bounds_page"
+
+
+def test_bounds_route_encodes_msgpack_when_accepted(mock_supabase):
+    report_data = create_mock_report()
+    mock_rpc_call = MagicMock()
+    mock_rpc_call.execute.return_value = MagicMock(data={"items": [report_data], "total_count": 1})
+    mock_supabase.rpc.return_value = mock_rpc_call
+
+    response = client.get(
+        "/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9",
+        headers={"Accept": "application/msgpack"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content)["items"][0]["id"] == report_data["id"]
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_bounds_cache_hit_is_served_from_encoded_body(monkeypatch, strict):
+    monkeypatch.setattr(reports_routes.settings, "STRICT_RESPONSE_VALIDATION", strict)
+    supabase = MagicMock()
+    monkeypatch.setattr(
+        reports_routes, "report_service",
+        ReportService(supabase, FakeSpatialReportCache(), cache_response_bodies=True)
+    )
+    # PostgREST가 주는 그대로의 시각 문자열 — 히트와 miss가 같은 바이트로 인코딩해야 ETag도 같다.
+    report_data = {**create_mock_report(), "created_at": "2026-10-16T09:00:00.1234+00:00"}
+    supabase.rpc.return_value.execute.return_value = MagicMock(data={"items": [report_data], "total_count": 1})
+    url = "/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9"
+
+    first = client.get(url)
+    second = client.get(url)
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+    assert supabase.rpc.call_count == 1
+
+
+def test_anonymous_bounds_revalidates_with_etag(mock_supabase, monkeypatch):
+    monkeypatch.setattr(reports_routes.settings, "MAP_HTTP_CACHE_MAX_AGE", 15)
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={"items": [create_mock_report()], "total_count": 1}
+    )
+    url = "/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9"
+
+    first = client.get(url)
+    second = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.headers["cache-control"] == "public, max-age=15"
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert mock_supabase.rpc.call_count == 1
+
+
+def test_bounds_revalidation_after_max_age_is_304_while_content_is_unchanged(mock_supabase, monkeypatch):
+    monkeypatch.setattr(reports_routes.settings, "MAP_HTTP_CACHE_MAX_AGE", 15)
+    report = create_mock_report()
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(data={"items": [report], "total_count": 1})
+    url = "/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9"
+
+    first = client.get(url)
+    # max-age가 지나 서버 캐시도 비었거나 다른 워커가 받았다 — 다시 조회해도 내용이 같으면 304다.
+    monkeypatch.setattr(reports_routes, "report_service", ReportService(mock_supabase, FakeSpatialReportCache()))
+    unchanged = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    monkeypatch.setattr(reports_routes, "report_service", ReportService(mock_supabase, FakeSpatialReportCache()))
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(
+        data={"items": [{**report, "vote_count": 1}], "total_count": 1}
+    )
+    changed = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert unchanged.status_code == 304
+    assert mock_supabase.rpc.call_count == 3
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+
+
+def test_logged_in_bounds_has_no_validator(mock_supabase, monkeypatch):
+    monkeypatch.setattr(reports_routes.settings, "MAP_HTTP_CACHE_MAX_AGE", 15)
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(data={"items": [], "total_count": 0})
+    mock_supabase.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = (
+        MagicMock(data=[])
+    )
+
+    response = client.get(
+        f"/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9&current_user_id={uuid4()}"
+    )
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_bounds_redirects_to_canonical_url(mock_supabase, monkeypatch):
+    monkeypatch.setattr(reports_routes.settings, "MAP_CANONICAL_BOUNDS_ZOOM", 12)
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(data={"items": [], "total_count": 0})
+
+    response = client.get(
+        "/api/v1/reports/bounds?north=37.509&south=37.486&east=127.039&west=127.016&category=TRASH",
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 307
+    assert "category=TRASH" in response.headers["location"]
+    assert client.get(response.headers["location"], follow_redirects=False).status_code == 200
+
+
+def test_get_bounds_changes_smoke(mock_supabase):
+    report_data = create_mock_report()
+    deleted_id = str(uuid4())
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(data={
+        "items": [{**report_data, "change_version": 7}],
+        "deleted_ids": [deleted_id],
+        "version": 7,
+        "has_more": False,
+    })
+
+    response = client.get(
+        "/api/v1/reports/bounds/changes?north=37.6&south=37.5&east=127.0&west=126.9&since_version=3"
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"][0]["change_version"] == 7
+    assert data["deletedIds"] == [deleted_id]
+    assert data["version"] == 7
+
+
+def test_get_reports_streams_ndjson_when_accepted(mock_supabase):
+    report_data = create_mock_report()
+    mock_supabase.rpc.return_value.execute.return_value = MagicMock(data=[report_data])
+
+    response = client.get("/api/v1/reports/?limit=5000", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert orjson.loads(lines[0])["id"] == report_data["id"]
+    assert mock_supabase.rpc.call_args.args[0] == "get_reports_paginated_after"
+
+
+def test_bounds_route_sheds_load_with_503_and_retry_after(mock_supabase, monkeypatch):
+    from app.utils import blocking_db
+
+    monkeypatch.setattr(blocking_db, "db_executor", blocking_db.DbExecutor(1, 0, retry_after_seconds=2))
+    blocking_db.db_executor._admit()  # 유일한 자리를 차지해 둔다
+
+    response = client.get("/api/v1/reports/bounds?north=37.6&south=37.5&east=127.0&west=126.9")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    mock_supabase.rpc.return_value.execute.assert_not_called()
@@ -0,0 +1,99 @@
+"""NegotiatedRoute/NegotiatedResponse — Accept 협상과 인코딩만 확인한다."""
+import msgpack
+import orjson
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.api.responses import NegotiatedResponse, NegotiatedRoute, prefers_msgpack
+
+
+class Item(BaseModel):
+    id: str
+    count: int
+
+
+router = APIRouter(route_class=NegotiatedRoute, default_response_class=NegotiatedResponse)
+
+
+@router.get("/items", response_model=list[Item])
+async def list_items():
+    return [{"id": "a", "count": 1, "dropped": True}]
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("", False),
+    ("application/json", False),
+    ("application/msgpack", True),
+    ("application/x-msgpack", True),
+    ("application/json, application/msgpack", True),
+    ("application/msgpack;q=0.5, application/json", False),
+    ("application/msgpack;q=0", False),
+    ("*/*", False),
+])
+def test_prefers_msgpack(accept, expected):
+    assert prefers_msgpack(accept) is expected
+
+
+def test_json_by_default_after_response_model_filtering():
+    response = client.get("/items")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+    assert orjson.loads(response.content) == [{"id": "a", "count": 1}]
+
+
+def test_msgpack_when_accepted():
+    response = client.get("/items", headers={"Accept": "application/msgpack"})
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == [{"id": "a", "count": 1}]
+
+
+def _page(items):
+    return {"items": items, "totalCount": len(items), "totalPages": 1, "page": 1, "limit": 20}
+
+
+def test_trusted_page_projects_model_fields(monkeypatch):
+    from app.api.responses import trusted_page_response
+    from app.core.config import settings
+    from app.schemas.report import ReportMarker
+
+    monkeypatch.setattr(settings, "STRICT_RESPONSE_VALIDATION", False)
+    row = {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "lat": 37.5,
+        "lng": 127.0,
+        "category": "NOISE",
+        "status": "OPEN",
+        "created_at": "2026-10-16T00:00:00+00:00",
+        "distance_meters": 12.5,
+    }
+
+    body = orjson.loads(trusted_page_response(_page([row]), ReportMarker).body)
+
+    item = body["items"][0]
+    assert "distance_meters" not in item
+    assert item["created_at"] == row["created_at"]
+    assert set(item) == set(ReportMarker.model_fields)
+    assert item["vote_count"] == 0
+    assert body["nextCursor"] is None
+
+
+def test_trusted_page_validates_in_strict_mode(monkeypatch):
+    from pydantic import ValidationError
+
+    from app.api.responses import trusted_page_response
+    from app.core.config import settings
+    from app.schemas.report import ReportMarker
+
+    monkeypatch.setattr(settings, "STRICT_RESPONSE_VALIDATION", True)
+
+    with pytest.raises(ValidationError):
+        trusted_page_response(_page([{"id": "not-a-report"}]), ReportMarker)
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_same_key_shares_one_load():
+    flights = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    results = await asyncio.gather(*(flights.do("k", load) for _ in range(4)))
+
+    assert results == [1, 1, 1, 1]
+    assert not flights.in_flight("k")
+
+
+@pytest.mark.asyncio
+async def test_different_keys_load_separately():
+    flights = SingleFlight()
+
+    async def load(value):
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(flights.do("a", lambda: load(1)), flights.do("b", lambda: load(2)))
+
+    assert results == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_load():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("k", load))
+    second = asyncio.ensure_future(flights.do("k", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
@@ -2,21 +2,15 @@
 
 Only the public interface is exercised — no cache keys, no internal storage.
 """
-import pytest
-
-from app.services.spatial_report_cache import SpatialReportCache
-from tests.fakes import FakeSpatialReportCache
-
+import sqlite3
+import time
 
-class FakeClock:
-    def __init__(self) -> None:
-        self.now = 0.0
-
-    def __call__(self) -> float:
-        return self.now
+import pytest
 
-    def advance(self, seconds: float) -> None:
-        self.now += seconds
+from app.services.bounds_tiles import Tile
+from app.services.map_cache_backends import SqliteMapCacheBackend
+from app.services.spatial_report_cache import SpatialReportCache, StaleEntry
+from tests.fakes import FakeClock, FakeSpatialReportCache
 
 
 NEARBY_PARAMS = {
@@ -40,17 +34,48 @@ BOUNDS_PARAMS = {
     "limit": 100,
 }
 
+GRID_PARAMS = {
+    "north": 37.6,
+    "south": 37.5,
+    "east": 127.0,
+    "west": 126.9,
+    "zoom": 12,
+    "category": None,
+    "search": None,
+}
+
+TILE_PARAMS = {
+    "tile": Tile(14, 13971, 6803),
+    "category": None,
+    "search": None,
+}
+
 VALUE = {"items": [{"id": "r1"}], "totalCount": 1, "totalPages": 1, "page": 1, "limit": 50}
 OTHER_VALUE = {"items": [], "totalCount": 0, "totalPages": 0, "page": 1, "limit": 50}
 
 
-@pytest.fixture(params=["real", "fake"])
-def cache(request):
+def sqlite_backend(tmp_path):
+    return SqliteMapCacheBackend(str(tmp_path / "map-cache.sqlite3"), maxsize=100)
+
+
+@pytest.fixture(params=["real", "sqlite", "fake"])
+def cache(request, tmp_path):
     if request.param == "real":
         return SpatialReportCache()
+    if request.param == "sqlite":
+        return SpatialReportCache(backend=sqlite_backend(tmp_path))
     return FakeSpatialReportCache()
 
 
+@pytest.fixture(params=["memory", "sqlite"])
+def make_real_cache(request, tmp_path):
+    """Real adapter on either backend — for timer-driven behaviour the fake does not have."""
+    def make(clock, **windows):
+        backend = sqlite_backend(tmp_path) if request.param == "sqlite" else None
+        return SpatialReportCache(timer=clock, backend=backend, **windows)
+    return make
+
+
 class TestPutGetRoundtrip:
     def test_nearby_returns_stored_value(self, cache):
         cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
@@ -66,6 +91,62 @@ class TestPutGetRoundtrip:
     def test_bounds_miss_before_put(self, cache):
         assert cache.get_bounds(**BOUNDS_PARAMS) is None
 
+    def test_bodies_are_separate_from_pages(self, cache):
+        body = {"body": "{}", "ids": []}
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        assert cache.get_nearby_body(**NEARBY_PARAMS) is None
+        assert cache.get_bounds_body(**BOUNDS_PARAMS) is None
+
+        cache.put_nearby_body(**NEARBY_PARAMS, value=body)
+        cache.put_bounds_body(**BOUNDS_PARAMS, value=body)
+        assert cache.get_nearby_body(**NEARBY_PARAMS) == body
+        assert cache.get_bounds_body(**BOUNDS_PARAMS) == body
+
+    def test_bounds_markers_are_separate_from_bounds(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        assert cache.get_bounds_markers(**BOUNDS_PARAMS) is None
+
+        cache.put_bounds_markers(**BOUNDS_PARAMS, value=OTHER_VALUE)
+        assert cache.get_bounds_markers(**BOUNDS_PARAMS) == OTHER_VALUE
+        assert cache.get_bounds(**BOUNDS_PARAMS) == VALUE
+
+    def test_bounds_groups_are_separate_from_bounds(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        assert cache.get_bounds_groups(**BOUNDS_PARAMS) is None
+
+        cache.put_bounds_groups(**BOUNDS_PARAMS, value=OTHER_VALUE)
+        assert cache.get_bounds_groups(**BOUNDS_PARAMS) == OTHER_VALUE
+        assert cache.get_bounds(**BOUNDS_PARAMS) == VALUE
+
+    def test_bounds_grid_returns_stored_value(self, cache):
+        cache.put_bounds_grid(**GRID_PARAMS, value=VALUE)
+        assert cache.get_bounds_grid(**GRID_PARAMS) == VALUE
+        assert cache.get_bounds_grid(**{**GRID_PARAMS, "zoom": 13}) is None
+
+    def test_bounds_tile_returns_stored_value(self, cache):
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+        assert cache.get_bounds_tile(**TILE_PARAMS) == VALUE
+
+    def test_bounds_tile_miss_before_put(self, cache):
+        assert cache.get_bounds_tile(**TILE_PARAMS) is None
+
+    def test_fresh_entry_is_not_stale(self, cache):
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+
+        assert cache.get_stale_nearby(**NEARBY_PARAMS) is None
+        assert cache.get_stale_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_stale_bounds_tile(**TILE_PARAMS) is None
+
+    def test_generation_advances_on_invalidate(self, cache):
+        before = cache.generation
+
+        cache.invalidate_all()
+
+        assert cache.generation == before + 1
+
     def test_put_overwrites_existing_entry(self, cache):
         cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
         cache.put_nearby(**NEARBY_PARAMS, value=OTHER_VALUE)
@@ -110,6 +191,20 @@ class TestDistinctEntries:
         cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
         assert cache.get_bounds(**{**BOUNDS_PARAMS, **override}) is None
 
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"tile": Tile(14, 13972, 6803)},
+            {"tile": Tile(14, 13971, 6804)},
+            {"tile": Tile(15, 13971, 6803)},
+            {"category": "NOISE"},
+            {"search": "소음"},
+        ],
+    )
+    def test_bounds_tile_any_differing_param_is_a_miss(self, cache, override):
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+        assert cache.get_bounds_tile(**{**TILE_PARAMS, **override}) is None
+
     def test_search_none_and_empty_string_are_separate_entries(self, cache):
         cache.put_nearby(**{**NEARBY_PARAMS, "search": None}, value=VALUE)
         cache.put_nearby(**{**NEARBY_PARAMS, "search": ""}, value=OTHER_VALUE)
@@ -127,28 +222,136 @@ class TestInvalidateAll:
     def test_all_gets_miss_after_invalidate(self, cache):
         cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
         cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+
+        cache.invalidate_all()
+
+        assert cache.get_nearby(**NEARBY_PARAMS) is None
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_bounds_tile(**TILE_PARAMS) is None
+
+    def test_generation_advances_on_invalidate(self, cache):
+        before = cache.generation
 
         cache.invalidate_all()
 
+        assert cache.generation == before + 1
+
+
+class TestInvalidateLocations:
+    INSIDE = {"lat": 37.56, "lng": 126.97}
+    OUTSIDE = {"lat": 35.1, "lng": 129.0}
+
+    def test_evicts_entries_whose_area_contains_location(self, cache):
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([self.INSIDE])
+
         assert cache.get_nearby(**NEARBY_PARAMS) is None
         assert cache.get_bounds(**BOUNDS_PARAMS) is None
 
+    def test_keeps_entries_elsewhere(self, cache):
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([self.OUTSIDE])
+
+        assert cache.get_nearby(**NEARBY_PARAMS) == VALUE
+        assert cache.get_bounds(**BOUNDS_PARAMS) == VALUE
+        assert cache.get_bounds_tile(**TILE_PARAMS) == VALUE
+
+    def test_evicts_bodies_with_their_pages(self, cache):
+        body = {"body": "{}", "ids": []}
+        cache.put_nearby_body(**NEARBY_PARAMS, value=body)
+        cache.put_bounds_body(**BOUNDS_PARAMS, value=body)
+
+        cache.invalidate_locations([self.INSIDE])
+
+        assert cache.get_nearby_body(**NEARBY_PARAMS) is None
+        assert cache.get_bounds_body(**BOUNDS_PARAMS) is None
+
+    def test_evicts_bounds_groups_and_markers_with_the_bounds_entry(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_markers(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_groups(**BOUNDS_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([self.INSIDE])
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_bounds_markers(**BOUNDS_PARAMS) is None
+        assert cache.get_bounds_groups(**BOUNDS_PARAMS) is None
+
+    def test_evicts_bounds_grid_containing_location(self, cache):
+        cache.put_bounds_grid(**GRID_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([self.INSIDE])
+
+        assert cache.get_bounds_grid(**GRID_PARAMS) is None
+
+    def test_any_of_several_locations_evicts(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([self.OUTSIDE, self.INSIDE])
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+
+    def test_evicts_every_page_of_the_area(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds(**{**BOUNDS_PARAMS, "page": 2}, value=OTHER_VALUE)
+
+        cache.invalidate_locations([self.INSIDE])
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_bounds(**{**BOUNDS_PARAMS, "page": 2}) is None
+
+    def test_evicts_tile_containing_location(self, cache):
+        tile = TILE_PARAMS["tile"]
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([{"lat": (tile.north + tile.south) / 2, "lng": (tile.east + tile.west) / 2}])
+
+        assert cache.get_bounds_tile(**TILE_PARAMS) is None
+
+    def test_location_on_bounds_edge_evicts(self, cache):
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+
+        cache.invalidate_locations([{"lat": BOUNDS_PARAMS["north"], "lng": BOUNDS_PARAMS["west"]}])
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+
+    def test_wide_area_is_evicted_too(self, cache):
+        nationwide = {**BOUNDS_PARAMS, "north": 38.6, "south": 33.0, "east": 131.0, "west": 124.5}
+        cache.put_bounds(**nationwide, value=VALUE)
+
+        cache.invalidate_locations([self.OUTSIDE])
+
+        assert cache.get_bounds(**nationwide) is None
+
+    def test_generation_advances(self, cache):
+        before = cache.generation
+
+        cache.invalidate_locations([self.OUTSIDE])
+
+        assert cache.generation == before + 1
+
 
 class TestTtlExpiry:
     """TTL is a property of the real adapter only — the fake never expires."""
 
-    def test_hit_within_ttl(self):
+    def test_hit_within_ttl(self, make_real_cache):
         clock = FakeClock()
-        cache = SpatialReportCache(timer=clock)
+        cache = make_real_cache(clock)
         cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
 
         clock.advance(14)
 
         assert cache.get_nearby(**NEARBY_PARAMS) == VALUE
 
-    def test_miss_after_ttl_elapsed(self):
+    def test_miss_after_ttl_elapsed(self, make_real_cache):
         clock = FakeClock()
-        cache = SpatialReportCache(timer=clock)
+        cache = make_real_cache(clock)
         cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
         cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
 
@@ -156,3 +359,178 @@ class TestTtlExpiry:
 
         assert cache.get_nearby(**NEARBY_PARAMS) is None
         assert cache.get_bounds(**BOUNDS_PARAMS) is None
+
+
+class TestStaleWindows:
+    """Stale windows are a property of the real adapter only — the fake never expires."""
+
+    WINDOWS = {"stale_while_revalidate_seconds": 30, "stale_if_error_seconds": 60}
+
+    def test_stale_windows_off_by_default(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock)
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+
+        clock.advance(16)
+
+        assert cache.get_stale_nearby(**NEARBY_PARAMS) is None
+
+    def test_between_soft_and_hard_ttl_is_revalidate(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock, **self.WINDOWS)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        cache.put_bounds_tile(**TILE_PARAMS, value=VALUE)
+
+        clock.advance(20)
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_stale_bounds(**BOUNDS_PARAMS) == StaleEntry(VALUE, revalidate=True)
+        assert cache.get_stale_bounds_tile(**TILE_PARAMS) == StaleEntry(VALUE, revalidate=True)
+
+    def test_past_hard_ttl_is_stale_if_error_only(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock, **self.WINDOWS)
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+
+        clock.advance(50)
+
+        assert cache.get_stale_nearby(**NEARBY_PARAMS) == StaleEntry(VALUE, revalidate=False)
+
+    def test_gone_after_stale_if_error_window(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock, **self.WINDOWS)
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+
+        clock.advance(106)
+
+        assert cache.get_stale_nearby(**NEARBY_PARAMS) is None
+
+    def test_put_refreshes_stale_entry(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock, **self.WINDOWS)
+        cache.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        clock.advance(20)
+
+        cache.put_nearby(**NEARBY_PARAMS, value=OTHER_VALUE)
+
+        assert cache.get_nearby(**NEARBY_PARAMS) == OTHER_VALUE
+        assert cache.get_stale_nearby(**NEARBY_PARAMS) is None
+
+    def test_invalidate_all_drops_stale_entries(self, make_real_cache):
+        clock = FakeClock()
+        cache = make_real_cache(clock, **self.WINDOWS)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        clock.advance(20)
+
+        cache.invalidate_all()
+
+        assert cache.get_stale_bounds(**BOUNDS_PARAMS) is None
+
+
+class TestSharedSqliteBackend:
+    """Two caches on one SQLite file stand in for two workers sharing the backend."""
+
+    def make_workers(self, tmp_path):
+        path = str(tmp_path / "map-cache.sqlite3")
+        backends = (SqliteMapCacheBackend(path, maxsize=100), SqliteMapCacheBackend(path, maxsize=100))
+        return backends, tuple(SpatialReportCache(backend=backend) for backend in backends)
+
+    def test_put_in_one_worker_is_a_hit_in_another(self, tmp_path):
+        (first_backend, _), (first, second) = self.make_workers(tmp_path)
+
+        first.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        first_backend.flush()
+
+        assert second.get_bounds(**BOUNDS_PARAMS) == VALUE
+
+    def test_invalidation_in_one_worker_reaches_another(self, tmp_path):
+        (first_backend, second_backend), (first, second) = self.make_workers(tmp_path)
+        first.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        first.put_nearby(**NEARBY_PARAMS, value=VALUE)
+        first_backend.flush()
+
+        second.invalidate_locations([{"lat": 37.55, "lng": 126.95}])
+        second_backend.flush()
+
+        assert first.get_bounds(**BOUNDS_PARAMS) is None
+        assert first.generation == second.generation
+
+    def test_sweep_keeps_table_within_maxsize(self, tmp_path):
+        backend = SqliteMapCacheBackend(str(tmp_path / "c.sqlite3"), maxsize=10)
+        cache = SpatialReportCache(backend=backend)
+
+        for page in range(1, 201):
+            cache.put_bounds(**{**BOUNDS_PARAMS, "page": page}, value=VALUE)
+        backend.flush()
+
+        assert cache.get_bounds(**{**BOUNDS_PARAMS, "page": 200}) == VALUE
+        assert cache.get_bounds(**{**BOUNDS_PARAMS, "page": 1}) is None
+
+    def test_write_contention_does_not_block_the_caller(self, tmp_path):
+        path = str(tmp_path / "map-cache.sqlite3")
+        backend = SqliteMapCacheBackend(path, maxsize=100)
+        cache = SpatialReportCache(backend=backend)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        backend.flush()
+        generation = cache.generation
+        # Another worker holds the write lock.
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        started = time.monotonic()
+        cache.invalidate_locations([{"lat": 37.55, "lng": 126.95}])
+        cache.put_nearby(**NEARBY_PARAMS, value=OTHER_VALUE)
+        elapsed = time.monotonic() - started
+
+        # Pending writes are already visible to this worker.
+        assert elapsed < 0.5
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_nearby(**NEARBY_PARAMS) == OTHER_VALUE
+        assert cache.generation == generation + 1
+
+        other.execute("COMMIT")
+        backend.flush()
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_nearby(**NEARBY_PARAMS) == OTHER_VALUE
+        assert cache.generation == generation + 1
+
+    def test_other_workers_writes_show_after_the_refresh_window(self, tmp_path):
+        path = str(tmp_path / "map-cache.sqlite3")
+        clock = FakeClock()
+        first_backend = SqliteMapCacheBackend(path, maxsize=100, timer=clock)
+        second_backend = SqliteMapCacheBackend(path, maxsize=100)
+        first = SpatialReportCache(clock, backend=first_backend)
+        second = SpatialReportCache(clock, backend=second_backend)
+        first.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        first_backend.flush()
+        generation = first.generation
+        assert first.get_bounds(**BOUNDS_PARAMS) == VALUE
+
+        second.invalidate_locations([{"lat": 37.55, "lng": 126.95}])
+        second_backend.flush()
+
+        # Until the window passes the first worker answers from memory, without SQLite reads.
+        assert first.generation == generation
+        assert first.get_bounds(**BOUNDS_PARAMS) == VALUE
+        clock.advance(0.1)
+        assert first.generation == generation + 1
+        assert first.get_bounds(**BOUNDS_PARAMS) is None
+
+    def test_own_writes_show_within_the_refresh_window(self, tmp_path):
+        clock = FakeClock()
+        backend = SqliteMapCacheBackend(str(tmp_path / "map-cache.sqlite3"), maxsize=100, timer=clock)
+        cache = SpatialReportCache(clock, backend=backend)
+        cache.put_bounds(**BOUNDS_PARAMS, value=VALUE)
+        backend.flush()
+        generation = cache.generation
+        assert cache.get_bounds(**BOUNDS_PARAMS) == VALUE
+
+        cache.invalidate_locations([{"lat": 37.55, "lng": 126.95}])
+        cache.put_nearby(**NEARBY_PARAMS, value=OTHER_VALUE)
+
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.generation == generation + 1
+        backend.flush()
+        assert cache.get_bounds(**BOUNDS_PARAMS) is None
+        assert cache.get_nearby(**NEARBY_PARAMS) == OTHER_VALUE
+        assert cache.generation == generation + 1
@@ -0,0 +1,48 @@
+import struct
+
+import pytest
+
+from app.utils.wkb_parser import parse_wkb_point, parse_wkb_points
+
+
+def ewkb(lng, lat, byte_order="<"):
+    order_byte = 1 if byte_order == "<" else 0
+    return struct.pack(f"{byte_order}BIIdd", order_byte, 0x20000001, 4326, lng, lat).hex().upper()
+
+
+def test_batch_decodes_page_in_input_order():
+    hexes = [ewkb(126.978, 37.5665), ewkb(127.0276, 37.4979)]
+
+    assert parse_wkb_points(hexes) == [(126.978, 37.5665), (127.0276, 37.4979)]
+
+
+def test_batch_matches_scalar_parser():
+    hexes = [ewkb(126.9 + i / 1000, 37.5 + i / 1000) for i in range(100)]
+
+    assert parse_wkb_points(hexes) == [parse_wkb_point(h) for h in hexes]
+
+
+def test_big_endian_row_falls_back_to_scalar_path():
+    hexes = [ewkb(126.978, 37.5665), ewkb(127.0276, 37.4979, byte_order=">")]
+
+    result = parse_wkb_points(hexes)
+
+    assert result[0] == (126.978, 37.5665)
+    assert result[1] == pytest.approx((127.0276, 37.4979))
+
+
+def test_malformed_rows_are_none_without_affecting_valid_rows():
+    hexes = [
+        ewkb(126.978, 37.5665),
+        "Z" * 50,  # same length as a valid point but not hex
+        "0101000000703D0AD7A3BF5F40B0726891EDC84240",  # WKB without SRID
+        ewkb(127.0276, 37.4979),
+    ]
+
+    result = parse_wkb_points(hexes)
+
+    assert result == [(126.978, 37.5665), None, None, (127.0276, 37.4979)]
+
+
+def test_empty_page():
+    assert parse_wkb_points([]) == []